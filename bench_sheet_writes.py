@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""시트 쓰기 벤치마크 - 셀 단위 업데이트와 직사각형 범위로 묶은 업데이트의 요청 수와 지연 시간 비교.
+
+실제 시트에 쓰지 않도록 전송은 지연 모델로 대신한다. 요청 한 번의 지연은
+왕복 시간 + 범위 수 × 범위당 처리 시간 + 본문 크기 × KB당 전송 시간으로 계산하며,
+각 값은 실행 인자로 바꿀 수 있다. 두 형태의 요청을 만드는 데 드는 로컬 CPU 시간도 함께 측정한다.
+
+사용 예: python bench_sheet_writes.py --participants 50 200 1000 --weeks 12
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from typing import Dict, List, Set
+
+from src.google_sheets.dispatcher import (
+    SheetDispatchSettings,
+    SheetRequestQuota,
+    SheetWriteDispatcher,
+    build_batch_update_body
+)
+from src.google_sheets.models import SheetData, SheetIndex, SheetUpdateRequest, build_attendance_data
+
+
+def build_sheet(participants: int, weeks: int) -> SheetIndex:
+    """이름/닉네임 열 뒤에 주차 열이 이어지는 빈 출석 시트 생성."""
+    header = ["이름", "닉네임"] + [f"{week}주차" for week in range(1, weeks + 1)]
+    rows = [[f"참여자{number:04d}", ""] + [""] * weeks for number in range(1, participants + 1)]
+    return SheetIndex.from_sheet_data(SheetData(range_name="Sheet1", values=[header] + rows))
+
+
+def build_submissions(participants: int, weeks: List[int], rate: float, seed: int) -> Dict[int, Set[str]]:
+    """주차마다 참여자의 rate 비율이 제출한 것으로 가정한 제출자 목록 생성."""
+    rng = random.Random(seed)
+    return {
+        week: {f"참여자{number:04d}" for number in range(1, participants + 1) if rng.random() < rate}
+        for week in weeks
+    }
+
+
+def per_cell_requests(index: SheetIndex, submissions: Dict[int, Set[str]]) -> List[SheetUpdateRequest]:
+    """묶기 전 형태: 바뀌는 셀마다 업데이트 하나."""
+    plan = index.plan_writes(build_attendance_data(submissions))
+    return [SheetUpdateRequest(range_name=write.a1, values=[[write.value]]) for write in plan.writes]
+
+
+def request_body_bytes(chunk: List[SheetUpdateRequest]) -> int:
+    """values.batchUpdate 요청 본문 크기."""
+    return len(json.dumps(build_batch_update_body(chunk), ensure_ascii=False).encode('utf-8'))
+
+
+async def measure(updates: List[SheetUpdateRequest], args: argparse.Namespace) -> Dict[str, float]:
+    """분배기로 지연 모델에 전송하여 HTTP 요청 수, 본문 크기, 총 소요 시간 측정."""
+    # 요청 한도 대기가 결과를 가리지 않도록 한도는 넉넉하게 둠
+    settings = SheetDispatchSettings(requests_per_minute=100000, max_concurrency=args.concurrency)
+    dispatcher = SheetWriteDispatcher(settings, quota=SheetRequestQuota(settings.requests_per_minute))
+    sent_bytes = 0
+
+    async def send(chunk: List[SheetUpdateRequest]) -> int:
+        nonlocal sent_bytes
+        size = request_body_bytes(chunk)
+        sent_bytes += size
+        await asyncio.sleep((args.rtt_ms + len(chunk) * args.per_range_ms + size / 1024 * args.per_kb_ms) / 1000)
+        return sum(len(row) for update in chunk for row in update.values)
+
+    started = time.perf_counter()
+    stats = await dispatcher.dispatch(updates, send, lambda e: False)
+    elapsed = time.perf_counter() - started
+
+    return {
+        'ranges': len(updates),
+        'http_requests': len(stats.chunks),
+        'kb': sent_bytes / 1024,
+        'latency_ms': elapsed * 1000
+    }
+
+
+async def run_case(name: str, index: SheetIndex, submissions: Dict[int, Set[str]], args: argparse.Namespace) -> None:
+    """한 시나리오에서 두 형태를 측정하여 한 줄씩 출력."""
+    started = time.perf_counter()
+    per_cell = per_cell_requests(index, submissions)
+    per_cell_ms = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    coalesced = index.plan_writes(build_attendance_data(submissions)).to_requests(max_gap=args.max_gap)
+    coalesce_ms = (time.perf_counter() - started) * 1000
+
+    for label, updates, cpu_ms in (("셀 단위", per_cell, per_cell_ms), ("범위 묶음", coalesced, coalesce_ms)):
+        result = await measure(updates, args)
+        print(
+            f"{name:<24} {label:<8} 셀 {len(per_cell):>6}  범위 {result['ranges']:>6}  "
+            f"HTTP {result['http_requests']:>3}  본문 {result['kb']:>8.1f}KB  "
+            f"지연 {result['latency_ms']:>8.1f}ms  계획 {cpu_ms:>6.1f}ms"
+        )
+
+
+async def main(args: argparse.Namespace) -> None:
+    """참여자 수마다 첫 실행(전체 주차)과 증분 실행(새 주차 하나) 시나리오 측정."""
+    print(
+        f"지연 모델: 왕복 {args.rtt_ms}ms + 범위당 {args.per_range_ms}ms + KB당 {args.per_kb_ms}ms, "
+        f"동시 전송 {args.concurrency}, 제출 비율 {args.rate}"
+    )
+    for participants in args.participants:
+        index = build_sheet(participants, args.weeks)
+        all_weeks = build_submissions(participants, list(range(1, args.weeks + 1)), args.rate, args.seed)
+        await run_case(f"{participants}명 × {args.weeks}주 전체", index, all_weeks, args)
+
+        # 지난 주차까지 반영된 시트에 새 주차 하나만 추가되는 경우
+        last_week = {args.weeks: all_weeks[args.weeks]}
+        index.apply(index.plan_writes(build_attendance_data(
+            {week: submitters for week, submitters in all_weeks.items() if week != args.weeks}
+        )))
+        await run_case(f"{participants}명 새 주차", index, last_week, args)
+
+
+def parse_args() -> argparse.Namespace:
+    """실행 인자 파싱."""
+    parser = argparse.ArgumentParser(description="셀 단위와 범위 묶음 시트 업데이트 비교")
+    parser.add_argument("--participants", type=int, nargs="+", default=[50, 200, 1000])
+    parser.add_argument("--weeks", type=int, default=12)
+    parser.add_argument("--rate", type=float, default=0.7, help="주차별 제출 비율")
+    parser.add_argument("--max-gap", type=int, default=1)
+    parser.add_argument("--concurrency", type=int, default=2)
+    parser.add_argument("--rtt-ms", type=float, default=150.0)
+    parser.add_argument("--per-range-ms", type=float, default=0.5)
+    parser.add_argument("--per-kb-ms", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=7)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
@@ -4,6 +4,8 @@
 import asyncio
 from playwright.async_api import async_playwright
 
+from src.naver_crawler.session import SessionStateStore
+
 async def analyze_cafe_structure():
     """카페 페이지의 HTML 구조를 분석합니다."""
     async with async_playwright() as p:
@@ -11,15 +13,16 @@ async def analyze_cafe_structure():
         context = await browser.new_context()
         page = await context.new_page()
         
-        # 쿠키 로드 (기존 로그인 상태)
+        # 저장된 세션 상태(쿠키와 웹 스토리지) 복원 (기존 로그인 상태)
         try:
-            import json
-            with open('data/naver_cookies.json', 'r') as f:
-                cookies = json.load(f)
-            await context.add_cookies(cookies)
-            print("쿠키 로드 성공")
-        except:
-            print("쿠키 로드 실패 - 로그인 필요할 수 있음")
+            session_store = SessionStateStore()
+            if session_store.get_cookies():
+                await session_store.apply(context)
+                print("세션 상태 로드 성공")
+            else:
+                print("저장된 세션 상태 없음 - 로그인 필요할 수 있음")
+        except Exception as e:
+            print(f"세션 상태 로드 실패 - 로그인 필요할 수 있음: {e}")
         
         # 카페 페이지 이동
         cafe_url = "https://cafe.naver.com/westudyssat"
@@ -1,9 +1,28 @@
 """설정 관리 모듈 - 환경 변수 및 설정 파일 로드."""
 
+import json
 import os
-from typing import Optional
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List, Optional
 from dotenv import load_dotenv
 
+from .core.exceptions import ConfigurationError
+from .shared.utils import get_kst_now
+
+
+@dataclass
+class CrawlTarget:
+    """한 번의 실행에서 크롤링할 카페 게시판과 결과를 반영할 시트."""
+    
+    name: str
+    cafe_url: str
+    board_id: str
+    sheet_id: str
+    pages: int = 3
+    since: Optional[datetime] = None
+
 
 class Config:
     """애플리케이션 설정을 관리하는 클래스."""
@@ -34,9 +53,299 @@ class Config:
     
     @property
     def crawl_pages(self) -> int:
-        """크롤링할 페이지 수 반환."""
+        """크롤링할 최대 페이지 수 반환 (수집 기간이 있으면 그 이전 게시글에서 먼저 멈춤)."""
         return int(self._get_env_with_default("CRAWL_PAGES", "3"))
     
+    @property
+    def crawl_window_start(self) -> Optional[datetime]:
+        """수집 기간의 시작 시각 반환 (CRAWL_SINCE 날짜와 최근 CRAWL_DAYS일 중 늦은 쪽, 둘 다 없으면 None)."""
+        starts = []
+        
+        since = self._get_env_with_default("CRAWL_SINCE", "").strip()
+        if since:
+            starts.append(self._parse_window_date(since))
+        
+        days = int(self._get_env_with_default("CRAWL_DAYS", "0"))
+        if days > 0:
+            # 게시판 작성일은 KST 기준 시각(시간대 정보 없음)이므로 같은 기준으로 계산
+            today = get_kst_now().replace(tzinfo=None, hour=0, minute=0, second=0, microsecond=0)
+            starts.append(today - timedelta(days=days))
+        
+        return max(starts) if starts else None
+    
+    @property
+    def crawl_targets_path(self) -> str:
+        """여러 카페/게시판 대상을 정의한 JSON 파일 경로 반환."""
+        return self._get_env_with_default("CRAWL_TARGETS_PATH", "config/targets.json")
+    
+    @property
+    def crawl_targets_defined(self) -> bool:
+        """대상 목록 파일이 있는지 여부 반환."""
+        return Path(self.crawl_targets_path).exists()
+    
+    @property
+    def crawl_targets(self) -> List[CrawlTarget]:
+        """크롤링 대상 목록 반환 (파일이 없으면 CAFE_URL/BOARD_ID/GOOGLE_SHEET_ID 단일 대상)."""
+        if not self.crawl_targets_defined:
+            return [CrawlTarget(
+                name=self.board_id,
+                cafe_url=self.cafe_url,
+                board_id=self.board_id,
+                sheet_id=self.google_sheet_id,
+                pages=self.crawl_pages,
+                since=self.crawl_window_start
+            )]
+        
+        try:
+            with open(self.crawl_targets_path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+            
+            # 생략한 카페 URL/시트 ID/페이지 수/수집 기간은 환경 변수 값을 사용
+            default_since = self.crawl_window_start
+            targets = []
+            for entry in entries:
+                cafe_url = entry.get('cafe_url') or self.cafe_url
+                board_id = str(entry['board_id'])
+                targets.append(CrawlTarget(
+                    name=entry.get('name') or f"{cafe_url.rstrip('/').rsplit('/', 1)[-1]}/{board_id}",
+                    cafe_url=cafe_url,
+                    board_id=board_id,
+                    sheet_id=entry.get('sheet_id') or self.google_sheet_id,
+                    pages=int(entry.get('pages') or self.crawl_pages),
+                    since=self._parse_window_date(entry['since']) if entry.get('since') else default_since
+                ))
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            raise ConfigurationError(f"크롤링 대상 파일을 읽을 수 없습니다 ({self.crawl_targets_path}): {str(e)}")
+        
+        if not targets:
+            raise ConfigurationError(f"크롤링 대상이 비어 있습니다: {self.crawl_targets_path}")
+        return targets
+    
+    @property
+    def max_concurrent_targets(self) -> int:
+        """동시에 크롤링할 최대 대상 수 반환."""
+        return int(self._get_env_with_default("MAX_CONCURRENT_TARGETS", "2"))
+    
+    @property
+    def crawler_backend(self) -> str:
+        """크롤러 백엔드 반환 (playwright 또는 http)."""
+        return self._get_env_with_default("CRAWLER_BACKEND", "playwright").strip().lower()
+    
+    @property
+    def http_max_connections(self) -> int:
+        """HTTP 크롤러 연결 풀의 최대 연결 수 반환."""
+        return int(self._get_env_with_default("HTTP_MAX_CONNECTIONS", "10"))
+    
+    @property
+    def list_concurrency(self) -> int:
+        """게시판 목록 페이지를 동시에 크롤링할 페이지 수 반환."""
+        return int(self._get_env_with_default("LIST_CONCURRENCY", "3"))
+    
+    @property
+    def detail_concurrency(self) -> int:
+        """게시글 상세 내용을 동시에 수집할 페이지 수 반환."""
+        return int(self._get_env_with_default("DETAIL_CONCURRENCY", "3"))
+    
+    @property
+    def incremental_crawl(self) -> bool:
+        """이미 처리한 게시글 이후만 크롤링하는 증분 모드 사용 여부 반환."""
+        return self._get_bool_env_with_default("INCREMENTAL_CRAWL", True)
+    
+    @property
+    def crawl_state_path(self) -> str:
+        """게시판별 크롤링 상태 파일 경로 반환."""
+        return self._get_env_with_default("CRAWL_STATE_PATH", "data/crawl_state.json")
+    
+    @property
+    def crawl_checkpoint(self) -> bool:
+        """실행 중 진행 상황을 기록하고 실패 후 이어서 크롤링할지 여부 반환."""
+        return self._get_bool_env_with_default("CRAWL_CHECKPOINT", True)
+    
+    @property
+    def crawl_checkpoint_dir(self) -> str:
+        """크롤링 체크포인트 디렉터리 반환."""
+        return self._get_env_with_default("CRAWL_CHECKPOINT_DIR", "data/checkpoints")
+    
+    @property
+    def crawl_checkpoint_max_age_hours(self) -> float:
+        """체크포인트를 이어받을 수 있는 최대 경과 시간(시간) 반환."""
+        return float(self._get_env_with_default("CRAWL_CHECKPOINT_MAX_AGE_HOURS", "12"))
+    
+    @property
+    def checkpoint_retry_minutes(self) -> float:
+        """체크포인트가 남은 채로 실패했을 때 스케줄 모드에서 다시 시도하기까지의 대기 시간(분) 반환."""
+        return float(self._get_env_with_default("CHECKPOINT_RETRY_MINUTES", "60"))
+    
+    @property
+    def checkpoint_max_retries(self) -> int:
+        """체크포인트에서 이어서 다시 시도하는 최대 횟수 반환 (정해진 실행 한 번당)."""
+        return int(self._get_env_with_default("CHECKPOINT_MAX_RETRIES", "3"))
+    
+    @property
+    def board_wait_timeout_ms(self) -> int:
+        """게시판 목록이 나타나기를 기다리는 최대 시간(ms) 반환."""
+        return int(self._get_env_with_default("BOARD_WAIT_TIMEOUT_MS", "10000"))
+    
+    @property
+    def detail_wait_timeout_ms(self) -> int:
+        """게시글 본문이 나타나기를 기다리는 최대 시간(ms) 반환."""
+        return int(self._get_env_with_default("DETAIL_WAIT_TIMEOUT_MS", "10000"))
+    
+    @property
+    def lazy_content(self) -> bool:
+        """제목에 주차가 없는 게시글만 본문을 가져오는 지연 수집 모드 여부 반환."""
+        return self._get_bool_env_with_default("LAZY_CONTENT", True)
+    
+    @property
+    def content_cache(self) -> bool:
+        """게시글 본문 로컬 캐시 사용 여부 반환."""
+        return self._get_bool_env_with_default("CONTENT_CACHE", True)
+    
+    @property
+    def content_cache_path(self) -> str:
+        """게시글 본문 캐시 DB 경로 반환."""
+        return self._get_env_with_default("CONTENT_CACHE_PATH", "data/post_cache.db")
+    
+    @property
+    def content_cache_ttl_hours(self) -> float:
+        """캐시된 본문의 유효 시간(시간 단위) 반환."""
+        return float(self._get_env_with_default("CONTENT_CACHE_TTL_HOURS", "168"))
+    
+    @property
+    def content_cache_max_mb(self) -> float:
+        """본문 캐시 최대 용량(MB) 반환."""
+        return float(self._get_env_with_default("CONTENT_CACHE_MAX_MB", "50"))
+    
+    @property
+    def resource_blocking(self) -> bool:
+        """크롤링 중 불필요한 네트워크 리소스 차단 여부 반환."""
+        return self._get_bool_env_with_default("RESOURCE_BLOCKING", True)
+    
+    @property
+    def blocked_resource_types(self) -> List[str]:
+        """차단할 리소스 타입 목록 반환 (비어 있으면 기본 프로필 사용)."""
+        return self._get_list_env("BLOCKED_RESOURCE_TYPES")
+    
+    @property
+    def blocked_hosts(self) -> List[str]:
+        """기본 목록에 더해 차단할 호스트 목록 반환."""
+        return self._get_list_env("BLOCKED_HOSTS")
+    
+    @property
+    def allowed_hosts(self) -> List[str]:
+        """기본 목록에 더해 차단하지 않을 호스트 목록 반환."""
+        return self._get_list_env("ALLOWED_HOSTS")
+    
+    @property
+    def rate_limit(self) -> bool:
+        """모든 네이버 요청에 적응형 속도 제한을 적용할지 여부 반환."""
+        return self._get_bool_env_with_default("RATE_LIMIT", True)
+    
+    @property
+    def rate_limit_rps(self) -> float:
+        """시작 초당 요청 수 반환."""
+        return float(self._get_env_with_default("RATE_LIMIT_RPS", "2"))
+    
+    @property
+    def rate_limit_burst(self) -> int:
+        """한 번에 몰아서 보낼 수 있는 최대 요청 수 반환."""
+        return int(self._get_env_with_default("RATE_LIMIT_BURST", "4"))
+    
+    @property
+    def rate_limit_max_in_flight(self) -> int:
+        """동시에 진행할 수 있는 최대 요청 수 반환."""
+        return int(self._get_env_with_default("RATE_LIMIT_MAX_IN_FLIGHT", "4"))
+    
+    @property
+    def rate_limit_min_rps(self) -> float:
+        """차단 신호로 낮출 수 있는 최소 초당 요청 수 반환."""
+        return float(self._get_env_with_default("RATE_LIMIT_MIN_RPS", "0.2"))
+    
+    @property
+    def rate_limit_max_rps(self) -> float:
+        """정상 응답이 이어질 때 올릴 수 있는 최대 초당 요청 수 반환."""
+        return float(self._get_env_with_default("RATE_LIMIT_MAX_RPS", "6"))
+    
+    @property
+    def rate_limit_slow_ms(self) -> float:
+        """속도를 낮출 느린 응답 기준(ms) 반환."""
+        return float(self._get_env_with_default("RATE_LIMIT_SLOW_MS", "4000"))
+    
+    @property
+    def snapshot_mode(self) -> str:
+        """페이지 스냅샷 모드 반환 ("off", "record", "replay")."""
+        return self._get_env_with_default("SNAPSHOT_MODE", "off").lower()
+    
+    @property
+    def snapshot_name(self) -> str:
+        """기록하거나 재생할 스냅샷 이름 반환."""
+        return self._get_env_with_default("SNAPSHOT_NAME", "default")
+    
+    @property
+    def snapshot_dir(self) -> str:
+        """스냅샷을 보관할 디렉터리 반환."""
+        return self._get_env_with_default("SNAPSHOT_DIR", "data/snapshots")
+    
+    @property
+    def snapshot_latency_ms(self) -> int:
+        """재생 시 응답마다 넣을 지연 시간(ms) 반환."""
+        return int(self._get_env_with_default("SNAPSHOT_LATENCY_MS", "0"))
+    
+    @property
+    def selector_profile(self) -> bool:
+        """카페별로 매칭된 선택자와 첫 선택자 적중률을 기록할지 여부 반환."""
+        return self._get_bool_env_with_default("SELECTOR_PROFILE", True)
+    
+    @property
+    def selector_profile_path(self) -> str:
+        """선택자 프로필 파일 경로 반환."""
+        return self._get_env_with_default("SELECTOR_PROFILE_PATH", "data/selector_profile.json")
+    
+    @property
+    def naver_cookies_path(self) -> str:
+        """로그인 세션 저장 상태(쿠키, 웹 스토리지) 파일 경로 반환."""
+        return self._get_env_with_default("NAVER_COOKIES_PATH", "data/naver_cookies.json")
+    
+    @property
+    def session_verdict_path(self) -> str:
+        """로그인 세션 검증 기록 파일 경로 반환."""
+        return self._get_env_with_default("SESSION_VERDICT_PATH", "data/session_verdict.json")
+    
+    @property
+    def session_verdict_ttl_minutes(self) -> float:
+        """검증된 로그인 세션을 다시 확인하지 않고 신뢰할 시간(분) 반환 (0이면 매번 확인)."""
+        return float(self._get_env_with_default("SESSION_VERDICT_TTL_MINUTES", "30"))
+    
+    @property
+    def browser_pool(self) -> bool:
+        """웹 서버에서 브라우저와 로그인 컨텍스트를 미리 띄워 재사용할지 여부 반환."""
+        return self._get_bool_env_with_default("BROWSER_POOL", True)
+    
+    @property
+    def browser_pool_size(self) -> int:
+        """브라우저 풀의 컨텍스트 수 반환."""
+        return int(self._get_env_with_default("BROWSER_POOL_SIZE", "1"))
+    
+    @property
+    def browser_pool_max_navigations(self) -> int:
+        """컨텍스트를 재생성하기 전까지 허용할 누적 이동 횟수 반환."""
+        return int(self._get_env_with_default("BROWSER_POOL_MAX_NAVIGATIONS", "300"))
+    
+    @property
+    def page_max_navigations(self) -> int:
+        """실행 중 페이지 하나로 이동할 최대 횟수 반환 (넘으면 새 페이지로 교체, 0이면 제한 없음)."""
+        return int(self._get_env_with_default("PAGE_MAX_NAVIGATIONS", "50"))
+    
+    @property
+    def page_memory_limit_mb(self) -> float:
+        """실행 중 페이지를 교체할 페이지 렌더러 힙 기준(MB) 반환."""
+        return float(self._get_env_with_default("PAGE_MEMORY_LIMIT_MB", "256"))
+    
+    @property
+    def browser_pool_memory_mb(self) -> int:
+        """브라우저를 재시작할 메모리 사용량 기준(MB) 반환."""
+        return int(self._get_env_with_default("BROWSER_POOL_MEMORY_MB", "1024"))
+    
     @property
     def google_sheet_id(self) -> str:
         """구글 시트 ID 반환."""
@@ -47,6 +356,31 @@ class Config:
         """구글 API 인증 파일 경로 반환."""
         return self._get_required_env("GOOGLE_CREDENTIALS_PATH")
     
+    @property
+    def sheets_requests_per_minute(self) -> int:
+        """모든 시트 쓰기가 공유하는 분당 요청 한도 반환."""
+        return int(self._get_env_with_default("SHEETS_REQUESTS_PER_MINUTE", "60"))
+    
+    @property
+    def sheets_max_concurrency(self) -> int:
+        """시트 쓰기 청크를 동시에 보낼 최대 수 반환."""
+        return int(self._get_env_with_default("SHEETS_MAX_CONCURRENCY", "2"))
+    
+    @property
+    def sheets_chunk_max_cells(self) -> int:
+        """시트 쓰기 청크 하나의 최대 셀 수 반환."""
+        return int(self._get_env_with_default("SHEETS_CHUNK_MAX_CELLS", "5000"))
+    
+    @property
+    def sheets_chunk_max_kb(self) -> int:
+        """시트 쓰기 청크 하나의 최대 요청 크기(KB) 반환."""
+        return int(self._get_env_with_default("SHEETS_CHUNK_MAX_KB", "512"))
+    
+    @property
+    def sheets_max_retries(self) -> int:
+        """시트 쓰기 청크별 최대 시도 횟수 반환."""
+        return int(self._get_env_with_default("SHEETS_MAX_RETRIES", "3"))
+    
     @property
     def log_level(self) -> str:
         """로그 레벨 반환."""
@@ -63,6 +397,13 @@ class Config:
         return os.getenv("ENCRYPTION_KEY")
     
     
+    def _parse_window_date(self, value: str) -> datetime:
+        """YYYY-MM-DD 형식의 수집 기간 시작일을 datetime으로 변환."""
+        try:
+            return datetime.strptime(str(value).strip(), "%Y-%m-%d")
+        except ValueError:
+            raise ConfigurationError(f"수집 기간 시작일은 YYYY-MM-DD 형식이어야 합니다: {value}")
+    
     def _get_required_env(self, key: str) -> str:
         """필수 환경 변수 값을 반환하며, 없으면 예외 발생."""
         value = os.getenv(key)
@@ -72,4 +413,16 @@ class Config:
     
     def _get_env_with_default(self, key: str, default: str) -> str:
         """환경 변수 값을 반환하며, 없으면 기본값 사용."""
-        return os.getenv(key, default)
\ No newline at end of file
+        return os.getenv(key, default)
+    
+    def _get_bool_env_with_default(self, key: str, default: bool) -> bool:
+        """불리언 환경 변수 값을 반환하며, 없으면 기본값 사용."""
+        value = os.getenv(key)
+        if value is None or not value.strip():
+            return default
+        return value.strip().lower() in ("1", "true", "yes", "on")
+    
+    def _get_list_env(self, key: str) -> List[str]:
+        """쉼표로 구분된 환경 변수 값을 목록으로 반환."""
+        value = os.getenv(key, "")
+        return [item.strip() for item in value.split(",") if item.strip()]
\ No newline at end of file
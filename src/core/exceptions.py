@@ -26,6 +26,11 @@ class CrawlingError(NaverCrawlerError):
     pass
 
 
+class PageStructureError(CrawlingError):
+    """페이지에서 예상한 게시판/게시글 구조를 찾지 못했을 때 사용되는 예외."""
+    pass
+
+
 class GoogleSheetsError(QOK6Exception):
     """구글 시트 연동 관련 오류 발생 시 사용되는 예외."""
     pass
@@ -0,0 +1,278 @@
+"""비동기 구글 시트 연동 서비스 모듈 - 이벤트 루프를 막지 않고 시트를 읽고 쓰기."""
+
+import asyncio
+from typing import List, Dict, Any, Optional, Set
+from urllib.parse import quote
+
+import httpx
+from google.auth.exceptions import GoogleAuthError
+from google.auth.transport.requests import Request
+from google.oauth2.service_account import Credentials
+
+from ..core.logger import get_logger
+from ..core.exceptions import GoogleSheetsError, AuthenticationError, SheetUpdateError
+from .models import SheetUpdateRequest, SheetData, SheetIndex, SheetWritePlan, build_attendance_data
+from .dispatcher import RETRYABLE_STATUSES, SheetWriteDispatcher, build_batch_update_body
+
+
+SHEETS_API_URL = "https://sheets.googleapis.com/v4/spreadsheets"
+
+
+class AsyncGoogleSheetsService:
+    """구글 시트 API를 통한 시트 읽기/쓰기를 비동기 HTTP 클라이언트로 수행하는 서비스.
+
+    시트 API 요청은 연결 풀을 유지하는 httpx.AsyncClient로 보내고, 재시도 대기도 asyncio.sleep을
+    사용하므로 실행 중에도 웹 서버의 다른 요청이 멈추지 않는다. 액세스 토큰 발급/갱신만 google-auth의
+    동기 호출이라 스레드에서 수행한다.
+    """
+
+    SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
+
+    # 시트 인덱스를 만들 때 읽는 범위 (헤더 행과 참여자 열 포함)
+    INDEX_RANGE = "A:Z"
+
+    def __init__(
+        self,
+        credentials_path: str,
+        sheet_id: str,
+        dispatcher: Optional[SheetWriteDispatcher] = None,
+        max_connections: int = 4,
+        request_timeout: float = 30.0
+    ) -> None:
+        """구글 API 인증 정보와 시트 ID, 쓰기 분배기, HTTP 연결 풀 설정으로 서비스 초기화."""
+        self._credentials_path = credentials_path
+        self._sheet_id = sheet_id
+        self._dispatcher = dispatcher or SheetWriteDispatcher()
+        self._max_connections = max(1, max_connections)
+        self._request_timeout = request_timeout
+        self._logger = get_logger(__name__)
+        self._credentials: Optional[Credentials] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._token_lock: Optional[asyncio.Lock] = None
+        self._index: Optional[SheetIndex] = None
+        self._write_plan: Optional[SheetWritePlan] = None
+
+    async def authenticate(self) -> None:
+        """구글 API 서비스 계정으로 인증하고 액세스 토큰 발급."""
+        try:
+            self._credentials = await asyncio.to_thread(
+                Credentials.from_service_account_file,
+                self._credentials_path,
+                scopes=self.SCOPES
+            )
+            self._get_client()
+            await self._ensure_token(force=True)
+            self._logger.info("구글 시트 API 인증 완료")
+
+        except FileNotFoundError:
+            raise AuthenticationError(f"인증 파일을 찾을 수 없습니다: {self._credentials_path}")
+        except GoogleAuthError as e:
+            raise AuthenticationError(f"구글 API 인증 실패: {str(e)}")
+        except Exception as e:
+            raise AuthenticationError(f"인증 중 예상치 못한 오류 발생: {str(e)}")
+
+    async def read_sheet_data(self, range_name: str, max_retries: int = 3) -> SheetData:
+        """지정된 범위의 시트 데이터를 읽어오기 (일시적 오류는 비동기 백오프 후 재시도)."""
+        url = f"{SHEETS_API_URL}/{self._sheet_id}/values/{quote(range_name, safe='')}"
+
+        for attempt in range(max(1, max_retries)):
+            try:
+                result = await self._request("GET", url)
+                values = result.get('values', [])
+                self._logger.info(f"시트 데이터 읽기 완료: {len(values)}행")
+                return SheetData(range_name=range_name, values=values)
+
+            except Exception as e:
+                if not self._is_retryable_error(e) or attempt >= max_retries - 1:
+                    raise GoogleSheetsError(f"시트 데이터 읽기 실패: {str(e)}")
+                wait_time = min(2 ** attempt, 5)
+                self._logger.warning(f"시트 읽기 오류로 {wait_time}초 후 재시도 ({attempt + 1}/{max_retries}): {str(e)}")
+                await asyncio.sleep(wait_time)
+
+        raise GoogleSheetsError("시트 데이터 읽기 실패")
+
+    async def get_sheet_index(self, refresh: bool = False) -> SheetIndex:
+        """참여자 행/주차 열 조회표 반환 (무효화되기 전까지 한 번 읽은 결과를 재사용)."""
+        if self._index is None or refresh:
+            sheet_data = await self.read_sheet_data(self.INDEX_RANGE)
+            self._index = SheetIndex.from_sheet_data(sheet_data)
+            self._logger.info(
+                f"시트 인덱스 생성 완료: 참여자 {len(self._index.participant_rows)}명, "
+                f"주차 열 {len(self._index.week_columns)}개"
+            )
+        return self._index
+
+    def invalidate_index(self) -> None:
+        """캐시된 시트 인덱스를 버려 다음 조회 때 시트를 다시 읽도록 함."""
+        self._index = None
+
+    async def get_participants_list(self) -> List[str]:
+        """시트에서 참여자 목록을 가져오기 (A열, 헤더 제외, 시트 인덱스와 같은 읽기 결과 사용)."""
+        try:
+            participants = list((await self.get_sheet_index()).participants)
+
+            if not participants:
+                self._logger.warning("시트에 참여자 데이터가 없습니다")
+                return []
+
+            self._logger.info(f"참여자 목록 가져오기 완료: {len(participants)}명")
+            return participants
+
+        except Exception as e:
+            self._logger.error(f"참여자 목록 가져오기 실패: {str(e)}")
+            return []
+
+    async def update_sheet_data(self, updates: List[SheetUpdateRequest], max_retries: Optional[int] = None) -> bool:
+        """여러 셀을 청크 단위로 배치 업데이트 (청크별 재시도, 기본 재시도 횟수는 분배 설정값)."""
+        if not self._credentials:
+            raise GoogleSheetsError("구글 시트 API 서비스가 인증되지 않았습니다")
+
+        if not updates:
+            self._logger.warning("업데이트할 데이터가 없습니다")
+            return True
+
+        # 청크로 나누어 분당 요청 한도 안에서 전송하고, 실패한 청크만 재시도
+        stats = await self._dispatcher.dispatch(
+            updates,
+            send=self._send_batch_update,
+            is_retryable=self._is_retryable_error,
+            max_retries=max_retries
+        )
+        stats.raise_for_failures()
+
+        self._logger.info(f"시트 배치 업데이트 완료: {stats.updated_cells}개 셀 업데이트")
+        return True
+
+    async def batch_update_attendance(self, attendance_data: Dict[str, Dict[int, str]]) -> bool:
+        """참여자별 주차별 출석 현황을 배치 업데이트 (현재 값과 다른 셀만 씀)."""
+        self._write_plan = None
+        self._dispatcher.reset_stats()
+        if not attendance_data:
+            self._logger.info("업데이트할 출석 데이터가 없습니다")
+            return True
+
+        try:
+            # 한 번 읽은 시트 인덱스의 현재 값과 비교하여 값이 바뀌는 셀만 씀
+            index = await self.get_sheet_index()
+            plan = index.plan_writes(attendance_data)
+            self._write_plan = plan
+
+            for participant_name, week_number in plan.unmatched:
+                self._logger.warning(f"셀 위치를 찾을 수 없음: {participant_name}, {week_number}주차")
+
+            if not plan.planned:
+                self._logger.warning("업데이트할 유효한 셀이 없습니다")
+                return False
+
+            if not plan.writes:
+                self._logger.info(f"값이 바뀐 셀이 없어 시트 쓰기를 생략합니다 (계획 {plan.planned}개 셀)")
+                return True
+
+            success = await self.update_sheet_data(plan.to_requests())
+            if success:
+                plan.written = len(plan.writes)
+                index.apply(plan)
+            self._logger.info(
+                f"배치 출석 업데이트 완료: 계획 {plan.planned}개, "
+                f"변경 없음 {plan.unchanged}개, 쓰기 {plan.written}개 셀"
+            )
+            return success
+
+        except Exception as e:
+            raise SheetUpdateError(f"배치 출석 업데이트 실패: {str(e)}")
+
+    async def update_attendance_from_submissions(self, weekly_submissions: Dict[int, Set[str]]) -> bool:
+        """주차별 제출자 정보를 바탕으로 출석 현황을 업데이트 (제출자만 O로 표시, 기존 데이터 보존)."""
+        try:
+            for week_number, submitters in weekly_submissions.items():
+                self._logger.info(f"{week_number}주차 제출자 {len(submitters)}명 업데이트 예정: {list(submitters)}")
+            attendance_data = build_attendance_data(weekly_submissions)
+
+            if not attendance_data:
+                self._logger.warning("업데이트할 제출자 데이터가 없습니다")
+                return True
+
+            success = await self.batch_update_attendance(attendance_data)
+            if success:
+                stats = self.get_write_stats()
+                self._logger.info(
+                    f"출석 현황 업데이트 완료: {stats['planned']}개 셀 중 "
+                    f"{stats['written']}개 셀을 새로 'O'로 표시"
+                )
+            return success
+
+        except Exception as e:
+            raise SheetUpdateError(f"제출 정보 기반 출석 업데이트 실패: {str(e)}")
+
+    def get_write_stats(self) -> Dict[str, Any]:
+        """마지막 출석 업데이트에서 계획/생략/쓰기한 셀 수 반환."""
+        return self._write_plan.to_dict() if self._write_plan else SheetWritePlan().to_dict()
+
+    def get_dispatch_stats(self) -> Dict[str, Any]:
+        """마지막 시트 쓰기의 청크별 지연/재시도 통계 반환."""
+        return self._dispatcher.get_stats()
+
+    async def aclose(self) -> None:
+        """HTTP 연결 풀 정리."""
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
+
+    async def _send_batch_update(self, chunk: List[SheetUpdateRequest]) -> int:
+        """청크 하나를 batchUpdate로 전송하고 반영된 셀 수 반환."""
+        result = await self._request(
+            "POST",
+            f"{SHEETS_API_URL}/{self._sheet_id}/values:batchUpdate",
+            json=build_batch_update_body(chunk)
+        )
+        return result.get('totalUpdatedCells', 0)
+
+    async def _request(self, method: str, url: str, **kwargs: Any) -> Dict[str, Any]:
+        """액세스 토큰을 붙여 시트 API를 호출하고 JSON 응답 반환 (오류 상태는 예외)."""
+        if not self._credentials:
+            raise GoogleSheetsError("구글 시트 API 서비스가 인증되지 않았습니다")
+
+        await self._ensure_token()
+        response = await self._get_client().request(
+            method,
+            url,
+            headers={'Authorization': f"Bearer {self._credentials.token}"},
+            **kwargs
+        )
+        response.raise_for_status()
+        return response.json()
+
+    async def _ensure_token(self, force: bool = False) -> None:
+        """토큰이 없거나 만료되었으면 스레드에서 갱신 (동시에 여러 번 갱신하지 않음)."""
+        async with self._get_token_lock():
+            if force or not self._credentials.valid:
+                await asyncio.to_thread(self._credentials.refresh, Request())
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """현재 이벤트 루프의 HTTP 클라이언트 반환 (루프가 바뀌었으면 새로 생성)."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            # 이전 루프에서 만든 클라이언트는 그 루프가 끝나 사용할 수 없음
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self._max_connections,
+                    max_keepalive_connections=self._max_connections
+                ),
+                timeout=self._request_timeout
+            )
+            self._client_loop = loop
+            self._token_lock = asyncio.Lock()
+        return self._client
+
+    def _get_token_lock(self) -> asyncio.Lock:
+        """현재 이벤트 루프의 토큰 갱신 잠금 반환."""
+        self._get_client()
+        return self._token_lock
+
+    def _is_retryable_error(self, error: Exception) -> bool:
+        """재시도할 오류인지 판단 (429/500/503과 네트워크 오류는 재시도)."""
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code in RETRYABLE_STATUSES
+        return isinstance(error, httpx.TransportError)
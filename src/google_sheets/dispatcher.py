@@ -0,0 +1,339 @@
+"""시트 쓰기 분배 모듈 - 업데이트를 크기/셀 수 기준 청크로 나누고 분당 요청 한도 안에서 동시에 전송."""
+
+import asyncio
+import json
+import math
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Any, Awaitable, Callable, List, Optional, Tuple
+
+from ..core.logger import get_logger
+from ..core.exceptions import SheetUpdateError
+from .models import SheetUpdateRequest
+
+
+# 재시도할 수 있는 시트 API 응답 상태 코드
+RETRYABLE_STATUSES: Tuple[int, ...] = (429, 500, 503)
+
+# 행 단위로 나눌 수 있는 A1 범위 (예: "C2:L101", "D7")
+A1_RANGE_PATTERN = re.compile(r'^([A-Z]+)(\d+)(?::([A-Z]+)(\d+))?$')
+
+
+@dataclass
+class SheetDispatchSettings:
+    """청크 크기, 분당 요청 한도, 동시 전송 수와 재시도 기준."""
+
+    max_chunk_cells: int = 5000
+    max_chunk_bytes: int = 512 * 1024
+    requests_per_minute: int = 60
+    max_concurrency: int = 2
+    max_retries: int = 3
+    max_backoff_seconds: float = 32.0
+
+
+class SheetRequestQuota:
+    """같은 서비스 계정을 쓰는 모든 시트 클라이언트가 공유하는 분당 요청 토큰 버킷.
+
+    토큰은 분당 requests_per_minute개 속도로 채워지고 그만큼까지 쌓인다. 토큰이 없으면
+    미리 예약하여 대기 시간을 돌려주고, 호출한 쪽이 asyncio.sleep으로 기다린다. 시트 클라이언트는
+    모두 같은 이벤트 루프에서 실행되고 reserve는 중간에 await하지 않으므로 잠금 없이도 예약이 섞이지 않는다.
+    """
+
+    def __init__(self, requests_per_minute: int = 60) -> None:
+        """분당 요청 한도로 초기화."""
+        self._capacity = float(max(1, requests_per_minute))
+        self._rate = self._capacity / 60
+        self._tokens = self._capacity
+        self._updated_at = time.monotonic()
+
+    def reserve(self) -> float:
+        """토큰 하나를 예약하고, 사용할 수 있을 때까지 기다려야 하는 시간(초) 반환."""
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated_at) * self._rate)
+        self._updated_at = now
+        self._tokens -= 1
+        return 0.0 if self._tokens >= 0 else -self._tokens / self._rate
+
+
+@dataclass
+class ChunkResult:
+    """청크 하나의 전송 결과."""
+
+    index: int
+    ranges: int
+    cells: int
+    bytes: int
+    attempts: int = 0
+    latency_ms: float = 0.0
+    quota_wait_ms: float = 0.0
+    updated_cells: int = 0
+    error: Optional[str] = None
+
+    @property
+    def succeeded(self) -> bool:
+        """전송 성공 여부."""
+        return self.error is None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리 형태로 변환."""
+        return {
+            'index': self.index,
+            'ranges': self.ranges,
+            'cells': self.cells,
+            'bytes': self.bytes,
+            'attempts': self.attempts,
+            'retries': max(0, self.attempts - 1),
+            'latency_ms': round(self.latency_ms),
+            'quota_wait_ms': round(self.quota_wait_ms),
+            'updated_cells': self.updated_cells,
+            'error': self.error
+        }
+
+
+@dataclass
+class DispatchStats:
+    """한 번의 분배 전송에서 청크별 지연/재시도 통계."""
+
+    chunks: List[ChunkResult] = field(default_factory=list)
+
+    @property
+    def failed_chunks(self) -> List[ChunkResult]:
+        """재시도 후에도 실패한 청크."""
+        return [chunk for chunk in self.chunks if not chunk.succeeded]
+
+    @property
+    def updated_cells(self) -> int:
+        """시트에 반영된 셀 수."""
+        return sum(chunk.updated_cells for chunk in self.chunks)
+
+    def raise_for_failures(self) -> None:
+        """재시도 후에도 실패한 청크가 있으면 SheetUpdateError 발생."""
+        failed = self.failed_chunks
+        if failed:
+            raise SheetUpdateError(
+                f"시트 업데이트 실패: 청크 {len(self.chunks)}개 중 {len(failed)}개 실패 "
+                f"({failed[0].error})"
+            )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리 형태로 변환."""
+        latencies = [chunk.latency_ms for chunk in self.chunks]
+        return {
+            'chunks': len(self.chunks),
+            'failed_chunks': len(self.failed_chunks),
+            'retries': sum(max(0, chunk.attempts - 1) for chunk in self.chunks),
+            'updated_cells': self.updated_cells,
+            'total_latency_ms': round(sum(latencies)),
+            'max_latency_ms': round(max(latencies, default=0)),
+            'quota_wait_ms': round(sum(chunk.quota_wait_ms for chunk in self.chunks)),
+            'per_chunk': [chunk.to_dict() for chunk in self.chunks]
+        }
+
+
+class SheetWriteDispatcher:
+    """업데이트 요청을 청크로 나누어 분당 요청 한도와 동시 전송 수 안에서 보내는 분배기.
+
+    청크마다 따로 재시도하므로 실패한 청크만 다시 보내고, 이미 반영된 청크는 다시 쓰지 않는다.
+    실제 전송과 재시도 가능 여부 판단은 호출하는 클라이언트가 넘겨준 함수가 담당하며,
+    전송, 한도 대기, 백오프는 모두 이벤트 루프에서 진행한다.
+    """
+
+    def __init__(
+        self,
+        settings: Optional[SheetDispatchSettings] = None,
+        quota: Optional[SheetRequestQuota] = None
+    ) -> None:
+        """분배 설정과 공유 요청 한도로 초기화."""
+        self._settings = settings or SheetDispatchSettings()
+        self._quota = quota or SheetRequestQuota(self._settings.requests_per_minute)
+        self._logger = get_logger(__name__)
+        self.stats = DispatchStats()
+
+    def make_chunks(self, updates: List[SheetUpdateRequest]) -> List[List[SheetUpdateRequest]]:
+        """셀 수와 요청 크기 한도를 넘지 않도록 업데이트를 청크로 묶음 (큰 범위는 행 단위로 나눔)."""
+        settings = self._settings
+        chunks: List[List[SheetUpdateRequest]] = []
+        current: List[SheetUpdateRequest] = []
+        current_cells = current_bytes = 0
+
+        for update in updates:
+            for piece in self._split_update(update):
+                cells, size = _count_cells(piece), _estimate_bytes(piece)
+                if current and (
+                    current_cells + cells > settings.max_chunk_cells
+                    or current_bytes + size > settings.max_chunk_bytes
+                ):
+                    chunks.append(current)
+                    current, current_cells, current_bytes = [], 0, 0
+                current.append(piece)
+                current_cells += cells
+                current_bytes += size
+
+        if current:
+            chunks.append(current)
+        return chunks
+
+    async def dispatch(
+        self,
+        updates: List[SheetUpdateRequest],
+        send: Callable[[List[SheetUpdateRequest]], Awaitable[int]],
+        is_retryable: Callable[[Exception], bool],
+        max_retries: Optional[int] = None
+    ) -> DispatchStats:
+        """청크를 이벤트 루프에서 동시에 전송 (대기와 백오프도 이벤트 루프를 막지 않음)."""
+        chunks, retries = self._start_dispatch(updates, max_retries)
+        semaphore = asyncio.Semaphore(max(1, self._settings.max_concurrency))
+
+        async def send_with_slot(chunk: List[SheetUpdateRequest], result: ChunkResult) -> None:
+            async with semaphore:
+                await self._send_chunk(chunk, result, send, is_retryable, retries)
+
+        await asyncio.gather(*(
+            send_with_slot(chunk, result) for chunk, result in zip(chunks, self.stats.chunks)
+        ))
+
+        self._log_stats()
+        return self.stats
+
+    def reset_stats(self) -> None:
+        """마지막 분배 전송 통계 초기화."""
+        self.stats = DispatchStats()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """마지막 분배 전송 통계 반환."""
+        return self.stats.to_dict()
+
+    def _start_dispatch(
+        self,
+        updates: List[SheetUpdateRequest],
+        max_retries: Optional[int]
+    ) -> Tuple[List[List[SheetUpdateRequest]], int]:
+        """청크를 만들고 청크별 통계를 준비한 뒤 청크와 최대 시도 횟수 반환."""
+        chunks = self.make_chunks(updates)
+        self.stats = DispatchStats(chunks=[
+            ChunkResult(index=index, ranges=len(chunk), cells=sum(_count_cells(u) for u in chunk),
+                        bytes=sum(_estimate_bytes(u) for u in chunk))
+            for index, chunk in enumerate(chunks)
+        ])
+        retries = self._settings.max_retries if max_retries is None else max_retries
+        return chunks, max(1, retries)
+
+    async def _send_chunk(
+        self,
+        chunk: List[SheetUpdateRequest],
+        result: ChunkResult,
+        send: Callable[[List[SheetUpdateRequest]], Awaitable[int]],
+        is_retryable: Callable[[Exception], bool],
+        max_retries: int
+    ) -> None:
+        """한도 토큰을 받아 청크를 전송하고, 재시도할 수 있는 오류면 백오프 후 최대 max_retries번까지 다시 시도."""
+        for attempt in range(max_retries):
+            wait_seconds = self._reserve_quota(result)
+            if wait_seconds:
+                await asyncio.sleep(wait_seconds)
+
+            started = time.monotonic()
+            try:
+                result.updated_cells = await send(chunk)
+                self._record_success(result, started)
+                return
+            except Exception as e:
+                backoff = self._record_failure(result, started, e, attempt, max_retries, is_retryable)
+                if backoff is None:
+                    return
+                await asyncio.sleep(backoff)
+
+    def _reserve_quota(self, result: ChunkResult) -> float:
+        """요청 한도 토큰을 예약하고 기다려야 하는 시간(초) 반환."""
+        wait_seconds = self._quota.reserve()
+        result.quota_wait_ms += wait_seconds * 1000
+        result.attempts += 1
+        return wait_seconds
+
+    def _record_success(self, result: ChunkResult, started: float) -> None:
+        """전송 성공 기록."""
+        result.latency_ms += (time.monotonic() - started) * 1000
+        result.error = None
+
+    def _record_failure(
+        self,
+        result: ChunkResult,
+        started: float,
+        error: Exception,
+        attempt: int,
+        max_retries: int,
+        is_retryable: Callable[[Exception], bool]
+    ) -> Optional[float]:
+        """전송 실패 기록 후 재시도 전 대기 시간 반환 (재시도하지 않으면 None)."""
+        result.latency_ms += (time.monotonic() - started) * 1000
+        result.error = str(error)
+        if not is_retryable(error) or attempt >= max_retries - 1:
+            return None
+
+        backoff = self._backoff_seconds(attempt)
+        self._logger.warning(
+            f"시트 청크 {result.index} 전송 오류로 {backoff:.0f}초 후 재시도 "
+            f"({attempt + 1}/{max_retries}): {str(error)}"
+        )
+        return backoff
+
+    def _backoff_seconds(self, attempt: int) -> float:
+        """재시도 대기 시간 (지수 증가, 최대값 제한)."""
+        return min(2 ** attempt, self._settings.max_backoff_seconds)
+
+    def _split_update(self, update: SheetUpdateRequest) -> List[SheetUpdateRequest]:
+        """한도를 넘는 직사각형 범위를 행 단위 조각으로 나눔 (나눌 수 없는 범위는 그대로)."""
+        settings = self._settings
+        cells, size = _count_cells(update), _estimate_bytes(update)
+        match = A1_RANGE_PATTERN.match(update.range_name)
+        if (cells <= settings.max_chunk_cells and size <= settings.max_chunk_bytes) or not match:
+            return [update]
+
+        width = max(1, max(len(row) for row in update.values))
+        row_count = len(update.values)
+        rows_per_piece = min(
+            max(1, settings.max_chunk_cells // width),
+            max(1, math.ceil(row_count / math.ceil(size / settings.max_chunk_bytes)))
+        )
+
+        start_row = int(match.group(2))
+        start_col = match.group(1)
+        end_col = match.group(3) or start_col
+        pieces = []
+        for offset in range(0, row_count, rows_per_piece):
+            values = update.values[offset:offset + rows_per_piece]
+            first_row = start_row + offset
+            last_row = first_row + len(values) - 1
+            pieces.append(SheetUpdateRequest(
+                range_name=f"{start_col}{first_row}:{end_col}{last_row}",
+                values=values
+            ))
+        return pieces
+
+    def _log_stats(self) -> None:
+        """분배 전송 결과 요약 로깅."""
+        stats = self.stats.to_dict()
+        self._logger.info(
+            f"시트 분배 전송 완료: 청크 {stats['chunks']}개, 실패 {stats['failed_chunks']}개, "
+            f"재시도 {stats['retries']}회, 한도 대기 {stats['quota_wait_ms']}ms, "
+            f"최대 지연 {stats['max_latency_ms']}ms"
+        )
+
+
+def build_batch_update_body(chunk: List[SheetUpdateRequest]) -> Dict[str, Any]:
+    """청크 하나의 values.batchUpdate 요청 본문 생성 (값은 입력 그대로 씀)."""
+    return {
+        'valueInputOption': 'RAW',
+        'data': [{'range': update.range_name, 'values': update.values} for update in chunk]
+    }
+
+
+def _count_cells(update: SheetUpdateRequest) -> int:
+    """업데이트 요청이 덮는 셀 수 (null로 건너뛰는 셀 포함)."""
+    return sum(len(row) for row in update.values)
+
+
+def _estimate_bytes(update: SheetUpdateRequest) -> int:
+    """배치 요청 본문에서 업데이트 하나가 차지하는 크기 추정."""
+    return len(json.dumps({'range': update.range_name, 'values': update.values}, ensure_ascii=False).encode('utf-8'))
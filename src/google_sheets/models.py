@@ -1,7 +1,24 @@
 """구글 시트 관련 데이터 모델."""
 
-from dataclasses import dataclass
-from typing import List, Any, Optional
+import re
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Set, Tuple
+
+from ..shared.utils import normalize_participant_name
+
+
+# 헤더 행의 주차 열 제목 (예: "3주차")
+WEEK_HEADER_PATTERN = re.compile(r'^(\d+)\s*주차$')
+
+
+def column_number_to_letter(col_num: int) -> str:
+    """열 번호를 알파벳으로 변환 (1=A, 2=B, ..., 26=Z, 27=AA)."""
+    result = ""
+    while col_num > 0:
+        col_num -= 1
+        result = chr(col_num % 26 + ord('A')) + result
+        col_num //= 26
+    return result
 
 
 @dataclass
@@ -71,6 +88,243 @@ class SheetData:
         return None
 
 
+@dataclass
+class SheetIndex:
+    """한 번 읽은 시트 값으로 만든 참여자 행/주차 열 조회표 (0-based 인덱스).
+
+    참여자 이름은 정규화한 이름으로, 주차 열은 헤더의 "N주차" 제목에서 읽은 주차 번호로
+    찾는다. 같은 이름이나 주차가 여러 번 나오면 처음 나온 위치를 사용한다.
+    """
+
+    values: List[List[Any]]
+    participants: List[str] = field(default_factory=list)
+    participant_rows: Dict[str, int] = field(default_factory=dict)
+    week_columns: Dict[int, int] = field(default_factory=dict)
+
+    @classmethod
+    def from_sheet_data(cls, sheet_data: SheetData) -> "SheetIndex":
+        """시트 데이터의 헤더 행과 A열로 조회표 생성."""
+        index = cls(values=sheet_data.values)
+        if not sheet_data.values:
+            return index
+
+        for col_idx, cell_value in enumerate(sheet_data.values[0]):
+            match = WEEK_HEADER_PATTERN.match(str(cell_value).strip())
+            if match:
+                index.week_columns.setdefault(int(match.group(1)), col_idx)
+
+        for row_idx in range(1, len(sheet_data.values)):  # 헤더 제외
+            row = sheet_data.values[row_idx]
+            name = str(row[0]).strip() if row and row[0] is not None else ""
+            if not name:
+                continue
+            index.participants.append(name)
+            index.participant_rows.setdefault(normalize_participant_name(name), row_idx)
+
+        return index
+
+    def find_row(self, participant_name: str) -> Optional[int]:
+        """참여자 이름으로 행 번호 찾기."""
+        return self.participant_rows.get(normalize_participant_name(participant_name))
+
+    def find_column(self, week_number: int) -> Optional[int]:
+        """주차 번호로 열 번호 찾기."""
+        return self.week_columns.get(week_number)
+
+    def cell_position(self, participant_name: str, week_number: int) -> Optional[str]:
+        """참여자와 주차에 해당하는 셀의 A1 표기 위치 (찾지 못하면 None)."""
+        row = self.find_row(participant_name)
+        col = self.find_column(week_number)
+        if row is None or col is None:
+            return None
+        return f"{column_number_to_letter(col + 1)}{row + 1}"
+
+    def get_value(self, row: int, col: int) -> str:
+        """셀의 현재 값 (비어 있으면 빈 문자열)."""
+        try:
+            value = self.values[row][col]
+        except IndexError:
+            return ""
+        return "" if value is None else str(value)
+
+    def set_value(self, row: int, col: int, value: str) -> None:
+        """시트에 쓴 값을 인덱스에도 반영 (필요하면 행/열 확장)."""
+        while len(self.values) <= row:
+            self.values.append([])
+        target_row = self.values[row]
+        while len(target_row) <= col:
+            target_row.append("")
+        target_row[col] = value
+
+    def plan_writes(self, attendance_data: Dict[str, Dict[int, str]]) -> "SheetWritePlan":
+        """원하는 출석 값과 현재 셀 값을 비교하여 값이 바뀌는 셀만 쓰기 계획에 포함."""
+        plan = SheetWritePlan()
+        desired: Dict[Tuple[int, int], str] = {}
+
+        for participant_name, week_statuses in attendance_data.items():
+            row = self.find_row(participant_name)
+            for week_number, status in week_statuses.items():
+                col = self.find_column(week_number)
+                if row is None or col is None:
+                    plan.unmatched.append((participant_name, week_number))
+                    continue
+                desired[(row, col)] = status
+
+        plan.planned = len(desired)
+        for (row, col), status in sorted(desired.items()):
+            if self.get_value(row, col).strip() == str(status).strip():
+                plan.unchanged += 1
+            else:
+                plan.writes.append(CellWrite(row=row, col=col, value=status))
+
+        return plan
+
+    def apply(self, plan: "SheetWritePlan") -> None:
+        """쓰기가 끝난 계획의 값을 인덱스에 반영하여 다음 비교에 사용."""
+        for write in plan.writes:
+            self.set_value(write.row, write.col, write.value)
+
+
+@dataclass
+class CellWrite:
+    """값을 바꿔 써야 하는 셀 하나 (0-based 인덱스)."""
+
+    row: int
+    col: int
+    value: str
+
+    @property
+    def a1(self) -> str:
+        """A1 표기 위치."""
+        return f"{column_number_to_letter(self.col + 1)}{self.row + 1}"
+
+
+@dataclass
+class SheetWritePlan:
+    """출석 값 쓰기 계획과 결과 (계획한 셀, 값이 같아 생략한 셀, 실제로 쓴 셀)."""
+
+    writes: List[CellWrite] = field(default_factory=list)
+    planned: int = 0
+    unchanged: int = 0
+    written: int = 0
+    unmatched: List[Tuple[str, int]] = field(default_factory=list)
+
+    def to_requests(self, max_gap: int = 1) -> List[SheetUpdateRequest]:
+        """바뀌는 셀들을 직사각형 범위로 묶은 업데이트 요청 생성."""
+        return coalesce_cell_writes(self.writes, max_gap=max_gap)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리 형태로 변환 (실행 결과 보고용)."""
+        return {
+            'planned': self.planned,
+            'unchanged': self.unchanged,
+            'changed': len(self.writes),
+            'written': self.written,
+            'unmatched': len(self.unmatched)
+        }
+
+
+def build_attendance_data(weekly_submissions: Dict[int, Set[str]], status: str = "O") -> Dict[str, Dict[int, str]]:
+    """주차별 제출자를 참여자별 주차 출석 값으로 변환 (제출자만 포함)."""
+    attendance_data: Dict[str, Dict[int, str]] = {}
+    for week_number, submitters in weekly_submissions.items():
+        for submitter in submitters:
+            attendance_data.setdefault(submitter, {})[week_number] = status
+    return attendance_data
+
+
+def coalesce_cell_writes(writes: List[CellWrite], max_gap: int = 1) -> List[SheetUpdateRequest]:
+    """셀 쓰기를 직사각형 범위로 묶어 업데이트 요청 수를 줄임.
+
+    같은 행에서 max_gap칸 이하로 떨어진 셀은 하나의 행 범위로 잇고, max_gap행 이내 윗행의
+    직사각형 열 범위 안에 들어가는 행 범위는 그 직사각형에 합친다. 사이에 낀 쓰지 않을 셀은
+    None(JSON null)으로 채우며, Sheets API는 null 값을 건너뛰므로 기존 값이 그대로 보존된다.
+    """
+    cells: Dict[Tuple[int, int], Any] = {(write.row, write.col): write.value for write in writes}
+    if not cells:
+        return []
+
+    # 1단계: 행마다 가까운 셀들을 열 구간으로 묶음
+    row_spans: Dict[int, List[Tuple[int, int]]] = {}
+    for row, col in sorted(cells):
+        spans = row_spans.setdefault(row, [])
+        if spans and col - spans[-1][1] - 1 <= max_gap:
+            spans[-1] = (spans[-1][0], col)
+        else:
+            spans.append((col, col))
+
+    # 2단계: 가까운 윗행의 직사각형 열 범위 안에 들어가는 구간은 그 직사각형을 아래로 늘림
+    # 직사각형은 [시작 행, 끝 행, 시작 열, 끝 열]이며 서로 겹치지 않도록 덮은 셀을 기록
+    rectangles: List[List[int]] = []
+    covered: Set[Tuple[int, int]] = set()
+    for row in sorted(row_spans):
+        spans = row_spans[row]
+        for start_col, end_col in spans:
+            if (row, start_col) in covered:
+                # 이 행까지 늘린 직사각형 안에 이미 들어 있음
+                continue
+
+            rect = next((
+                candidate for candidate in reversed(rectangles)
+                if _can_extend_rectangle(candidate, row, start_col, end_col, spans, covered, max_gap)
+            ), None)
+            if rect is None:
+                rect = [row, row, start_col, end_col]
+                rectangles.append(rect)
+                first_new_row = row
+            else:
+                first_new_row = rect[1] + 1
+                rect[1] = row
+
+            covered.update(
+                (covered_row, col)
+                for covered_row in range(first_new_row, row + 1)
+                for col in range(rect[2], rect[3] + 1)
+            )
+
+    requests = []
+    for start_row, end_row, start_col, end_col in rectangles:
+        values = [
+            [cells.get((row, col)) for col in range(start_col, end_col + 1)]
+            for row in range(start_row, end_row + 1)
+        ]
+        range_name = f"{column_number_to_letter(start_col + 1)}{start_row + 1}"
+        if (start_row, start_col) != (end_row, end_col):
+            range_name += f":{column_number_to_letter(end_col + 1)}{end_row + 1}"
+        requests.append(SheetUpdateRequest(range_name=range_name, values=values))
+
+    return requests
+
+
+def _can_extend_rectangle(
+    rect: List[int],
+    row: int,
+    start_col: int,
+    end_col: int,
+    row_spans: List[Tuple[int, int]],
+    covered: Set[Tuple[int, int]],
+    max_gap: int
+) -> bool:
+    """직사각형을 row까지 늘려 열 구간을 담을 수 있는지 확인 (다른 직사각형과 겹치면 불가)."""
+    rect_start_row, rect_end_row, rect_start_col, rect_end_col = rect
+    if not rect_end_row < row <= rect_end_row + max_gap + 1:
+        return False
+    if not (rect_start_col <= start_col and end_col <= rect_end_col):
+        return False
+
+    # 이 행에서 직사각형 열 범위에 걸치는 구간은 모두 그 안에 완전히 들어가야 함
+    for span_start, span_end in row_spans:
+        overlaps = span_start <= rect_end_col and rect_start_col <= span_end
+        if overlaps and not (rect_start_col <= span_start and span_end <= rect_end_col):
+            return False
+
+    return not any(
+        (new_row, col) in covered
+        for new_row in range(rect_end_row + 1, row + 1)
+        for col in range(rect_start_col, rect_end_col + 1)
+    )
+
+
 @dataclass
 class ParticipantStatus:
     """참여자의 출석 현황을 나타내는 데이터 클래스."""
@@ -2,16 +2,36 @@
 
 import asyncio
 import sys
+from dataclasses import replace
 from pathlib import Path
+from typing import Optional, Dict, Any, List, Set
 
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.config import Config
+from src.config import Config, CrawlTarget
 from src.core.logger import LoggerSetup, get_logger
 from src.core.exceptions import QOK6Exception
 from src.naver_crawler.service import NaverCrawlerService
-from src.google_sheets.service import GoogleSheetsService
+from src.naver_crawler.http_backend import NaverHttpCrawlerService
+from src.naver_crawler.crawl_state import CrawlStateStore
+from src.naver_crawler.content_cache import PostContentCache
+from src.naver_crawler.checkpoint import CrawlCheckpointStore
+from src.naver_crawler.wait_strategy import DEFAULT_WAIT_STAGES
+from src.naver_crawler.selector_profile import SelectorProfileStore
+from src.naver_crawler.snapshot import PageSnapshot
+from src.naver_crawler.session import SessionStateStore, SessionVerdictCache
+from src.naver_crawler.browser_pool import BrowserPool
+from src.naver_crawler.rate_limiter import AdaptiveRateLimiter, RateLimitSettings
+from src.naver_crawler.memory import MemoryMonitor
+from src.naver_crawler.resource_blocker import (
+    ResourceBlockProfile,
+    DEFAULT_BLOCKED_RESOURCE_TYPES,
+    DEFAULT_BLOCKED_HOSTS,
+    DEFAULT_ALLOWED_HOSTS
+)
+from src.google_sheets.async_service import AsyncGoogleSheetsService
+from src.google_sheets.dispatcher import SheetDispatchSettings, SheetRequestQuota, SheetWriteDispatcher
 from src.parser.service import DataParsingService
 from src.scheduler.service import SchedulingService
 
@@ -31,15 +51,63 @@ class QOK6AutomationSystem:
         )
         
         # 서비스 인스턴스 초기화
-        self.naver_crawler = NaverCrawlerService(
-            naver_id=self.config.naver_id,
-            naver_password=self.config.naver_password
+        # 로그인 세션 저장 상태는 크롤러와 웹 서버의 브라우저 풀이 함께 사용
+        self.session_store = SessionStateStore(self.config.naver_cookies_path)
+        
+        snapshot = self._build_snapshot()
+        replaying = bool(snapshot and snapshot.replaying)
+        
+        # 실패한 실행의 진행 상황은 다음 시도(스케줄 모드의 재시도 포함)에서 이어받음
+        self.checkpoints = (
+            CrawlCheckpointStore(
+                checkpoint_dir=self.config.crawl_checkpoint_dir,
+                max_age_hours=self.config.crawl_checkpoint_max_age_hours
+            )
+            if self.config.crawl_checkpoint and not replaying else None
         )
         
-        self.google_sheets = GoogleSheetsService(
-            credentials_path=self.config.google_credentials_path,
-            sheet_id=self.config.google_sheet_id
+        self._crawler_options = {}
+        self._crawler_class = NaverCrawlerService
+        # 스냅샷은 브라우저 요청 가로채기로 동작하므로 HTTP 백엔드 대신 Playwright 사용
+        if self.config.crawler_backend == "http" and not snapshot:
+            self._crawler_class = NaverHttpCrawlerService
+            self._crawler_options['max_connections'] = self.config.http_max_connections
+        
+        # 여러 대상을 크롤링할 때도 상태/캐시/세션 저장소는 하나를 공유
+        self._shared_crawler_options = dict(
+            block_profile=self._build_block_profile(),
+            crawl_state=(
+                CrawlStateStore(self.config.crawl_state_path)
+                if self.config.incremental_crawl and not replaying else None
+            ),
+            content_cache=(
+                PostContentCache(
+                    db_path=self.config.content_cache_path,
+                    ttl_hours=self.config.content_cache_ttl_hours,
+                    max_bytes=int(self.config.content_cache_max_mb * 1024 * 1024)
+                )
+                if self.config.content_cache and not replaying else None
+            ),
+            session_cache=SessionVerdictCache(
+                verdict_path=self.config.session_verdict_path,
+                ttl_minutes=self.config.session_verdict_ttl_minutes
+            ),
+            session_store=self.session_store,
+            selector_profile=(
+                SelectorProfileStore(self.config.selector_profile_path)
+                if self.config.selector_profile else None
+            ),
+            snapshot=snapshot,
+            rate_limiter=self._build_rate_limiter(),
+            checkpoints=self.checkpoints
         )
+        self._browser_pool: Optional[BrowserPool] = None
+        
+        self.naver_crawler = self._create_crawler()
+        
+        # 같은 서비스 계정을 쓰는 모든 대상의 시트 쓰기가 분당 요청 한도를 공유
+        self.sheets_quota = SheetRequestQuota(self.config.sheets_requests_per_minute)
+        self.google_sheets = self._create_sheets_service(self.config.google_sheet_id)
         
         self.parser = DataParsingService()
         
@@ -59,8 +127,97 @@ class QOK6AutomationSystem:
         except Exception as e:
             self.logger.warning(f"스케줄러 초기화 실패 (이메일 알림 비활성화): {str(e)}")
     
+    def _create_crawler(self) -> NaverCrawlerService:
+        """설정값과 공유 저장소로 크롤러 인스턴스 생성."""
+        return self._crawler_class(
+            naver_id=self.config.naver_id,
+            naver_password=self.config.naver_password,
+            detail_concurrency=self.config.detail_concurrency,
+            list_concurrency=self.config.list_concurrency,
+            lazy_content=self.config.lazy_content,
+            wait_stages={
+                'board': replace(
+                    DEFAULT_WAIT_STAGES['board'],
+                    timeout_ms=self.config.board_wait_timeout_ms
+                ),
+                'detail': replace(
+                    DEFAULT_WAIT_STAGES['detail'],
+                    timeout_ms=self.config.detail_wait_timeout_ms
+                )
+            },
+            page_max_navigations=self.config.page_max_navigations,
+            memory_monitor=MemoryMonitor(limit_mb=self.config.page_memory_limit_mb),
+            **self._shared_crawler_options,
+            **self._crawler_options
+        )
+    
+    def set_browser_pool(self, browser_pool: Optional[BrowserPool]) -> None:
+        """웹 서버가 유지하는 브라우저 풀 설정 (여러 대상 크롤링에도 사용)."""
+        self._browser_pool = browser_pool
+        self.naver_crawler.set_browser_pool(browser_pool)
+    
+    def _create_sheets_service(self, sheet_id: str) -> AsyncGoogleSheetsService:
+        """설정값과 공유 요청 한도로 이벤트 루프를 막지 않는 시트 서비스 인스턴스 생성."""
+        return AsyncGoogleSheetsService(
+            credentials_path=self.config.google_credentials_path,
+            sheet_id=sheet_id,
+            dispatcher=SheetWriteDispatcher(
+                SheetDispatchSettings(
+                    max_chunk_cells=self.config.sheets_chunk_max_cells,
+                    max_chunk_bytes=self.config.sheets_chunk_max_kb * 1024,
+                    requests_per_minute=self.config.sheets_requests_per_minute,
+                    max_concurrency=self.config.sheets_max_concurrency,
+                    max_retries=self.config.sheets_max_retries
+                ),
+                quota=self.sheets_quota
+            )
+        )
+    
+    def _build_rate_limiter(self) -> Optional[AdaptiveRateLimiter]:
+        """설정값으로 모든 크롤러가 공유할 적응형 속도 제한기 구성."""
+        if not self.config.rate_limit:
+            return None
+        
+        return AdaptiveRateLimiter(RateLimitSettings(
+            requests_per_second=self.config.rate_limit_rps,
+            burst=self.config.rate_limit_burst,
+            max_in_flight=self.config.rate_limit_max_in_flight,
+            min_requests_per_second=self.config.rate_limit_min_rps,
+            max_requests_per_second=self.config.rate_limit_max_rps,
+            slow_response_ms=self.config.rate_limit_slow_ms
+        ))
+    
+    def _build_snapshot(self) -> Optional[PageSnapshot]:
+        """설정값으로 페이지 스냅샷 기록/재생 구성 (재생 시 증분 상태와 본문 캐시는 사용하지 않음)."""
+        if self.config.snapshot_mode == "off":
+            return None
+        
+        return PageSnapshot(
+            name=self.config.snapshot_name,
+            mode=self.config.snapshot_mode,
+            root_dir=self.config.snapshot_dir,
+            latency_ms=self.config.snapshot_latency_ms
+        )
+    
+    def _build_block_profile(self) -> Optional[ResourceBlockProfile]:
+        """설정값으로 크롤러 리소스 차단 프로필 구성."""
+        if not self.config.resource_blocking:
+            return None
+        
+        return ResourceBlockProfile(
+            blocked_resource_types=tuple(
+                self.config.blocked_resource_types or DEFAULT_BLOCKED_RESOURCE_TYPES
+            ),
+            blocked_hosts=DEFAULT_BLOCKED_HOSTS + tuple(self.config.blocked_hosts),
+            allowed_hosts=DEFAULT_ALLOWED_HOSTS + tuple(self.config.allowed_hosts)
+        )
+    
     async def run_automation_cycle(self) -> dict:
         """전체 자동화 사이클을 실행하고 결과 반환."""
+        # 대상 목록 파일이 있으면 여러 카페/게시판을 한 번에 처리
+        if self.config.crawl_targets_defined and not Path('capture.txt').exists():
+            return await self.run_targets_cycle(self.config.crawl_targets)
+        
         results = {
             'success': False,
             'total_posts': 0,
@@ -70,6 +227,8 @@ class QOK6AutomationSystem:
             'error_message': None
         }
         
+        sheet_preparation: Optional[asyncio.Task] = None
+        
         try:
             self.logger.info("=== QOK6 자동화 사이클 시작 ===")
             
@@ -82,6 +241,9 @@ class QOK6AutomationSystem:
             else:
                 self.logger.info("capture.txt 파일 없음, 크롤링을 시작합니다")
                 
+                # 시트 인증과 참여자 목록 조회는 크롤링과 동시에 진행
+                sheet_preparation = self._start_sheet_preparation(self.google_sheets)
+                
                 # 1. 네이버 크롤러 초기화 및 로그인
                 await self.naver_crawler.initialize_browser()
                 login_success = await self.naver_crawler.login_to_naver()
@@ -89,34 +251,21 @@ class QOK6AutomationSystem:
                 if not login_success:
                     raise QOK6Exception("네이버 로그인에 실패했습니다")
                 
-                # 2. 게시글 크롤링
-                posts = await self.naver_crawler.crawl_cafe_posts(
-                    cafe_url=self.config.cafe_url,
-                    board_id=self.config.board_id,
-                    pages=self.config.crawl_pages
+                # 2~3. 게시글을 스트리밍으로 크롤링하며 주차별 제출자를 바로 누적
+                weekly_submissions, results['total_posts'] = await self.parser.extract_weekly_submissions_from_stream(
+                    self.naver_crawler.stream_cafe_posts(
+                        cafe_url=self.config.cafe_url,
+                        board_id=self.config.board_id,
+                        pages=self.config.crawl_pages,
+                        since=self.config.crawl_window_start
+                    )
                 )
-                results['total_posts'] = len(posts)
-                
-                # 3. 데이터 파싱
-                challenge_posts = self.parser.filter_challenge_posts(posts)
-                weekly_submissions = self.parser.extract_weekly_submissions(challenge_posts)
-            
-            # 파싱 결과 유효성 검증
-            if not self.parser.validate_parsing_result(weekly_submissions):
-                raise QOK6Exception("파싱 결과 유효성 검증에 실패했습니다")
-            
-            results['weeks_processed'] = len(weekly_submissions)
+                results['crawl_stats'] = self.naver_crawler.get_crawl_stats()
             
-            # 4. 구글 시트 연동
-            self.google_sheets.authenticate()
-            
-            # 참여자 목록 가져오기
-            participants = self.google_sheets.get_participants_list()
-            results['participants'] = participants
-            
-            # 5. 출석 현황 업데이트
-            update_success = self.google_sheets.update_attendance_from_submissions(weekly_submissions)
-            results['updated_cells'] = len(weekly_submissions) * len(participants) if update_success else 0
+            # 4~5. 구글 시트 연동 및 출석 현황 업데이트
+            await self._apply_submissions(
+                weekly_submissions, self.google_sheets, self.naver_crawler, results, sheet_preparation
+            )
             
             results['success'] = True
             self.logger.info("=== QOK6 자동화 사이클 완료 ===")
@@ -131,10 +280,215 @@ class QOK6AutomationSystem:
             
         finally:
             # 리소스 정리
+            # 크롤링 실패로 시트 단계까지 가지 않았으면 남은 시트 준비 작업 취소
+            if sheet_preparation and not sheet_preparation.done():
+                sheet_preparation.cancel()
             try:
                 await self.naver_crawler.close()
             except Exception as e:
                 self.logger.error(f"크롤러 종료 중 오류: {str(e)}")
+            self._close_shared_stores()
+    
+    def _close_shared_stores(self) -> None:
+        """대상들이 공유하는 저장소 정리 (모든 크롤러가 끝난 뒤 한 번만, 다음 실행에서 다시 열림)."""
+        content_cache = self._shared_crawler_options.get('content_cache')
+        if content_cache:
+            content_cache.close()
+    
+    def _start_sheet_preparation(self, google_sheets: AsyncGoogleSheetsService) -> asyncio.Task:
+        """시트 인증과 참여자 목록 조회를 백그라운드 태스크로 시작 (크롤링과 겹쳐 진행)."""
+        task = asyncio.ensure_future(self._prepare_sheet(google_sheets))
+        task.add_done_callback(self._log_sheet_preparation_error)
+        return task
+    
+    async def _prepare_sheet(self, google_sheets: AsyncGoogleSheetsService) -> List[str]:
+        """시트 인증 후 시트 인덱스를 새로 만들어 참여자 목록 조회."""
+        await google_sheets.authenticate()
+        # 실행 사이에 시트가 편집되었을 수 있으므로 실행마다 한 번 새로 읽음
+        google_sheets.invalidate_index()
+        return await google_sheets.get_participants_list()
+    
+    def _log_sheet_preparation_error(self, task: asyncio.Task) -> None:
+        """시트 단계까지 가지 않아 결과를 쓰지 않은 경우에도 준비 오류를 기록."""
+        if not task.cancelled() and task.exception():
+            self.logger.warning(f"시트 사전 준비 중 오류: {str(task.exception())}")
+    
+    async def _apply_submissions(
+        self,
+        weekly_submissions: Dict[int, Set[str]],
+        google_sheets: AsyncGoogleSheetsService,
+        crawler: NaverCrawlerService,
+        results: Dict[str, Any],
+        sheet_preparation: Optional[asyncio.Task] = None
+    ) -> None:
+        """주차별 제출자를 시트에 반영하고, 반영이 끝나면 크롤링 상태를 저장."""
+        # 증분/기간 제한 크롤링에서 새로 제출된 게시글이 없으면 시트 업데이트 생략
+        # (전체 크롤링의 빈 결과는 게시판 구조 변경 등일 수 있으므로 유효성 검증에서 실패 처리)
+        crawl_stats = results.get('crawl_stats', {})
+        filtered_crawl = 'incremental' in crawl_stats or 'date_window' in crawl_stats
+        if not weekly_submissions and filtered_crawl:
+            self.logger.info("새로 처리할 게시글이 없어 시트 업데이트를 생략합니다")
+            crawler.save_crawl_state()
+            return
+        
+        # 파싱 결과 유효성 검증
+        if not self.parser.validate_parsing_result(weekly_submissions):
+            raise QOK6Exception("파싱 결과 유효성 검증에 실패했습니다")
+        
+        results['weeks_processed'] = len(weekly_submissions)
+        
+        # 크롤링 중에 시작한 시트 인증/참여자 조회 결과를 사용 (없으면 지금 조회)
+        if sheet_preparation is None:
+            sheet_preparation = self._start_sheet_preparation(google_sheets)
+        participants = await sheet_preparation
+        results['participants'] = participants
+        
+        # 출석 현황 업데이트
+        update_success = await google_sheets.update_attendance_from_submissions(weekly_submissions)
+        results['sheet_writes'] = google_sheets.get_write_stats()
+        results['updated_cells'] = results['sheet_writes']['written']
+        results['sheet_dispatch'] = google_sheets.get_dispatch_stats()
+        
+        # 시트 반영이 끝난 게시글까지를 처리 완료로 기록 (쓰기 실패는 예외로 올라옴).
+        # 시트에서 찾지 못한 제출자만 있는 경우도 다시 크롤링해도 결과가 같으므로 처리 완료로 봄
+        if not update_success:
+            self.logger.warning(
+                f"시트에서 일치하는 셀을 찾지 못한 제출 {results['sheet_writes']['unmatched']}건은 "
+                f"반영하지 않고 처리 완료로 기록합니다"
+            )
+        crawler.save_crawl_state()
+    
+    async def run_targets_cycle(self, targets: List[CrawlTarget]) -> dict:
+        """여러 카페/게시판 대상을 하나의 브라우저와 로그인 세션으로 동시에 크롤링하고 대상별 시트에 반영."""
+        results: Dict[str, Any] = {
+            'success': False,
+            'total_posts': 0,
+            'updated_cells': 0,
+            'participants': [],
+            'weeks_processed': 0,
+            'error_message': None,
+            'targets': {}
+        }
+        
+        browser_pool = self._browser_pool
+        owns_pool = False
+        
+        try:
+            self.logger.info(f"=== QOK6 자동화 사이클 시작: 대상 {len(targets)}개 ===")
+            
+            concurrency = max(1, self.config.max_concurrent_targets)
+            
+            # 웹 서버 풀이 없으면 이번 실행 동안만 쓸 풀을 띄워 브라우저 하나를 공유
+            if browser_pool is None and self._crawler_class is NaverCrawlerService:
+                browser_pool = BrowserPool(
+                    size=min(concurrency, len(targets)),
+                    session_store=self.session_store,
+                    max_navigations=self.config.browser_pool_max_navigations,
+                    memory_limit_mb=self.config.browser_pool_memory_mb
+                )
+                await browser_pool.start()
+                owns_pool = True
+            
+            semaphore = asyncio.Semaphore(concurrency)
+            # 로그인은 한 번에 하나씩: 첫 대상이 갱신한 세션을 나머지가 이동 없이 재사용
+            login_lock = asyncio.Lock()
+            
+            target_results = await asyncio.gather(*(
+                self._run_target(target, browser_pool, semaphore, login_lock)
+                for target in targets
+            ))
+            
+            for target, target_result in zip(targets, target_results):
+                results['targets'][target.name] = target_result
+                results['total_posts'] += target_result['total_posts']
+                results['updated_cells'] += target_result['updated_cells']
+                results['weeks_processed'] += target_result['weeks_processed']
+            
+            failed = [
+                f"{target.name}: {target_result['error_message']}"
+                for target, target_result in zip(targets, target_results)
+                if not target_result['success']
+            ]
+            results['success'] = not failed
+            if failed:
+                results['error_message'] = "일부 대상 처리 실패 - " + "; ".join(failed)
+            
+            self.logger.info(f"=== QOK6 자동화 사이클 완료: 성공 {len(targets) - len(failed)}/{len(targets)} ===")
+            return results
+            
+        except Exception as e:
+            error_msg = f"자동화 사이클 실행 중 오류 발생: {str(e)}"
+            self.logger.error(error_msg)
+            results['error_message'] = error_msg
+            return results
+            
+        finally:
+            if owns_pool:
+                await browser_pool.close()
+            self._close_shared_stores()
+    
+    async def _run_target(
+        self,
+        target: CrawlTarget,
+        browser_pool: Optional[BrowserPool],
+        semaphore: asyncio.Semaphore,
+        login_lock: asyncio.Lock
+    ) -> Dict[str, Any]:
+        """대상 하나를 크롤링하고 대상의 시트에 반영."""
+        results: Dict[str, Any] = {
+            'success': False,
+            'cafe_url': target.cafe_url,
+            'board_id': target.board_id,
+            'total_posts': 0,
+            'updated_cells': 0,
+            'participants': [],
+            'weeks_processed': 0,
+            'error_message': None
+        }
+        crawler = self._create_crawler()
+        crawler.set_browser_pool(browser_pool)
+        
+        google_sheets = self._create_sheets_service(target.sheet_id)
+        # 시트 인증과 참여자 목록 조회는 차례를 기다리는 동안과 크롤링 중에 진행
+        sheet_preparation = self._start_sheet_preparation(google_sheets)
+        
+        try:
+            async with semaphore:
+                try:
+                    await crawler.initialize_browser()
+                    async with login_lock:
+                        if not await crawler.login_to_naver():
+                            raise QOK6Exception("네이버 로그인에 실패했습니다")
+                    
+                    weekly_submissions, results['total_posts'] = await self.parser.extract_weekly_submissions_from_stream(
+                        crawler.stream_cafe_posts(
+                            cafe_url=target.cafe_url,
+                            board_id=target.board_id,
+                            pages=target.pages,
+                            since=target.since
+                        )
+                    )
+                    results['crawl_stats'] = crawler.get_crawl_stats()
+                finally:
+                    # 시트 작업 전에 브라우저 컨텍스트를 반납하여 다른 대상이 사용하도록 함
+                    await crawler.close()
+            
+            await self._apply_submissions(weekly_submissions, google_sheets, crawler, results, sheet_preparation)
+            
+            results['success'] = True
+            self.logger.info(f"대상 '{target.name}' 처리 완료: 게시글 {results['total_posts']}개")
+            
+        except Exception as e:
+            results['error_message'] = str(e)
+            self.logger.error(f"대상 '{target.name}' 처리 중 오류: {str(e)}")
+        
+        finally:
+            # 대상별 시트 서비스의 연결 풀 정리 (크롤링 실패로 남은 준비 작업은 취소)
+            if not sheet_preparation.done():
+                sheet_preparation.cancel()
+            await google_sheets.aclose()
+        
+        return results
     
     async def run_scheduled_mode(self) -> None:
         """스케줄된 자동 실행 모드."""
@@ -144,10 +498,21 @@ class QOK6AutomationSystem:
         
         self.logger.info("스케줄된 자동 실행 모드 시작")
         
+        retries = 0
+        
         while True:
             try:
-                # 매일 00:00까지 대기
-                await self.scheduler.wait_until_scheduled_time(0, 0)
+                if retries:
+                    # 체크포인트가 남은 실패는 다음 날까지 기다리지 않고 이어서 다시 시도
+                    retry_minutes = self.config.checkpoint_retry_minutes
+                    self.logger.info(
+                        f"{retry_minutes:.0f}분 후 체크포인트에서 이어서 다시 시도합니다 "
+                        f"({retries}/{self.config.checkpoint_max_retries})"
+                    )
+                    await asyncio.sleep(retry_minutes * 60)
+                else:
+                    # 매일 00:00까지 대기
+                    await self.scheduler.wait_until_scheduled_time(0, 0)
                 
                 # 자동화 작업 실행
                 success = await self.scheduler.run_daily_task(
@@ -159,13 +524,29 @@ class QOK6AutomationSystem:
                 else:
                     self.logger.error("일일 자동화 작업 실패")
                 
+                retries = self._next_checkpoint_retry(retries, success)
+                
             except KeyboardInterrupt:
                 self.logger.info("사용자 요청으로 자동 실행 모드 종료")
                 break
             except Exception as e:
                 self.logger.error(f"스케줄된 실행 중 예상치 못한 오류: {str(e)}")
-                # 오류 발생 시 1시간 후 재시도
-                await asyncio.sleep(3600)
+                retries = self._next_checkpoint_retry(retries, success=False)
+                if not retries:
+                    # 오류 발생 시 1시간 후 재시도
+                    await asyncio.sleep(3600)
+    
+    def _next_checkpoint_retry(self, retries: int, success: bool) -> int:
+        """실패한 실행에 현재 대상의 체크포인트가 남았고 재시도 횟수가 남았으면 다음 재시도 번호를, 아니면 0을 반환."""
+        if success or not self.checkpoints:
+            return 0
+        boards = [(target.cafe_url, target.board_id) for target in self.config.crawl_targets]
+        if not self.checkpoints.has_pending(boards):
+            return 0
+        if retries >= self.config.checkpoint_max_retries:
+            self.logger.warning("체크포인트 재시도 횟수를 모두 사용하여 다음 정기 실행에서 이어서 크롤링합니다")
+            return 0
+        return retries + 1
     
     async def run_manual_mode(self) -> None:
         """수동 즉시 실행 모드."""
@@ -0,0 +1,205 @@
+"""브라우저 풀 모듈 - 웹 서버 프로세스에서 브라우저와 로그인된 컨텍스트를 재사용."""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional
+from playwright.async_api import async_playwright, Browser, BrowserContext, Playwright
+
+from ..core.logger import get_logger
+from ..core.exceptions import NaverCrawlerError
+from .memory import get_child_processes_rss_bytes
+from .session import SessionStateStore, has_valid_session_cookies
+
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+
+@dataclass
+class PooledContext:
+    """풀에서 빌려준 브라우저 컨텍스트와 누적 사용량."""
+
+    browser: Browser
+    context: BrowserContext
+    navigations: int = 0
+    runs: int = 0
+
+
+class BrowserPool:
+    """미리 실행한 브라우저와 로그인 세션이 담긴 컨텍스트를 실행마다 빌려주는 풀."""
+
+    def __init__(
+        self,
+        size: int = 1,
+        session_store: Optional[SessionStateStore] = None,
+        max_navigations: int = 300,
+        memory_limit_mb: int = 1024
+    ) -> None:
+        """컨텍스트 수와 재생성 기준(이동 횟수, 메모리)으로 풀 초기화."""
+        self._size = max(1, size)
+        self._session_store = session_store or SessionStateStore()
+        self._max_navigations = max_navigations
+        self._memory_limit_bytes = memory_limit_mb * 1024 * 1024
+        self._logger = get_logger(__name__)
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._idle: Optional[asyncio.Queue] = None
+        self._contexts: List[PooledContext] = []
+        self._lock = asyncio.Lock()
+        self._recycled_contexts = 0
+        self._restarted_browsers = 0
+
+    async def start(self) -> None:
+        """Playwright와 브라우저를 실행하고 컨텍스트를 미리 생성."""
+        try:
+            self._playwright = await async_playwright().start()
+            self._idle = asyncio.Queue()
+            await self._launch_browser()
+
+            for _ in range(self._size):
+                pooled = PooledContext(
+                    browser=self._browser,
+                    context=await self._new_context()
+                )
+                self._contexts.append(pooled)
+                self._idle.put_nowait(pooled)
+
+            self._logger.info(f"브라우저 풀 시작: 컨텍스트 {self._size}개")
+
+        except Exception as e:
+            await self.close()
+            raise NaverCrawlerError(f"브라우저 풀 시작 실패: {str(e)}")
+
+    async def acquire(self) -> PooledContext:
+        """건강한 컨텍스트 하나를 빌려줌 (브라우저가 죽었으면 다시 실행)."""
+        if self._idle is None:
+            raise NaverCrawlerError("브라우저 풀이 시작되지 않았습니다")
+
+        pooled = await self._idle.get()
+
+        try:
+            if not await self._is_healthy(pooled):
+                self._logger.warning("비정상 컨텍스트를 발견하여 다시 생성합니다")
+                pooled = await self._recycle(pooled, restart_browser=not self._browser.is_connected())
+        except Exception:
+            self._idle.put_nowait(pooled)
+            raise
+
+        pooled.runs += 1
+        return pooled
+
+    async def release(self, pooled: PooledContext, navigations: int = 0) -> None:
+        """컨텍스트를 반환하고, 이동 횟수나 메모리 기준을 넘으면 재생성."""
+        pooled.navigations += navigations
+
+        try:
+            memory_bytes = get_child_processes_rss_bytes()
+            # 다른 실행이 빌려 간 컨텍스트가 없을 때만 브라우저 전체를 재시작
+            others_idle = self._idle.qsize() == len(self._contexts) - 1
+            if memory_bytes is not None and memory_bytes > self._memory_limit_bytes and others_idle:
+                self._logger.info(
+                    f"브라우저 메모리 {memory_bytes / 1024 / 1024:.0f}MB가 기준을 넘어 브라우저를 재시작합니다"
+                )
+                pooled = await self._recycle(pooled, restart_browser=True)
+            elif pooled.navigations >= self._max_navigations:
+                self._logger.info(f"이동 {pooled.navigations}회에 도달하여 컨텍스트를 재생성합니다")
+                pooled = await self._recycle(pooled)
+        except Exception as e:
+            self._logger.error(f"컨텍스트 재생성 중 오류: {str(e)}")
+        finally:
+            self._idle.put_nowait(pooled)
+
+    async def _is_healthy(self, pooled: PooledContext) -> bool:
+        """브라우저 연결과 컨텍스트 사용 가능 여부 확인."""
+        if not self._browser or not self._browser.is_connected() or pooled.browser is not self._browser:
+            return False
+
+        try:
+            page = await pooled.context.new_page()
+            await page.close()
+            return True
+        except Exception:
+            return False
+
+    async def _recycle(self, pooled: PooledContext, restart_browser: bool = False) -> PooledContext:
+        """세션 저장 상태를 유지한 채 컨텍스트(필요하면 브라우저까지)를 새로 생성."""
+        async with self._lock:
+            # 로그인된 컨텍스트의 최신 세션을 공용 저장 상태에 반영한 뒤 새 컨텍스트에 복원
+            try:
+                state = await self._session_store.capture(pooled.context)
+                if has_valid_session_cookies(state['cookies']):
+                    self._session_store.save(state)
+            except Exception as e:
+                self._logger.debug(f"컨텍스트 세션 저장 중 오류: {str(e)}")
+
+            try:
+                await pooled.context.close()
+            except Exception:
+                pass
+
+            if restart_browser or not self._browser.is_connected():
+                await self._restart_browser()
+
+            fresh = PooledContext(browser=self._browser, context=await self._new_context())
+            self._contexts[self._contexts.index(pooled)] = fresh
+            self._recycled_contexts += 1
+            return fresh
+
+    async def _restart_browser(self) -> None:
+        """브라우저를 종료하고 다시 실행."""
+        try:
+            if self._browser and self._browser.is_connected():
+                await self._browser.close()
+        except Exception as e:
+            self._logger.debug(f"브라우저 종료 중 오류: {str(e)}")
+
+        await self._launch_browser()
+        self._restarted_browsers += 1
+
+    async def _launch_browser(self) -> None:
+        """헤드리스 Chromium 실행."""
+        self._browser = await self._playwright.chromium.launch(
+            headless=True,
+            args=['--no-sandbox', '--disable-dev-shm-usage']
+        )
+
+    async def _new_context(self) -> BrowserContext:
+        """User-Agent와 저장된 세션 상태를 적용한 컨텍스트 생성."""
+        context = await self._browser.new_context()
+        await context.set_extra_http_headers({'User-Agent': USER_AGENT})
+        await self._session_store.apply(context)
+        return context
+
+    def get_stats(self) -> Dict[str, Any]:
+        """풀 상태 통계 반환."""
+        memory_bytes = get_child_processes_rss_bytes()
+        return {
+            'contexts': len(self._contexts),
+            'idle_contexts': self._idle.qsize() if self._idle else 0,
+            'browser_connected': bool(self._browser and self._browser.is_connected()),
+            'navigations': [pooled.navigations for pooled in self._contexts],
+            'recycled_contexts': self._recycled_contexts,
+            'restarted_browsers': self._restarted_browsers,
+            'memory_mb': round(memory_bytes / 1024 / 1024, 1) if memory_bytes is not None else None
+        }
+
+    async def close(self) -> None:
+        """모든 컨텍스트와 브라우저, Playwright 종료."""
+        for pooled in self._contexts:
+            try:
+                await pooled.context.close()
+            except Exception:
+                pass
+        self._contexts = []
+        self._idle = None
+
+        try:
+            if self._browser:
+                await self._browser.close()
+            if self._playwright:
+                await self._playwright.stop()
+        except Exception as e:
+            self._logger.error(f"브라우저 풀 종료 중 오류: {str(e)}")
+
+        self._browser = None
+        self._playwright = None
+        self._logger.info("브라우저 풀 종료 완료")
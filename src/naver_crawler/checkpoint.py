@@ -0,0 +1,200 @@
+"""크롤링 체크포인트 모듈 - 완료한 목록 페이지, 수집한 게시글 행, 가져온 본문을 기록하여 실패 후 이어서 크롤링."""
+
+import hashlib
+import json
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Set, Tuple
+
+from ..core.logger import get_logger
+from .models import NaverPost
+
+
+@dataclass
+class CrawlCheckpoint:
+    """게시판 하나의 크롤링 진행 상황."""
+
+    cafe_url: str
+    board_id: str
+    pages: int
+    path: Path
+    completed_pages: Set[int] = field(default_factory=set)
+    list_finished: bool = False
+    posts: List[NaverPost] = field(default_factory=list)
+    fetched_ids: Set[str] = field(default_factory=set)
+
+    @property
+    def resumed(self) -> bool:
+        """이전 실행에서 이어받은 진행 상황이 있는지 여부."""
+        return bool(self.completed_pages or self.posts)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리 형태로 변환 (통계용)."""
+        return {
+            'resumed': self.resumed,
+            'completed_pages': sorted(self.completed_pages),
+            'list_finished': self.list_finished,
+            'restored_posts': len(self.posts),
+            'restored_contents': len(self.fetched_ids)
+        }
+
+
+class CrawlCheckpointStore:
+    """게시판별 체크포인트를 JSON Lines 파일에 덧붙여 기록하는 저장소.
+
+    한 줄이 하나의 기록(시작, 게시글 행, 완료 페이지, 본문, 목록 완료)이므로 실행 중 충돌로
+    마지막 줄이 잘려도 앞선 기록은 그대로 읽을 수 있다. 시트 반영까지 끝나면 삭제한다.
+    """
+
+    def __init__(self, checkpoint_dir: str = "data/checkpoints", max_age_hours: float = 12) -> None:
+        """체크포인트 디렉터리와 이어받을 수 있는 최대 경과 시간으로 저장소 초기화."""
+        self._checkpoint_dir = Path(checkpoint_dir)
+        self._max_age_seconds = max_age_hours * 3600
+        self._logger = get_logger(__name__)
+
+    def open(self, cafe_url: str, board_id: str, pages: int) -> CrawlCheckpoint:
+        """게시판의 체크포인트를 불러오고, 없거나 오래되었으면 새로 시작."""
+        path = self._make_path(cafe_url, board_id)
+        checkpoint = self._load(cafe_url, board_id, pages, path)
+        if checkpoint is not None:
+            self._logger.info(
+                f"체크포인트에서 이어서 크롤링: 완료 페이지 {sorted(checkpoint.completed_pages)}, "
+                f"게시글 {len(checkpoint.posts)}개, 본문 {len(checkpoint.fetched_ids)}개"
+            )
+            return checkpoint
+
+        checkpoint = CrawlCheckpoint(cafe_url=cafe_url, board_id=board_id, pages=pages, path=path)
+        self._write(checkpoint, [{
+            'type': 'start',
+            'cafe_url': cafe_url,
+            'board_id': board_id,
+            'pages': pages,
+            'started_at': time.time()
+        }], mode='w')
+        return checkpoint
+
+    def record_pages(self, checkpoint: CrawlCheckpoint, page_numbers: List[int], posts: List[NaverPost]) -> None:
+        """목록 페이지에서 수집한 게시글 행과 완료 페이지를 기록 (행을 먼저 써서 페이지 완료를 보장)."""
+        records = [dict(self._post_record(post), type='post') for post in posts]
+        records.extend({'type': 'page', 'page': page_num} for page_num in page_numbers)
+        self._write(checkpoint, records)
+
+    def record_content(self, checkpoint: CrawlCheckpoint, post: NaverPost) -> None:
+        """게시글 본문 하나를 기록."""
+        self._write(checkpoint, [{'type': 'content', 'post_id': post.post_id, 'content': post.content}])
+
+    def record_list_finished(self, checkpoint: CrawlCheckpoint) -> None:
+        """목록 수집이 끝났음을 기록 (이어서 크롤링할 때 목록 페이지를 다시 열지 않음)."""
+        self._write(checkpoint, [{'type': 'list_finished'}])
+
+    def discard(self, checkpoint: CrawlCheckpoint) -> None:
+        """처리가 끝난 게시판의 체크포인트 삭제."""
+        try:
+            checkpoint.path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self._logger.error(f"체크포인트 삭제 중 오류: {str(e)}")
+
+    def has_pending(self, boards: List[Tuple[str, str]]) -> bool:
+        """주어진 (카페 URL, 게시판 ID) 중 처리가 끝나지 않아 이어서 크롤링할 체크포인트가 있는지 확인.
+
+        대상 목록에서 빠진 게시판의 오래된 체크포인트는 이어받을 실행이 없으므로 세지 않는다.
+        """
+        try:
+            return any(self._make_path(cafe_url, board_id).exists() for cafe_url, board_id in boards)
+        except OSError:
+            return False
+
+    def _load(self, cafe_url: str, board_id: str, pages: int, path: Path) -> Optional[CrawlCheckpoint]:
+        """체크포인트 파일을 읽어 진행 상황 복원 (사용할 수 없으면 None)."""
+        try:
+            if not path.exists():
+                return None
+            with open(path, 'r', encoding='utf-8') as f:
+                lines = f.read().splitlines()
+        except Exception as e:
+            self._logger.error(f"체크포인트 로드 중 오류: {str(e)}")
+            return None
+
+        records = []
+        for line in lines:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                # 기록 중 중단되어 잘린 줄은 무시
+                self._logger.warning(f"체크포인트의 손상된 기록을 건너뜁니다: {path}")
+
+        if not records or records[0].get('type') != 'start':
+            return None
+
+        header = records[0]
+        if header.get('cafe_url') != cafe_url or header.get('board_id') != board_id:
+            return None
+        if time.time() - header.get('started_at', 0) > self._max_age_seconds:
+            self._logger.info("체크포인트가 오래되어 처음부터 크롤링합니다")
+            return None
+
+        checkpoint = CrawlCheckpoint(cafe_url=cafe_url, board_id=board_id, pages=pages, path=path)
+        contents: Dict[str, str] = {}
+        for record in records[1:]:
+            record_type = record.get('type')
+            try:
+                if record_type == 'post':
+                    checkpoint.posts.append(self._restore_post(record))
+                elif record_type == 'page':
+                    checkpoint.completed_pages.add(int(record['page']))
+                elif record_type == 'content':
+                    contents[record['post_id']] = record['content']
+                elif record_type == 'list_finished':
+                    # 요청한 페이지 수가 달라졌으면 남은 페이지를 이어서 수집
+                    checkpoint.list_finished = header.get('pages') == pages
+            except (KeyError, TypeError, ValueError) as e:
+                self._logger.warning(f"체크포인트 기록 복원 중 오류: {str(e)}")
+
+        for post in checkpoint.posts:
+            if post.post_id in contents:
+                post.content = contents[post.post_id]
+        checkpoint.fetched_ids = set(contents)
+        return checkpoint
+
+    def _write(self, checkpoint: CrawlCheckpoint, records: List[Dict[str, Any]], mode: str = 'a') -> None:
+        """기록을 한 줄씩 파일에 덧붙임 (쓰기 실패는 크롤링을 중단하지 않음)."""
+        try:
+            checkpoint.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(checkpoint.path, mode, encoding='utf-8') as f:
+                for record in records:
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                f.flush()
+        except Exception as e:
+            self._logger.error(f"체크포인트 기록 중 오류: {str(e)}")
+
+    def _post_record(self, post: NaverPost) -> Dict[str, Any]:
+        """게시글 행을 기록용 딕셔너리로 변환 (본문은 따로 기록)."""
+        return {
+            'title': post.title,
+            'author': post.author,
+            'post_id': post.post_id,
+            'created_at': post.created_at.isoformat(),
+            'post_url': post.post_url,
+            'view_count': post.view_count
+        }
+
+    def _restore_post(self, record: Dict[str, Any]) -> NaverPost:
+        """기록된 게시글 행으로 NaverPost 복원."""
+        return NaverPost(
+            title=record['title'],
+            author=record['author'],
+            content="",
+            post_id=record['post_id'],
+            created_at=datetime.fromisoformat(record['created_at']),
+            post_url=record.get('post_url'),
+            view_count=record.get('view_count')
+        )
+
+    def _make_path(self, cafe_url: str, board_id: str) -> Path:
+        """카페 URL과 게시판 ID로 체크포인트 파일 경로 생성."""
+        key = f"{cafe_url.rstrip('/')}|{board_id}"
+        return self._checkpoint_dir / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.jsonl"
@@ -0,0 +1,159 @@
+"""게시글 본문 캐시 모듈 - post_id와 목록 행 지문으로 상세 페이지 재수집을 줄임."""
+
+import hashlib
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+
+from ..core.logger import get_logger
+from .models import NaverPost
+
+
+def compute_post_fingerprint(post: NaverPost) -> str:
+    """목록 행의 제목, 조회수, 작성일로 게시글 지문 생성."""
+    raw = f"{post.title}|{post.view_count}|{post.created_at.isoformat()}"
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+@dataclass
+class ContentCacheStats:
+    """본문 캐시 적중/실패 통계."""
+
+    hits: int = 0
+    misses: int = 0
+    stale: int = 0
+    evicted: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리 형태로 변환."""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'stale': self.stale,
+            'evicted': self.evicted,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0
+        }
+
+
+class PostContentCache:
+    """SQLite에 게시글 본문을 저장하고 TTL과 용량 제한으로 관리하는 캐시.
+
+    여러 크롤러가 함께 쓸 수 있으므로 조회/정리 시 크롤러의 통계를 넘기면 그 통계에도 집계한다.
+    """
+
+    def __init__(
+        self,
+        db_path: str = "data/post_cache.db",
+        ttl_hours: float = 168,
+        max_bytes: int = 50 * 1024 * 1024
+    ) -> None:
+        """캐시 DB 경로, 만료 시간, 최대 용량으로 초기화."""
+        self._db_path = Path(db_path)
+        self._ttl_seconds = ttl_hours * 3600
+        self._max_bytes = max_bytes
+        self._logger = get_logger(__name__)
+        self._connection: Optional[sqlite3.Connection] = None
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        """전체 적중/실패 카운터 초기화."""
+        self.stats = ContentCacheStats()
+
+    def get(self, post_id: str, fingerprint: str, stats: Optional[ContentCacheStats] = None) -> Optional[str]:
+        """지문이 같고 만료되지 않은 본문이 있으면 반환."""
+        targets = self._stats_targets(stats)
+        row = self._get_connection().execute(
+            "SELECT content, fingerprint, fetched_at FROM post_contents WHERE post_id = ?",
+            (post_id,)
+        ).fetchone()
+
+        if row is None:
+            for target in targets:
+                target.misses += 1
+            return None
+
+        content, cached_fingerprint, fetched_at = row
+        if cached_fingerprint != fingerprint or time.time() - fetched_at > self._ttl_seconds:
+            for target in targets:
+                target.stale += 1
+                target.misses += 1
+            return None
+
+        for target in targets:
+            target.hits += 1
+        return content
+
+    def put(self, post_id: str, fingerprint: str, content: str) -> None:
+        """게시글 본문을 캐시에 저장 (기존 항목은 교체)."""
+        connection = self._get_connection()
+        connection.execute(
+            "INSERT OR REPLACE INTO post_contents "
+            "(post_id, content, fingerprint, fetched_at, size) VALUES (?, ?, ?, ?, ?)",
+            (post_id, content, fingerprint, time.time(), len(content.encode('utf-8')))
+        )
+        connection.commit()
+
+    def evict(self, stats: Optional[ContentCacheStats] = None) -> int:
+        """전체 용량이 최대치를 넘으면 오래 전에 수집한 항목부터 삭제."""
+        connection = self._get_connection()
+        total_bytes = connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM post_contents"
+        ).fetchone()[0]
+
+        if total_bytes <= self._max_bytes:
+            return 0
+
+        removed = 0
+        rows = connection.execute(
+            "SELECT post_id, size FROM post_contents ORDER BY fetched_at ASC"
+        ).fetchall()
+
+        for post_id, size in rows:
+            if total_bytes <= self._max_bytes:
+                break
+            connection.execute("DELETE FROM post_contents WHERE post_id = ?", (post_id,))
+            total_bytes -= size
+            removed += 1
+
+        connection.commit()
+        for target in self._stats_targets(stats):
+            target.evicted += removed
+        self._logger.info(f"본문 캐시 용량 초과로 {removed}개 항목 삭제")
+        return removed
+
+    def get_stats(self, stats: Optional[ContentCacheStats] = None) -> Dict[str, Any]:
+        """캐시 통계 반환 (stats가 없으면 전체 통계)."""
+        return (stats or self.stats).to_dict()
+
+    def _stats_targets(self, stats: Optional[ContentCacheStats]) -> Tuple[ContentCacheStats, ...]:
+        """집계할 통계 목록 (전체 통계와, 있으면 호출한 크롤러의 통계)."""
+        return (self.stats,) if stats is None else (self.stats, stats)
+
+    def close(self) -> None:
+        """DB 연결 종료."""
+        if self._connection:
+            self._connection.close()
+            self._connection = None
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """DB 연결을 열고 테이블이 없으면 생성."""
+        if self._connection is None:
+            self._db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(str(self._db_path))
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS post_contents ("
+                "post_id TEXT PRIMARY KEY, "
+                "content TEXT NOT NULL, "
+                "fingerprint TEXT NOT NULL, "
+                "fetched_at REAL NOT NULL, "
+                "size INTEGER NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_post_contents_fetched_at "
+                "ON post_contents (fetched_at)"
+            )
+            self._connection.commit()
+        return self._connection
@@ -0,0 +1,74 @@
+"""크롤링 상태 저장 모듈 - 게시판별로 처리 완료한 최대 게시글 ID를 보관."""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from ..core.logger import get_logger
+from ..shared.utils import get_kst_now
+
+
+class CrawlStateStore:
+    """카페 URL과 게시판 ID별 최고 수위(high-water mark)를 JSON 파일에 저장하는 저장소."""
+
+    def __init__(self, state_path: str = "data/crawl_state.json") -> None:
+        """상태 파일 경로로 저장소 초기화."""
+        self._state_path = Path(state_path)
+        self._logger = get_logger(__name__)
+
+    def get_high_water_mark(self, cafe_url: str, board_id: str) -> Optional[int]:
+        """게시판에서 이미 처리한 가장 큰 게시글 ID 반환 (없으면 None)."""
+        entry = self._load_state().get(self._make_key(cafe_url, board_id))
+        if not entry:
+            return None
+        return entry.get('last_post_id')
+
+    def update_high_water_mark(self, cafe_url: str, board_id: str, post_id: int) -> None:
+        """게시판의 최고 수위를 갱신 (기존 값보다 클 때만)."""
+        state = self._load_state()
+        key = self._make_key(cafe_url, board_id)
+        current = (state.get(key) or {}).get('last_post_id')
+
+        if current is not None and current >= post_id:
+            return
+
+        state[key] = {
+            'cafe_url': cafe_url,
+            'board_id': board_id,
+            'last_post_id': post_id,
+            'updated_at': get_kst_now().isoformat()
+        }
+        self._save_state(state)
+        self._logger.info(f"크롤링 상태 갱신: {key} -> 게시글 ID {post_id}")
+
+    def _make_key(self, cafe_url: str, board_id: str) -> str:
+        """카페 URL과 게시판 ID로 상태 키 생성."""
+        return f"{cafe_url.rstrip('/')}|{board_id}"
+
+    def _load_state(self) -> Dict[str, Any]:
+        """상태 파일에서 데이터 로드."""
+        try:
+            if not self._state_path.exists():
+                return {}
+
+            with open(self._state_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+
+        except Exception as e:
+            self._logger.error(f"크롤링 상태 파일 로드 중 오류: {str(e)}")
+            return {}
+
+    def _save_state(self, state: Dict[str, Any]) -> None:
+        """상태 데이터를 임시 파일에 쓴 뒤 교체하여 원자적으로 저장."""
+        try:
+            self._state_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self._state_path.with_suffix('.tmp')
+
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f, ensure_ascii=False, indent=2)
+
+            os.replace(temp_path, self._state_path)
+
+        except Exception as e:
+            self._logger.error(f"크롤링 상태 파일 저장 중 오류: {str(e)}")
@@ -0,0 +1,241 @@
+"""게시판 목록 추출 모듈 - 선택자 체인을 브라우저에 한 번에 보내 행 데이터를 수집."""
+
+import re
+from typing import Any, Dict, List, Optional, Tuple, Union
+from bs4 import BeautifulSoup, Tag
+from playwright.async_api import Frame, Page
+
+
+# 게시글 목록 선택자 (최신 네이버 카페 구조부터 일반적인 목록 순)
+LIST_SELECTORS: List[str] = [
+    ".article-board tbody tr",  # 기존 구조
+    ".ArticleItem",  # 새로운 구조 1
+    ".post-item",    # 새로운 구조 2
+    "[data-article-id]",  # data attribute 기반
+    "article",       # semantic HTML
+    ".list-item"     # 일반적인 목록
+]
+
+# 게시글 번호 선택자 (테이블의 첫 번째 열에서 게시글 번호 추출)
+POST_ID_SELECTORS: List[str] = [
+    "td:first-child",             # 첫 번째 td (가장 가능성 높음)
+    ".td_num",                    # 번호 전용 클래스가 있을 경우
+    ".board-number"               # 기존 선택자
+]
+
+# 제목 선택자 (개발자 도구 기반 정확한 선택자)
+TITLE_SELECTORS: List[str] = [
+    "a.article",                 # a태그에 article 클래스 (정확한 선택자!)
+    ".article",                  # article 클래스 직접
+    "a[href*='articles']",       # articles가 포함된 링크
+    "td:nth-child(2) a",         # 두 번째 td의 링크
+    "a[href*='ArticleRead']"     # 기존 선택자
+]
+
+# 작성자 선택자 (세 번째 열에 작성자가 있음)
+AUTHOR_SELECTORS: List[str] = [
+    "td:nth-child(3) a",         # 세 번째 td의 링크 (가장 가능성 높음)
+    "td:nth-child(3)",           # 세 번째 td 자체
+    ".td_name .p-nick a",        # 기존 선택자
+    ".p-nick a",                 # 직접 선택자
+    ".writer",                   # 일반적인 작성자
+    ".author"                    # 작성자
+]
+
+# 작성일 선택자 (네 번째 열)
+DATE_SELECTORS: List[str] = [
+    "td:nth-child(4)",           # 네 번째 td (날짜 열)
+    ".td_date"                   # 기존 선택자
+]
+
+# 조회수 선택자 (다섯 번째 열)
+VIEW_SELECTORS: List[str] = [
+    "td:nth-child(5)",           # 다섯 번째 td (조회수 열)
+    ".td_view"                   # 기존 선택자
+]
+
+# 상세 페이지 본문 선택자 (스마트에디터 ONE부터 구 에디터 순)
+CONTENT_SELECTORS: List[str] = [
+    ".se-main-container",  # 스마트에디터 ONE
+    ".ContentRenderer",     # 새로운 에디터
+    "#postViewArea",       # 구 에디터
+    ".NHN_Writeform_Main", # 구 에디터2
+    ".content.CafeViewer"  # 모바일 에디터
+]
+
+# 게시글 링크 선택자 (href에서 게시글 ID를 추출할 때 사용)
+ARTICLE_LINK_SELECTOR = "a.article"
+
+# 게시글 행이 없어도 게시판 구조가 있다고 판단할 컨테이너 (빈 페이지와 구조 변경 구분용)
+BOARD_CONTAINER_SELECTOR = ".article-board"
+
+# 구형 카페 구조에서 게시판/본문을 담는 iframe
+CAFE_IFRAME_SELECTOR = "iframe#cafe_main"
+
+# 브라우저 안에서 실행되어 모든 행을 JSON 배열로 돌려주는 스크립트.
+# 선택자 우선순위와 "첫 번째로 매칭된 요소" 규칙은 기존 요소 단위 크롤링과 동일하다.
+# post_id_texts/view_texts는 전달받은 체인 순서를 따르고, matched에는 필드별로 매칭된 선택자가 담긴다.
+EXTRACT_BOARD_ROWS_SCRIPT = """
+(chains) => {
+    const firstMatch = (root, selectors) => {
+        for (const selector of selectors) {
+            const element = root.querySelector(selector);
+            if (element) {
+                return {selector: selector, element: element};
+            }
+        }
+        return {selector: null, element: null};
+    };
+    const textOf = (element) => (element ? element.innerText : null);
+
+    let rows = [];
+    let listSelector = null;
+    for (const selector of chains.list) {
+        const found = document.querySelectorAll(selector);
+        if (found.length) {
+            rows = Array.from(found);
+            listSelector = selector;
+            break;
+        }
+    }
+
+    return {
+        list_selector: listSelector,
+        body_text: rows.length ? null : (document.body ? document.body.innerText : ""),
+        rows: rows.map((row) => {
+            const title = firstMatch(row, chains.title);
+            const author = firstMatch(row, chains.author);
+            const date = firstMatch(row, chains.date);
+            const articleLink = row.querySelector(chains.article_link);
+            return {
+                class_name: row.getAttribute("class"),
+                text: row.innerText,
+                post_id_texts: chains.post_id.map((s) => textOf(row.querySelector(s))),
+                article_href: articleLink ? articleLink.getAttribute("href") : null,
+                has_title: title.element !== null,
+                title: textOf(title.element),
+                title_href: title.element ? title.element.getAttribute("href") : null,
+                author: textOf(author.element),
+                date_text: textOf(date.element),
+                view_texts: chains.view.map((s) => textOf(row.querySelector(s))),
+                matched: {title: title.selector, author: author.selector, date: date.selector}
+            };
+        })
+    };
+}
+"""
+
+
+def build_selector_chains(
+    orders: Optional[Dict[str, List[str]]] = None
+) -> Dict[str, Union[str, List[str]]]:
+    """브라우저로 전달할 필드별 선택자 체인 구성 (orders로 필드별 시도 순서를 바꿀 수 있음)."""
+    chains: Dict[str, Union[str, List[str]]] = {
+        'list': LIST_SELECTORS,
+        'post_id': POST_ID_SELECTORS,
+        'title': TITLE_SELECTORS,
+        'author': AUTHOR_SELECTORS,
+        'date': DATE_SELECTORS,
+        'view': VIEW_SELECTORS,
+        'article_link': ARTICLE_LINK_SELECTOR
+    }
+    if orders:
+        chains.update(orders)
+    return chains
+
+
+async def extract_board_rows(
+    frame: Union[Page, Frame],
+    chains: Optional[Dict[str, Union[str, List[str]]]] = None
+) -> Dict[str, Any]:
+    """게시판 목록의 모든 행을 한 번의 evaluate 호출로 추출."""
+    return await frame.evaluate(EXTRACT_BOARD_ROWS_SCRIPT, chains or build_selector_chains())
+
+
+def _inner_text(element: Optional[Tag]) -> Optional[str]:
+    """브라우저 innerText와 비슷하게 공백을 정리한 텍스트 반환."""
+    if element is None:
+        return None
+    return re.sub(r'\s+', ' ', element.get_text(' ')).strip()
+
+
+def _first_match(root: Tag, selectors: List[str]) -> Tuple[Optional[str], Optional[Tag]]:
+    """선택자 체인에서 처음으로 매칭된 선택자와 요소 반환."""
+    for selector in selectors:
+        element = root.select_one(selector)
+        if element is not None:
+            return selector, element
+    return None, None
+
+
+def parse_html(html: Union[str, bytes]) -> BeautifulSoup:
+    """HTML을 lxml 파서로 파싱 (bytes면 문서의 charset 선언을 따름)."""
+    return BeautifulSoup(html, 'lxml')
+
+
+def find_cafe_iframe_src(soup: BeautifulSoup) -> Optional[str]:
+    """구형 카페 구조의 #cafe_main iframe 주소 반환."""
+    iframe = soup.select_one(CAFE_IFRAME_SELECTOR)
+    return iframe.get('src') if iframe is not None else None
+
+
+def extract_board_rows_from_html(
+    soup: BeautifulSoup,
+    chains: Optional[Dict[str, Union[str, List[str]]]] = None
+) -> Dict[str, Any]:
+    """브라우저 없이 HTML에서 게시판 행을 추출 (extract_board_rows와 같은 형태로 반환)."""
+    chains = chains or build_selector_chains()
+
+    rows: List[Tag] = []
+    list_selector = None
+    for selector in chains['list']:
+        found = soup.select(selector)
+        if found:
+            rows = found
+            list_selector = selector
+            break
+
+    extracted_rows = []
+    for row in rows:
+        title_selector, title_element = _first_match(row, chains['title'])
+        author_selector, author_element = _first_match(row, chains['author'])
+        date_selector, date_element = _first_match(row, chains['date'])
+        article_link = row.select_one(chains['article_link'])
+        class_names = row.get('class')
+        extracted_rows.append({
+            'class_name': " ".join(class_names) if class_names else None,
+            'text': _inner_text(row),
+            'post_id_texts': [_inner_text(row.select_one(s)) for s in chains['post_id']],
+            'article_href': article_link.get('href') if article_link is not None else None,
+            'has_title': title_element is not None,
+            'title': _inner_text(title_element),
+            'title_href': title_element.get('href') if title_element is not None else None,
+            'author': _inner_text(author_element),
+            'date_text': _inner_text(date_element),
+            'view_texts': [_inner_text(row.select_one(s)) for s in chains['view']],
+            'matched': {'title': title_selector, 'author': author_selector, 'date': date_selector}
+        })
+
+    return {
+        'list_selector': list_selector,
+        'has_board': bool(rows) or soup.select_one(BOARD_CONTAINER_SELECTOR) is not None,
+        'rows': extracted_rows
+    }
+
+
+def extract_content_from_html(
+    soup: BeautifulSoup,
+    selectors: Optional[List[str]] = None
+) -> Tuple[Optional[str], Optional[str]]:
+    """브라우저 없이 HTML에서 게시글 본문과 매칭된 선택자 추출 (본문 영역이 없으면 본문 None)."""
+    found_container = False
+    for selector in selectors or CONTENT_SELECTORS:
+        element = soup.select_one(selector)
+        if element is None:
+            continue
+        found_container = True
+        content = element.get_text('\n', strip=True)
+        if content:
+            return content, selector
+
+    return ("" if found_container else None), None
@@ -0,0 +1,275 @@
+"""브라우저 없는 HTTP 크롤러 모듈 - 저장된 쿠키로 게시판/게시글 HTML을 직접 수집."""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import List, Optional, Any, Set, AsyncIterator, Awaitable, Callable
+from urllib.parse import urljoin, urlparse
+
+import httpx
+from bs4 import BeautifulSoup
+
+from ..core.logger import log_execution_time
+from ..core.exceptions import NaverCrawlerError, PageStructureError
+from .models import NaverPost
+from .service import NaverCrawlerService
+from .session import has_valid_session_cookies
+from .rate_limiter import is_blocked_url
+from .extraction import (
+    CONTENT_SELECTORS,
+    build_selector_chains,
+    parse_html,
+    find_cafe_iframe_src,
+    extract_board_rows_from_html,
+    extract_content_from_html
+)
+
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+
+class NaverHttpCrawlerService(NaverCrawlerService):
+    """저장된 로그인 쿠키와 비동기 HTTP 클라이언트로 크롤링하고, 구조를 인식하지 못하면 Playwright로 전환하는 크롤러."""
+
+    def __init__(
+        self,
+        naver_id: str,
+        naver_password: str,
+        max_connections: int = 10,
+        request_timeout: float = 15.0,
+        **kwargs: Any
+    ) -> None:
+        """Playwright 크롤러와 같은 설정에 HTTP 연결 풀 설정을 더해 초기화."""
+        super().__init__(naver_id, naver_password, **kwargs)
+        self._max_connections = max(1, max_connections)
+        self._request_timeout = request_timeout
+        self._client: Optional[httpx.AsyncClient] = None
+        self._browser_ready = False
+        self._use_browser = False
+
+    @log_execution_time
+    async def initialize_browser(self) -> None:
+        """브라우저 대신 연결 풀을 쓰는 HTTP 클라이언트를 준비 (브라우저는 필요할 때만 실행)."""
+        self._waiter.reset_stats()
+        self._client = httpx.AsyncClient(
+            headers={'User-Agent': USER_AGENT},
+            cookies=self._load_cookies(),
+            limits=httpx.Limits(
+                max_connections=self._max_connections,
+                max_keepalive_connections=self._max_connections
+            ),
+            timeout=self._request_timeout,
+            follow_redirects=True
+        )
+        self._use_browser = False
+        self._logger.info("HTTP 크롤러 초기화 완료")
+
+    @log_execution_time
+    async def login_to_naver(self, max_retries: int = 3) -> bool:
+        """저장된 로그인 쿠키가 있으면 브라우저 없이 진행하고, 없으면 브라우저로 로그인."""
+        if not self._client:
+            raise NaverCrawlerError("HTTP 크롤러가 초기화되지 않았습니다")
+
+        if has_valid_session_cookies(self._session_store.get_cookies()):
+            self._logger.info("저장된 로그인 쿠키로 HTTP 크롤링을 진행합니다")
+            return True
+
+        self._logger.info("유효한 로그인 쿠키가 없어 브라우저로 로그인합니다")
+        await self._ensure_browser(max_retries)
+        return True
+
+    async def stream_cafe_posts(
+        self,
+        cafe_url: str,
+        board_id: str,
+        pages: int = 3,
+        since: Optional[datetime] = None
+    ) -> AsyncIterator[NaverPost]:
+        """HTTP로 게시판을 스트리밍 크롤링하고, 게시판 구조를 찾지 못하면 Playwright로 다시 크롤링.
+
+        전환 전에 이미 내보낸 게시글은 Playwright로 다시 크롤링할 때 건너뛴다.
+        """
+        yielded_ids: Set[str] = set()
+        try:
+            async for post in super().stream_cafe_posts(cafe_url, board_id, pages, since):
+                yielded_ids.add(post.post_id)
+                yield post
+            return
+        except PageStructureError as e:
+            if self._use_browser:
+                raise
+            self._logger.warning(f"HTML에서 게시판 구조를 찾지 못해 Playwright로 전환합니다: {str(e)}")
+
+        await self._ensure_browser()
+        self._use_browser = True
+        async for post in super().stream_cafe_posts(cafe_url, board_id, pages, since):
+            if post.post_id not in yielded_ids:
+                yield post
+
+    def _ensure_ready(self) -> None:
+        """HTTP 클라이언트 또는 브라우저가 준비되었는지 확인."""
+        if self._use_browser:
+            super()._ensure_ready()
+        elif not self._client:
+            raise NaverCrawlerError("HTTP 크롤러가 초기화되지 않았습니다")
+
+    @asynccontextmanager
+    async def _list_page_fetcher(
+        self,
+        cafe_url: str,
+        board_id: str,
+        worker_count: int
+    ) -> AsyncIterator[Callable[[int], Awaitable[List[NaverPost]]]]:
+        """HTTP로 목록 페이지를 가져오는 수집 함수 제공 (브라우저 전환 후에는 페이지 풀 사용)."""
+        if self._use_browser:
+            async with super()._list_page_fetcher(cafe_url, board_id, worker_count) as fetch_page:
+                yield fetch_page
+            return
+
+        semaphore = asyncio.Semaphore(worker_count)
+        base_url = self._origin_of(cafe_url)
+
+        async def fetch_page(page_num: int) -> List[NaverPost]:
+            async with semaphore:
+                return await self._fetch_board_page(cafe_url, board_id, page_num, base_url)
+
+        yield fetch_page
+
+    async def _fetch_board_page(
+        self,
+        cafe_url: str,
+        board_id: str,
+        page_num: int,
+        base_url: str
+    ) -> List[NaverPost]:
+        """목록 페이지 HTML을 가져와 게시글로 변환 (게시판 구조가 없으면 PageStructureError)."""
+        board_url = f"{cafe_url}/{board_id}?page={page_num}"
+        soup = await self._fetch_document(board_url)
+
+        chains = build_selector_chains()
+        extracted = extract_board_rows_from_html(soup, chains)
+        self._record_board_selectors(extracted, chains)
+        if not extracted['has_board']:
+            raise PageStructureError(f"페이지 {page_num}에서 게시판 구조를 찾을 수 없습니다: {board_url}")
+
+        posts = []
+        for idx, row in enumerate(extracted['rows']):
+            try:
+                post = self._build_post_from_row(row, idx, base_url)
+                if post:
+                    posts.append(post)
+            except Exception as e:
+                self._logger.error(f"게시글 {idx+1} 파싱 중 오류: {str(e)}")
+
+        self._logger.info(f"페이지 {page_num}에서 {len(posts)}개 게시글 수집 (HTTP)")
+        return posts
+
+    async def _fetch_contents(self, targets: List[NaverPost]) -> None:
+        """HTTP로 본문을 병렬 수집하고, 본문 영역을 찾지 못한 게시글만 브라우저로 수집."""
+        if self._use_browser:
+            await super()._fetch_contents(targets)
+            return
+
+        semaphore = asyncio.Semaphore(self._detail_concurrency)
+        self._logger.info(f"총 {len(targets)}개 게시글의 상세 내용 HTTP 수집 시작")
+
+        async def fetch(post: NaverPost) -> bool:
+            async with semaphore:
+                try:
+                    soup = await self._fetch_document(post.post_url)
+                except Exception as e:
+                    self._logger.error(f"게시글 {post.post_id} HTTP 수집 중 오류: {str(e)}")
+                    return False
+
+            content, matched_selector = extract_content_from_html(soup)
+            if content is None:
+                return False
+
+            self._record_selector('content', matched_selector, CONTENT_SELECTORS)
+
+            post.content = content
+            if content:
+                self._store_fetched_content(post)
+            return True
+
+        results = await asyncio.gather(*(fetch(post) for post in targets))
+        unresolved = [post for post, resolved in zip(targets, results) if not resolved]
+
+        if unresolved:
+            self._logger.warning(f"{len(unresolved)}개 게시글은 HTML에서 본문을 찾지 못해 브라우저로 수집합니다")
+            await self._ensure_browser()
+            await super()._fetch_contents(unresolved)
+
+    async def _fetch_document(self, url: str) -> BeautifulSoup:
+        """문서를 가져와 파싱하고, 구형 카페 iframe이 있으면 iframe 문서를 대신 반환."""
+        response = await self._get(url)
+        response.raise_for_status()
+        soup = parse_html(response.content)
+
+        iframe_src = find_cafe_iframe_src(soup)
+        if iframe_src:
+            iframe_response = await self._get(urljoin(str(response.url), iframe_src))
+            iframe_response.raise_for_status()
+            soup = parse_html(iframe_response.content)
+
+        return soup
+
+    async def _get(self, url: str) -> httpx.Response:
+        """속도 제한기의 허용을 받아 GET 요청하고, 응답 결과를 속도 제한기에 알림."""
+        if not self._rate_limiter:
+            return await self._client.get(url)
+
+        async with self._rate_limiter.slot(self._rate_limit_stats):
+            started = time.perf_counter()
+            response = None
+            try:
+                response = await self._client.get(url)
+                return response
+            finally:
+                self._rate_limiter.record(
+                    (time.perf_counter() - started) * 1000,
+                    status=response.status_code if response is not None else None,
+                    blocked=response is not None and is_blocked_url(str(response.url)),
+                    stats=self._rate_limit_stats
+                )
+
+    async def _ensure_browser(self, max_retries: int = 3) -> None:
+        """Playwright 폴백이 필요할 때 브라우저를 실행하고 로그인."""
+        if self._browser_ready:
+            return
+
+        await super().initialize_browser()
+        if not await super().login_to_naver(max_retries):
+            raise NaverCrawlerError("Playwright 폴백 로그인에 실패했습니다")
+
+        # 브라우저 로그인으로 갱신된 쿠키를 HTTP 클라이언트에도 반영
+        if self._client:
+            self._client.cookies = self._load_cookies()
+        self._browser_ready = True
+
+    def _load_cookies(self) -> httpx.Cookies:
+        """저장된 쿠키를 HTTP 클라이언트 쿠키로 변환."""
+        cookies = httpx.Cookies()
+        for cookie in self._session_store.get_cookies():
+            cookies.set(
+                cookie['name'],
+                cookie['value'],
+                domain=cookie.get('domain', ''),
+                path=cookie.get('path', '/')
+            )
+        return cookies
+
+    def _origin_of(self, url: str) -> str:
+        """URL의 scheme://host 부분 반환 (상대 링크 해석용)."""
+        parsed = urlparse(url)
+        return f"{parsed.scheme}://{parsed.netloc}"
+
+    async def close(self) -> None:
+        """HTTP 클라이언트와 (실행된 경우) 브라우저 리소스 정리."""
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+
+        self._browser_ready = False
+        await super().close()
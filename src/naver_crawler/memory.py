@@ -0,0 +1,185 @@
+"""브라우저 메모리 측정 모듈 - 브라우저 프로세스 메모리 합산과 페이지별 렌더러 힙 측정, 실행별 최고치 기록."""
+
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+from playwright.async_api import Page
+
+
+PROC_PATH = Path("/proc")
+
+
+def _read_process_table() -> Dict[int, int]:
+    """/proc에서 pid -> 부모 pid 매핑 읽기."""
+    table = {}
+    for entry in PROC_PATH.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / "stat").read_text()
+            # 프로세스 이름에 공백/괄호가 있을 수 있으므로 마지막 ')' 이후부터 파싱
+            fields = stat[stat.rindex(')') + 2:].split()
+            table[int(entry.name)] = int(fields[1])
+        except (OSError, ValueError, IndexError):
+            continue
+    return table
+
+
+def _descendant_pids(root_pid: int, table: Dict[int, int]) -> List[int]:
+    """root_pid의 모든 하위 프로세스 pid 목록 반환."""
+    children: Dict[int, List[int]] = {}
+    for pid, parent_pid in table.items():
+        children.setdefault(parent_pid, []).append(pid)
+
+    descendants = []
+    stack = list(children.get(root_pid, []))
+    while stack:
+        pid = stack.pop()
+        descendants.append(pid)
+        stack.extend(children.get(pid, []))
+    return descendants
+
+
+def _read_rss_bytes(pid: int) -> int:
+    """프로세스의 상주 메모리(RSS) 바이트 반환."""
+    try:
+        for line in (PROC_PATH / str(pid) / "status").read_text().splitlines():
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return 0
+
+
+def get_child_processes_rss_bytes(root_pid: Optional[int] = None) -> Optional[int]:
+    """현재 프로세스 하위(Playwright 드라이버와 브라우저) 프로세스들의 RSS 합계 반환 (/proc이 없으면 None)."""
+    if not PROC_PATH.exists():
+        return None
+
+    root_pid = root_pid or os.getpid()
+    table = _read_process_table()
+    return sum(_read_rss_bytes(pid) for pid in _descendant_pids(root_pid, table))
+
+
+def get_process_rss_bytes(pid: Optional[int] = None) -> Optional[int]:
+    """현재(또는 지정한) 프로세스의 RSS 반환 (/proc이 없으면 None)."""
+    if not PROC_PATH.exists():
+        return None
+    return _read_rss_bytes(pid or os.getpid())
+
+
+async def get_page_heap_bytes(page: Page) -> Optional[int]:
+    """페이지 렌더러의 힙 사용량(JS 힙 + DOM 등 embedder 힙) 반환 (CDP를 쓸 수 없는 브라우저면 None)."""
+    try:
+        session = await page.context.new_cdp_session(page)
+    except Exception:
+        return None
+
+    try:
+        usage = await session.send("Runtime.getHeapUsage")
+        return int(usage.get('usedSize', 0) + usage.get('embedderHeapUsedSize', 0))
+    except Exception:
+        return None
+    finally:
+        try:
+            await session.detach()
+        except Exception:
+            pass
+
+
+@dataclass
+class MemoryStats:
+    """실행 중 측정한 메모리 통계."""
+
+    samples: int = 0
+    start_browser_bytes: Optional[int] = None
+    peak_browser_bytes: int = 0
+    peak_process_bytes: int = 0
+    page_samples: int = 0
+    peak_page_bytes: int = 0
+    over_limit_samples: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리 형태로 변환 (MB 단위)."""
+        return {
+            'samples': self.samples,
+            'start_browser_mb': _to_mb(self.start_browser_bytes),
+            'peak_browser_mb': _to_mb(self.peak_browser_bytes),
+            'peak_process_mb': _to_mb(self.peak_process_bytes),
+            'page_samples': self.page_samples,
+            'peak_page_mb': _to_mb(self.peak_page_bytes),
+            'over_limit_samples': self.over_limit_samples
+        }
+
+
+def _to_mb(value: Optional[int]) -> Optional[float]:
+    """바이트를 MB로 변환 (값이 없으면 None)."""
+    return round(value / 1024 / 1024, 1) if value is not None else None
+
+
+class MemoryMonitor:
+    """브라우저(하위 프로세스)와 크롤러 프로세스의 메모리를 측정하여 실행별 최고치를 기록하고,
+    페이지 풀이 교체 여부를 판단하도록 페이지 하나의 렌더러 힙을 기준과 비교.
+
+    /proc 합계는 공유 브라우저의 다른 컨텍스트 렌더러까지 포함하므로 보고용으로만 쓰고, 교체 기준은
+    풀이 빌려준 페이지 자신의 힙으로 판단한다. /proc 전체를 읽는 비용이 있으므로 min_interval_seconds
+    안에 다시 요청하면 직전 값을 사용한다.
+    """
+
+    def __init__(
+        self,
+        limit_mb: float = 256,
+        min_interval_seconds: float = 1.0,
+        page_check_interval_seconds: float = 5.0
+    ) -> None:
+        """페이지 메모리 기준, 최소 측정 간격, 같은 페이지를 다시 측정하기까지의 간격으로 초기화."""
+        self._limit_bytes = int(limit_mb * 1024 * 1024)
+        self._min_interval_seconds = min_interval_seconds
+        self.page_check_interval_seconds = page_check_interval_seconds
+        self._last_sampled_at = 0.0
+        self._last_browser_bytes: Optional[int] = None
+        self.stats = MemoryStats()
+
+    def sample(self, force: bool = False) -> Optional[int]:
+        """브라우저 메모리를 측정하여 최고치를 갱신하고 반환 (측정할 수 없으면 None)."""
+        now = time.monotonic()
+        if not force and now - self._last_sampled_at < self._min_interval_seconds:
+            return self._last_browser_bytes
+
+        browser_bytes = get_child_processes_rss_bytes()
+        process_bytes = get_process_rss_bytes()
+        self._last_sampled_at = now
+        self._last_browser_bytes = browser_bytes
+        if browser_bytes is None:
+            return None
+
+        self.stats.samples += 1
+        if self.stats.start_browser_bytes is None:
+            self.stats.start_browser_bytes = browser_bytes
+        self.stats.peak_browser_bytes = max(self.stats.peak_browser_bytes, browser_bytes)
+        self.stats.peak_process_bytes = max(self.stats.peak_process_bytes, process_bytes or 0)
+        return browser_bytes
+
+    async def is_page_over_limit(self, page: Page) -> bool:
+        """페이지 자신의 렌더러 힙이 기준을 넘었는지 확인 (측정할 수 없으면 False)."""
+        page_bytes = await get_page_heap_bytes(page)
+        if page_bytes is None:
+            return False
+
+        self.stats.page_samples += 1
+        self.stats.peak_page_bytes = max(self.stats.peak_page_bytes, page_bytes)
+        if page_bytes > self._limit_bytes:
+            self.stats.over_limit_samples += 1
+            return True
+        return False
+
+    def reset_stats(self) -> None:
+        """실행별 통계 초기화."""
+        self.stats = MemoryStats()
+        self._last_sampled_at = 0.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """실행별 메모리 통계 반환."""
+        return dict(self.stats.to_dict(), limit_mb=_to_mb(self._limit_bytes))
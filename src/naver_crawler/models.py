@@ -35,6 +35,12 @@ class NaverPost:
         from ..shared.utils import is_valid_week_post
         return is_valid_week_post(self.title, self.content)
     
+    @property
+    def requires_content(self) -> bool:
+        """본문이 있어야 주차/챌린지 여부를 판단할 수 있는지 확인 (제목에 주차가 없을 때)."""
+        from ..shared.utils import extract_week_number
+        return extract_week_number(self.title) is None
+    
     @property
     def week_number(self) -> Optional[int]:
         """게시글에서 주차 번호 추출."""
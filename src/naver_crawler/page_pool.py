@@ -0,0 +1,159 @@
+"""Playwright 페이지 풀 모듈 - 하나의 브라우저 컨텍스트에서 여러 페이지를 재사용."""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, Any, List, Optional
+from playwright.async_api import BrowserContext, Page
+
+from ..core.logger import get_logger
+from ..core.exceptions import NaverCrawlerError
+from .memory import MemoryMonitor
+
+
+@dataclass
+class PageRecycleStats:
+    """사용 횟수나 메모리 기준으로 새로 연 페이지 수."""
+
+    recycled_pages: int = 0
+    recycled_for_memory: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리 형태로 변환."""
+        return {
+            'recycled_pages': self.recycled_pages,
+            'recycled_for_memory': self.recycled_for_memory
+        }
+
+
+class PagePool:
+    """같은 컨텍스트(로그인 세션)를 공유하는 페이지들을 최대 size개까지 빌려주는 풀.
+
+    페이지를 max_uses번 빌려주었거나 반환된 페이지 자신의 렌더러 힙이 기준을 넘으면 그 페이지를 닫고
+    새로 열어 렌더러 메모리를 돌려받는다. 메모리는 페이지마다 최소 간격을 두고 측정하며, 교체된 새 페이지는
+    힙이 작으므로 같은 초과로 반복해서 교체되지 않는다. 새 페이지도 같은 컨텍스트이므로 로그인 세션은
+    그대로 유지된다.
+    """
+
+    def __init__(
+        self,
+        context: BrowserContext,
+        size: int,
+        max_uses: int = 0,
+        memory_monitor: Optional[MemoryMonitor] = None,
+        recycle_stats: Optional[PageRecycleStats] = None
+    ) -> None:
+        """브라우저 컨텍스트, 최대 페이지 수, 페이지 교체 기준(0이면 사용 횟수 제한 없음)으로 풀 초기화."""
+        if size < 1:
+            raise ValueError("페이지 풀 크기는 1 이상이어야 합니다")
+
+        self._context = context
+        self._size = size
+        self._max_uses = max_uses
+        self._memory_monitor = memory_monitor
+        self._recycle_stats = recycle_stats or PageRecycleStats()
+        self._logger = get_logger(__name__)
+        self._pages: List[Page] = []
+        self._uses: Dict[int, int] = {}
+        self._memory_checked_at: Dict[int, float] = {}
+        self._idle: Optional[asyncio.Queue] = None
+
+    @property
+    def size(self) -> int:
+        """풀의 최대 페이지 수 반환."""
+        return self._size
+
+    async def open(self) -> None:
+        """풀 크기만큼 페이지를 미리 열어 둠."""
+        self._idle = asyncio.Queue()
+
+        try:
+            for _ in range(self._size):
+                page = await self._context.new_page()
+                self._pages.append(page)
+                self._idle.put_nowait(page)
+        except Exception as e:
+            await self.close()
+            raise NaverCrawlerError(f"페이지 풀 생성 실패: {str(e)}")
+
+        self._logger.debug(f"페이지 풀 생성 완료: {self._size}개 페이지")
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[Page]:
+        """유휴 페이지 하나를 빌려주고, 사용이 끝나면 풀에 반환."""
+        if self._idle is None:
+            raise NaverCrawlerError("페이지 풀이 열리지 않았습니다")
+
+        page = await self._idle.get()
+        try:
+            yield page
+        finally:
+            self._uses[id(page)] = self._uses.get(id(page), 0) + 1
+            
+            # 닫히거나 크래시된 페이지는 새 페이지로 교체하여 다른 작업에 영향이 없도록 함
+            if page.is_closed():
+                page = await self._replace_page(page)
+                self._logger.warning("닫힌 페이지를 새 페이지로 교체했습니다")
+            elif self._max_uses and self._uses[id(page)] >= self._max_uses:
+                page = await self._recycle_page(page, f"{self._uses[id(page)]}회 사용")
+            elif self._memory_monitor and await self._is_over_memory_limit(page):
+                page = await self._recycle_page(page, "페이지 메모리 기준 초과", for_memory=True)
+            self._idle.put_nowait(page)
+
+    async def _is_over_memory_limit(self, page: Page) -> bool:
+        """반환된 페이지의 렌더러 힙이 기준을 넘었는지 확인 (같은 페이지는 측정 간격 안에 다시 측정하지 않음)."""
+        now = time.monotonic()
+        checked_at = self._memory_checked_at.get(id(page))
+        if checked_at is not None and now - checked_at < self._memory_monitor.page_check_interval_seconds:
+            return False
+
+        self._memory_checked_at[id(page)] = now
+        return await self._memory_monitor.is_page_over_limit(page)
+
+    async def _recycle_page(self, page: Page, reason: str, for_memory: bool = False) -> Page:
+        """사용 중인 페이지를 닫고 새 페이지로 교체하여 렌더러 메모리를 돌려받음."""
+        try:
+            await page.close()
+        except Exception as e:
+            self._logger.debug(f"교체할 페이지 종료 중 오류: {str(e)}")
+
+        replacement = await self._replace_page(page)
+        if replacement is not page:
+            self._recycle_stats.recycled_pages += 1
+            self._recycle_stats.recycled_for_memory += for_memory
+            self._logger.debug(f"페이지 교체 ({reason})")
+        return replacement
+
+    async def _replace_page(self, broken_page: Page) -> Page:
+        """사용할 수 없게 된 페이지를 새 페이지로 교체."""
+        try:
+            page = await self._context.new_page()
+        except Exception as e:
+            # 교체에 실패하면 닫힌 페이지를 그대로 돌려 두고 다음 대여 때 다시 교체를 시도
+            self._logger.error(f"페이지 교체 실패: {str(e)}")
+            return broken_page
+
+        self._pages[self._pages.index(broken_page)] = page
+        self._uses.pop(id(broken_page), None)
+        self._memory_checked_at.pop(id(broken_page), None)
+        return page
+
+    async def close(self) -> None:
+        """풀에서 연 모든 페이지를 닫기."""
+        for page in self._pages:
+            try:
+                if not page.is_closed():
+                    await page.close()
+            except Exception as e:
+                self._logger.debug(f"페이지 종료 중 오류: {str(e)}")
+
+        self._pages = []
+        self._idle = None
+
+    async def __aenter__(self) -> "PagePool":
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
@@ -0,0 +1,190 @@
+"""요청 속도 제한 모듈 - 네이버 요청을 토큰 버킷으로 조절하고 응답 상태에 따라 속도를 조정."""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Dict, Any, AsyncIterator, Optional, Tuple
+
+from ..core.logger import get_logger
+
+
+# 즉시 속도를 낮춰야 하는 응답 상태 코드
+BACKOFF_STATUSES: Tuple[int, ...] = (403, 429, 503)
+
+# 요청이 로그인 화면이나 보안 확인(캡차) 화면으로 돌려보내졌음을 나타내는 URL 조각
+BLOCKED_URL_MARKERS: Tuple[str, ...] = ("nid.naver.com/nidlogin", "captcha")
+
+
+def is_blocked_url(url: Optional[str]) -> bool:
+    """최종 URL이 로그인 벽이나 캡차 화면인지 확인."""
+    if not url:
+        return False
+    lowered = url.lower()
+    return any(marker in lowered for marker in BLOCKED_URL_MARKERS)
+
+
+@dataclass
+class RateLimitSettings:
+    """초당 요청 수, 버스트, 동시 요청 수와 속도 조정 기준."""
+
+    requests_per_second: float = 2.0
+    burst: int = 4
+    max_in_flight: int = 4
+    min_requests_per_second: float = 0.2
+    max_requests_per_second: float = 6.0
+    slow_response_ms: float = 4000
+    backoff_factor: float = 0.5   # 429/403/캡차 응답 시 속도 배율
+    slow_factor: float = 0.8      # 느린 응답 시 속도 배율
+    recovery_factor: float = 1.2  # 정상 응답이 이어질 때 속도 배율
+    healthy_streak: int = 10      # 속도를 올리기 전 필요한 연속 정상 응답 수
+
+
+@dataclass
+class RateLimitStats:
+    """실행 중 속도 제한 통계."""
+
+    requests: int = 0
+    waited_ms: float = 0.0
+    backoffs: int = 0
+    slowdowns: int = 0
+    speedups: int = 0
+    blocked_responses: int = 0
+    min_rate: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리 형태로 변환."""
+        return {
+            'requests': self.requests,
+            'waited_ms': round(self.waited_ms),
+            'backoffs': self.backoffs,
+            'slowdowns': self.slowdowns,
+            'speedups': self.speedups,
+            'blocked_responses': self.blocked_responses,
+            'min_rate': round(self.min_rate, 2)
+        }
+
+
+class AdaptiveRateLimiter:
+    """모든 크롤러 요청이 공유하는 적응형 토큰 버킷.
+
+    토큰은 현재 속도(초당 요청 수)로 채워지고 burst개까지 쌓인다. 동시에 진행 중인 요청은
+    max_in_flight개로 제한한다. 차단 신호에는 속도를 크게 낮추고 쌓인 토큰을 비우며,
+    빠르고 정상적인 응답이 이어지면 최대 속도까지 조금씩 올린다.
+
+    여러 크롤러가 함께 쓰므로 각 크롤러는 new_stats()로 만든 자신의 통계를 넘겨 자기 요청만 집계한다.
+    """
+
+    def __init__(self, settings: Optional[RateLimitSettings] = None) -> None:
+        """속도 제한 설정으로 초기화."""
+        self._settings = settings or RateLimitSettings()
+        self._rate = self._settings.requests_per_second
+        self._tokens = float(self._settings.burst)
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+        self._in_flight = asyncio.Semaphore(max(1, self._settings.max_in_flight))
+        self._clean_streak = 0
+        self._logger = get_logger(__name__)
+        self.stats = RateLimitStats(min_rate=self._rate)
+
+    @property
+    def rate(self) -> float:
+        """현재 초당 요청 수."""
+        return self._rate
+
+    @asynccontextmanager
+    async def slot(self, stats: Optional[RateLimitStats] = None) -> AsyncIterator[None]:
+        """토큰을 받고 동시 요청 자리를 얻은 동안 요청을 수행."""
+        await self.acquire(stats)
+        async with self._in_flight:
+            yield
+
+    async def acquire(self, stats: Optional[RateLimitStats] = None) -> None:
+        """토큰이 생길 때까지 대기한 뒤 하나를 사용 (stats가 있으면 그 통계에도 집계)."""
+        started = time.monotonic()
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    break
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+        waited_ms = (time.monotonic() - started) * 1000
+        for target in self._stats_targets(stats):
+            target.requests += 1
+            target.waited_ms += waited_ms
+            target.min_rate = min(target.min_rate, self._rate)
+
+    def record(
+        self,
+        elapsed_ms: float,
+        status: Optional[int] = None,
+        blocked: bool = False,
+        stats: Optional[RateLimitStats] = None
+    ) -> None:
+        """요청 결과(소요 시간, 상태 코드, 차단 화면 여부)를 반영하여 속도 조정."""
+        settings = self._settings
+        targets = self._stats_targets(stats)
+
+        if blocked or (status is not None and status in BACKOFF_STATUSES):
+            for target in targets:
+                target.blocked_responses += int(blocked)
+                target.backoffs += 1
+            # 쌓인 토큰도 비워 다음 요청부터 바로 느려지도록 함
+            self._tokens = 0
+            self._set_rate(self._rate * settings.backoff_factor, targets)
+            self._logger.warning(
+                f"요청 차단 신호(상태 {status}, 차단 화면 {blocked})로 속도를 {self._rate:.2f}회/초로 낮춥니다"
+            )
+            return
+
+        if elapsed_ms >= settings.slow_response_ms:
+            for target in targets:
+                target.slowdowns += 1
+            self._set_rate(self._rate * settings.slow_factor, targets)
+            self._logger.debug(f"느린 응답({elapsed_ms:.0f}ms)으로 속도를 {self._rate:.2f}회/초로 낮춥니다")
+            return
+
+        self._clean_streak += 1
+        if self._clean_streak >= settings.healthy_streak and self._rate < settings.max_requests_per_second:
+            for target in targets:
+                target.speedups += 1
+            self._set_rate(self._rate * settings.recovery_factor, targets)
+            self._logger.debug(f"정상 응답이 이어져 속도를 {self._rate:.2f}회/초로 올립니다")
+
+    def new_stats(self) -> RateLimitStats:
+        """크롤러 하나가 자기 요청만 집계할 통계 생성."""
+        return RateLimitStats(min_rate=self._rate)
+
+    def reset_stats(self) -> None:
+        """전체 통계 초기화 (현재 속도는 유지)."""
+        self.stats = self.new_stats()
+
+    def get_stats(self, stats: Optional[RateLimitStats] = None) -> Dict[str, Any]:
+        """현재 속도를 포함한 통계 반환 (stats가 없으면 전체 통계)."""
+        return dict((stats or self.stats).to_dict(), current_rate=round(self._rate, 2))
+
+    def _stats_targets(self, stats: Optional[RateLimitStats]) -> Tuple[RateLimitStats, ...]:
+        """집계할 통계 목록 (전체 통계와, 있으면 호출한 크롤러의 통계)."""
+        return (self.stats,) if stats is None else (self.stats, stats)
+
+    def _refill(self) -> None:
+        """경과 시간만큼 토큰 보충."""
+        now = time.monotonic()
+        self._tokens = min(
+            float(self._settings.burst),
+            self._tokens + (now - self._updated_at) * self._rate
+        )
+        self._updated_at = now
+
+    def _set_rate(self, rate: float, targets: Tuple[RateLimitStats, ...]) -> None:
+        """최소/최대 범위 안에서 속도 변경."""
+        self._refill()
+        self._rate = min(
+            self._settings.max_requests_per_second,
+            max(self._settings.min_requests_per_second, rate)
+        )
+        self._clean_streak = 0
+        for target in targets:
+            target.min_rate = min(target.min_rate, self._rate)
@@ -0,0 +1,133 @@
+"""네트워크 리소스 차단 모듈 - 크롤링에 불필요한 요청을 브라우저 컨텍스트에서 중단."""
+
+from dataclasses import dataclass, field
+from typing import Dict, Any, Tuple
+from urllib.parse import urlparse
+from playwright.async_api import BrowserContext, Route
+
+from ..core.logger import get_logger
+
+
+# 제목/본문을 읽는 데 필요 없는 리소스 타입
+DEFAULT_BLOCKED_RESOURCE_TYPES: Tuple[str, ...] = (
+    "image", "media", "font", "stylesheet"
+)
+
+# 광고 및 트래킹 호스트 (하위 도메인 포함)
+DEFAULT_BLOCKED_HOSTS: Tuple[str, ...] = (
+    "veta.naver.com",
+    "tivan.naver.com",
+    "adcr.naver.com",
+    "lcs.naver.com",
+    "nlog.naver.com",
+    "wcs.naver.com",
+    "wcs.naver.net",
+    "googletagmanager.com",
+    "google-analytics.com",
+    "doubleclick.net",
+    "googlesyndication.com",
+    "facebook.net"
+)
+
+# 로그인(캡차 이미지 포함)에 필요하므로 절대 차단하지 않는 호스트
+DEFAULT_ALLOWED_HOSTS: Tuple[str, ...] = (
+    "nid.naver.com",
+)
+
+# 중단된 요청은 실제로 전송되지 않으므로 절약 바이트는 타입별 평균 크기로 추정
+ESTIMATED_BYTES_BY_TYPE: Dict[str, int] = {
+    "image": 30_000,
+    "media": 200_000,
+    "font": 40_000,
+    "stylesheet": 25_000,
+    "script": 40_000,
+    "xhr": 2_000,
+    "fetch": 2_000
+}
+DEFAULT_ESTIMATED_BYTES = 5_000
+
+
+def _host_matches(host: str, patterns: Tuple[str, ...]) -> bool:
+    """호스트가 패턴과 같거나 패턴의 하위 도메인인지 확인."""
+    return any(host == pattern or host.endswith(f".{pattern}") for pattern in patterns)
+
+
+@dataclass
+class ResourceBlockProfile:
+    """차단할 리소스 타입/호스트와 예외 허용 호스트를 정의하는 프로필."""
+
+    blocked_resource_types: Tuple[str, ...] = DEFAULT_BLOCKED_RESOURCE_TYPES
+    blocked_hosts: Tuple[str, ...] = DEFAULT_BLOCKED_HOSTS
+    allowed_hosts: Tuple[str, ...] = DEFAULT_ALLOWED_HOSTS
+
+    def should_block(self, resource_type: str, host: str) -> bool:
+        """요청을 차단해야 하는지 판단 (허용 목록이 항상 우선)."""
+        if _host_matches(host, self.allowed_hosts):
+            return False
+
+        if _host_matches(host, self.blocked_hosts):
+            return True
+
+        return resource_type in self.blocked_resource_types
+
+
+@dataclass
+class ResourceBlockStats:
+    """실행 중 차단된 요청 통계."""
+
+    allowed_requests: int = 0
+    blocked_requests: int = 0
+    estimated_blocked_bytes: int = 0
+    blocked_by_type: Dict[str, int] = field(default_factory=dict)
+
+    def record_block(self, resource_type: str) -> None:
+        """차단된 요청 하나를 통계에 반영."""
+        self.blocked_requests += 1
+        self.estimated_blocked_bytes += ESTIMATED_BYTES_BY_TYPE.get(
+            resource_type, DEFAULT_ESTIMATED_BYTES
+        )
+        self.blocked_by_type[resource_type] = self.blocked_by_type.get(resource_type, 0) + 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리 형태로 변환."""
+        return {
+            'allowed_requests': self.allowed_requests,
+            'blocked_requests': self.blocked_requests,
+            'estimated_blocked_bytes': self.estimated_blocked_bytes,
+            'blocked_by_type': dict(self.blocked_by_type)
+        }
+
+
+class ResourceBlocker:
+    """브라우저 컨텍스트에 요청 가로채기를 설치하여 프로필에 따라 요청을 중단."""
+
+    def __init__(self, profile: ResourceBlockProfile) -> None:
+        """차단 프로필로 초기화."""
+        self._profile = profile
+        self._logger = get_logger(__name__)
+        self.stats = ResourceBlockStats()
+
+    async def install(self, context: BrowserContext) -> None:
+        """컨텍스트의 모든 페이지 요청에 차단 핸들러 등록."""
+        await context.route("**/*", self._handle_route)
+        self._logger.info(
+            f"리소스 차단 프로필 적용: 타입 {list(self._profile.blocked_resource_types)}, "
+            f"호스트 {len(self._profile.blocked_hosts)}개, 허용 호스트 {list(self._profile.allowed_hosts)}"
+        )
+
+    async def uninstall(self, context: BrowserContext) -> None:
+        """컨텍스트에서 차단 핸들러 제거 (풀의 컨텍스트를 반환할 때 핸들러가 쌓이지 않도록)."""
+        await context.unroute("**/*", self._handle_route)
+
+    async def _handle_route(self, route: Route) -> None:
+        """요청별로 차단 여부를 판단하여 중단하거나 다음 핸들러로 넘김."""
+        request = route.request
+        host = urlparse(request.url).hostname or ""
+
+        if self._profile.should_block(request.resource_type, host):
+            self.stats.record_block(request.resource_type)
+            await route.abort("blockedbyclient")
+            return
+
+        self.stats.allowed_requests += 1
+        await route.fallback()
@@ -0,0 +1,143 @@
+"""선택자 프로필 모듈 - 카페/필드별로 매칭에 성공한 선택자와 체인 첫 선택자의 적중률을 기록."""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Sequence
+
+from ..core.logger import get_logger
+from ..shared.utils import get_kst_now
+
+
+class SelectorProfileStore:
+    """카페 URL과 필드(list, title, content 등)별 선택자 적중 기록을 JSON 파일에 저장하는 저장소.
+
+    체인은 앞의 선택자가 더 구체적인 노드를 고르도록 정해져 있어(예: "td:nth-child(3) a"가
+    "td:nth-child(3)"보다 먼저) 적중 횟수로 순서를 바꾸면 추출 결과가 달라진다. 그래서 시도 순서는
+    바꾸지 않고, 가장 많이 맞은 선택자(winner)와 체인 첫 선택자의 적중률만 보고한다.
+
+    여러 크롤러가 함께 쓸 수 있으므로 기록 시 크롤러의 실행 통계를 넘기면 그 통계에도 집계한다.
+    """
+
+    def __init__(self, profile_path: str = "data/selector_profile.json") -> None:
+        """프로필 파일 경로로 저장소 초기화."""
+        self._profile_path = Path(profile_path)
+        self._logger = get_logger(__name__)
+        self._profile: Dict[str, Dict[str, Any]] = self._load_profile()
+        self._dirty = False
+        self._run_stats: Dict[str, Dict[str, int]] = {}
+
+    def record(
+        self,
+        cafe_url: str,
+        field: str,
+        selector: Optional[str],
+        chain: Sequence[str],
+        run_stats: Optional[Dict[str, Dict[str, int]]] = None
+    ) -> None:
+        """필드 조회 한 건의 매칭 결과 기록 (selector가 None이면 체인 전체가 실패)."""
+        cafe_entry = self._profile.setdefault(self._make_key(cafe_url), {})
+        entry = cafe_entry.setdefault(field, {
+            'winner': None,
+            'hits': {},
+            'lookups': 0,
+            'first_try_hits': 0,
+            'misses': 0
+        })
+        runs = [
+            stats.setdefault(field, {'lookups': 0, 'first_try_hits': 0, 'misses': 0})
+            for stats in self._stats_targets(run_stats)
+        ]
+
+        entry['lookups'] += 1
+        for run in runs:
+            run['lookups'] += 1
+        self._dirty = True
+
+        if selector is None:
+            entry['misses'] += 1
+            for run in runs:
+                run['misses'] += 1
+            return
+
+        # 체인의 첫 선택자가 맞았다면 첫 시도에서 끝난 것
+        if chain and selector == chain[0]:
+            entry['first_try_hits'] += 1
+            for run in runs:
+                run['first_try_hits'] += 1
+
+        entry['hits'][selector] = entry['hits'].get(selector, 0) + 1
+        entry['winner'] = max(entry['hits'], key=entry['hits'].get)
+        entry['updated_at'] = get_kst_now().isoformat()
+
+    def save(self) -> None:
+        """바뀐 내용이 있을 때만 프로필을 저장."""
+        if not self._dirty:
+            return
+        self._save_profile(self._profile)
+        self._dirty = False
+
+    def reset_stats(self) -> None:
+        """전체 적중 통계 초기화."""
+        self._run_stats = {}
+
+    def get_stats(self, run_stats: Optional[Dict[str, Dict[str, int]]] = None) -> Dict[str, Any]:
+        """필드별 첫 시도 적중률 반환 (run_stats가 없으면 전체 통계)."""
+        stats = self._run_stats if run_stats is None else run_stats
+        return {
+            field: dict(run, first_try_hit_rate=self._rate(run['first_try_hits'], run['lookups']))
+            for field, run in stats.items()
+        }
+
+    def _stats_targets(self, run_stats: Optional[Dict[str, Dict[str, int]]]) -> List[Dict[str, Dict[str, int]]]:
+        """집계할 통계 목록 (전체 통계와, 있으면 호출한 크롤러의 통계)."""
+        return [self._run_stats] if run_stats is None else [self._run_stats, run_stats]
+
+    def get_profile(self) -> Dict[str, Any]:
+        """카페/필드별 가장 많이 맞은 선택자와 누적 적중률 반환."""
+        return {
+            cafe_key: {
+                field: dict(
+                    entry,
+                    first_try_hit_rate=self._rate(entry['first_try_hits'], entry['lookups']),
+                    match_rate=self._rate(entry['lookups'] - entry['misses'], entry['lookups'])
+                )
+                for field, entry in fields.items()
+            }
+            for cafe_key, fields in self._profile.items()
+        }
+
+    def _rate(self, count: int, total: int) -> float:
+        """비율 계산 (조회가 없으면 0)."""
+        return round(count / total, 3) if total else 0.0
+
+    def _make_key(self, cafe_url: str) -> str:
+        """카페 URL로 프로필 키 생성."""
+        return cafe_url.rstrip('/')
+
+    def _load_profile(self) -> Dict[str, Dict[str, Any]]:
+        """프로필 파일에서 데이터 로드."""
+        try:
+            if not self._profile_path.exists():
+                return {}
+
+            with open(self._profile_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+
+        except Exception as e:
+            self._logger.error(f"선택자 프로필 로드 중 오류: {str(e)}")
+            return {}
+
+    def _save_profile(self, profile: Dict[str, Dict[str, Any]]) -> None:
+        """프로필 데이터를 임시 파일에 쓴 뒤 교체하여 원자적으로 저장."""
+        try:
+            self._profile_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self._profile_path.with_suffix('.tmp')
+
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(profile, f, ensure_ascii=False, indent=2)
+
+            os.replace(temp_path, self._profile_path)
+
+        except Exception as e:
+            self._logger.error(f"선택자 프로필 저장 중 오류: {str(e)}")
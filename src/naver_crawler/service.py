@@ -1,57 +1,203 @@
 """네이버 카페 크롤링 서비스 모듈."""
 
-import json
+import asyncio
 import os
-from pathlib import Path
-from typing import List, Optional, Dict, Any
-from playwright.async_api import async_playwright, Browser, Page
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import List, Optional, Dict, Any, Set, Tuple, AsyncIterator, Awaitable, Callable
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page
 
 from ..core.logger import get_logger, log_execution_time
-from ..core.exceptions import NaverCrawlerError, LoginFailedError, CrawlingError
+from ..core.exceptions import NaverCrawlerError, LoginFailedError, CrawlingError, PageStructureError
 from .models import NaverPost
+from .page_pool import PagePool, PageRecycleStats
+from .memory import MemoryMonitor
+from .extraction import extract_board_rows, build_selector_chains, CONTENT_SELECTORS
+from .resource_blocker import ResourceBlocker, ResourceBlockProfile
+from .crawl_state import CrawlStateStore
+from .content_cache import PostContentCache, ContentCacheStats, compute_post_fingerprint
+from .checkpoint import CrawlCheckpoint, CrawlCheckpointStore
+from .wait_strategy import ReadinessWaiter, WaitStage
+from .browser_pool import BrowserPool, PooledContext
+from .snapshot import PageSnapshot
+from .rate_limiter import AdaptiveRateLimiter, RateLimitStats
+from .selector_profile import SelectorProfileStore
+from .session import SessionStateStore, SessionVerdictCache, has_valid_session_cookies, session_fingerprint
 
 
 class NaverCrawlerService:
     """네이버 카페 자동 로그인 및 게시글 크롤링을 담당하는 서비스."""
     
-    def __init__(self, naver_id: str, naver_password: str) -> None:
+    def __init__(
+        self,
+        naver_id: str,
+        naver_password: str,
+        detail_concurrency: int = 3,
+        list_concurrency: int = 3,
+        block_profile: Optional[ResourceBlockProfile] = None,
+        crawl_state: Optional[CrawlStateStore] = None,
+        content_cache: Optional[PostContentCache] = None,
+        lazy_content: bool = True,
+        wait_stages: Optional[Dict[str, WaitStage]] = None,
+        session_cache: Optional[SessionVerdictCache] = None,
+        session_store: Optional[SessionStateStore] = None,
+        selector_profile: Optional[SelectorProfileStore] = None,
+        snapshot: Optional[PageSnapshot] = None,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
+        checkpoints: Optional[CrawlCheckpointStore] = None,
+        page_max_navigations: int = 0,
+        memory_monitor: Optional[MemoryMonitor] = None
+    ) -> None:
         """네이버 로그인 정보로 크롤러 서비스 초기화."""
         self._naver_id = naver_id
         self._naver_password = naver_password
+        self._detail_concurrency = max(1, detail_concurrency)
+        self._list_concurrency = max(1, list_concurrency)
+        self._block_profile = block_profile
+        self._resource_blocker: Optional[ResourceBlocker] = None
+        self._crawl_state = crawl_state
+        self._content_cache = content_cache
+        self._lazy_content = lazy_content
+        # 재생 응답은 네이버 서버로 가지 않으므로 속도 제한기를 거치지 않고 이동
+        self._replaying = bool(snapshot and snapshot.replaying)
+        self._rate_limiter = rate_limiter if not self._replaying else None
+        self._waiter = ReadinessWaiter(wait_stages, self._rate_limiter)
+        self._session_cache = session_cache
+        self._selector_profile = selector_profile
+        self._profile_cafe_url: Optional[str] = None
+        self._snapshot = snapshot
+        self._checkpoints = checkpoints
+        self._checkpoint: Optional[CrawlCheckpoint] = None
+        self._finished_checkpoints: List[CrawlCheckpoint] = []
+        # 긴 실행에서 렌더러 메모리가 쌓이지 않도록 페이지를 교체하는 기준
+        self._page_max_navigations = max(0, page_max_navigations)
+        self._memory_monitor = memory_monitor
+        self._page_recycle_stats = PageRecycleStats()
+        # 상세 수집 묶음들이 실행 동안 함께 쓰는 페이지 풀 (처음 필요할 때 열고 실행이 끝나면 닫음)
+        self._detail_pool: Optional[PagePool] = None
+        self._pending_high_water_marks: Dict[Tuple[str, str], int] = {}
+        # 이번 실행에서 본문 수집에 실패한 게시글 ID (최고 수위를 그 아래로 제한)
+        self._failed_detail_ids: Set[str] = set()
+        # 이번 실행에서 가져오지 못한 목록 페이지 (체크포인트에 완료로 남기지 않고 다음 실행에서 다시 수집)
+        self._failed_list_pages: Set[int] = set()
+        self._run_stats: Dict[str, Any] = {}
+        # 캐시, 선택자 기록, 속도 제한기는 여러 대상이 공유할 수 있으므로 통계는 크롤러별로 따로 집계
+        self._cache_stats = ContentCacheStats()
+        self._selector_stats: Dict[str, Dict[str, int]] = {}
+        self._rate_limit_stats: Optional[RateLimitStats] = None
         self._logger = get_logger(__name__)
         self._browser: Optional[Browser] = None
+        self._context: Optional[BrowserContext] = None
         self._page: Optional[Page] = None
-        self._cookies_path = Path("data/naver_cookies.json")
+        # 쿠키와 웹 스토리지를 담은 세션 저장 상태 (모든 컨텍스트와 풀이 공유)
+        self._session_store = session_store or SessionStateStore()
+        self._session_ready = False
+        self._browser_pool: Optional[BrowserPool] = None
+        self._lease: Optional[PooledContext] = None
+    
+    def set_browser_pool(self, browser_pool: Optional[BrowserPool]) -> None:
+        """웹 서버가 유지하는 브라우저 풀 설정 (설정되면 실행마다 브라우저를 새로 띄우지 않음)."""
+        self._browser_pool = browser_pool
     
     @log_execution_time
     async def initialize_browser(self) -> None:
         """Playwright 브라우저를 초기화하고 설정."""
+        self._waiter.reset_stats()
+        self._session_ready = False
+        
+        if self._browser_pool:
+            await self._initialize_from_pool()
+            return
+        
         try:
             self._playwright = await async_playwright().start()
             self._browser = await self._playwright.chromium.launch(
                 headless=True,
                 args=['--no-sandbox', '--disable-dev-shm-usage']
             )
-            self._page = await self._browser.new_page()
+            # 상세 페이지 풀이 로그인 세션을 공유하도록 컨텍스트를 직접 생성
+            self._context = await self._browser.new_context()
             
-            # User-Agent 설정으로 봇 탐지 회피
-            await self._page.set_extra_http_headers({
+            # User-Agent 설정으로 봇 탐지 회피 (컨텍스트의 모든 페이지에 적용)
+            await self._context.set_extra_http_headers({
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
             })
             
+            # 저장된 세션(쿠키, localStorage, sessionStorage) 복원
+            await self._session_store.apply(self._context)
+            
+            # 스냅샷 기록/재생 (나중에 등록한 차단 핸들러가 먼저 실행되므로 차단되지 않은 요청만 기록/재생)
+            if self._snapshot:
+                await self._snapshot.install(self._context)
+            
+            # 이미지/폰트/광고 등 불필요한 리소스 차단 (로그인 포함 모든 이동에 적용)
+            if self._block_profile:
+                self._resource_blocker = ResourceBlocker(self._block_profile)
+                await self._resource_blocker.install(self._context)
+            
+            self._page = await self._context.new_page()
+            
             self._logger.info("브라우저 초기화 완료")
             
         except Exception as e:
             raise NaverCrawlerError(f"브라우저 초기화 실패: {str(e)}")
     
+    async def _initialize_from_pool(self) -> None:
+        """브라우저 풀에서 로그인 세션이 유지된 컨텍스트를 빌려 사용."""
+        self._lease = await self._browser_pool.acquire()
+        
+        try:
+            self._context = self._lease.context
+            
+            # 다른 실행이나 워커가 갱신한 쿠키를 반영 (웹 스토리지는 컨텍스트 생성 시 복원됨)
+            await self._session_store.apply(self._context, include_storage=False)
+            
+            if self._snapshot:
+                await self._snapshot.install(self._context)
+            
+            if self._block_profile:
+                self._resource_blocker = ResourceBlocker(self._block_profile)
+                await self._resource_blocker.install(self._context)
+            
+            self._page = await self._context.new_page()
+            self._logger.info(f"브라우저 풀에서 컨텍스트 대여 (누적 실행 {self._lease.runs}회)")
+            
+        except Exception as e:
+            await self._release_lease()
+            raise NaverCrawlerError(f"브라우저 풀 컨텍스트 준비 실패: {str(e)}")
+    
+    async def _release_lease(self) -> None:
+        """빌린 컨텍스트의 페이지와 차단 핸들러를 정리하고 풀에 반환."""
+        lease, self._lease = self._lease, None
+        
+        try:
+            if self._page and not self._page.is_closed():
+                await self._page.close()
+            if self._resource_blocker:
+                await self._resource_blocker.uninstall(lease.context)
+            if self._snapshot:
+                await self._snapshot.uninstall(lease.context)
+        except Exception as e:
+            self._logger.debug(f"대여 컨텍스트 정리 중 오류: {str(e)}")
+        
+        self._page = None
+        self._context = None
+        await self._browser_pool.release(lease, navigations=self._waiter.total_navigations())
+    
     @log_execution_time
     async def login_to_naver(self, max_retries: int = 3) -> bool:
         """네이버에 자동 로그인 수행."""
         if not self._page:
             raise NaverCrawlerError("브라우저가 초기화되지 않았습니다")
         
+        # 스냅샷 재생은 기록된 응답만 사용하므로 로그인이 필요 없음
+        if self._snapshot and self._snapshot.replaying:
+            self._logger.info(f"스냅샷 '{self._snapshot.name}' 재생 모드: 로그인을 생략합니다")
+            return True
+        
         # 저장된 쿠키로 먼저 로그인 시도
         if await self._try_login_with_cookies():
+            self._session_ready = True
             return True
         
         # 쿠키 로그인 실패 시 일반 로그인 진행
@@ -60,7 +206,7 @@ class NaverCrawlerService:
                 self._logger.info(f"네이버 로그인 시도 {attempt + 1}/{max_retries}")
                 
                 # 네이버 로그인 페이지로 이동
-                await self._page.goto("https://nid.naver.com/nidlogin.login", wait_until="networkidle")
+                await self._waiter.navigate(self._page, "https://nid.naver.com/nidlogin.login", "login")
                 
                 # 로그인 정보 입력
                 await self._page.fill("#id", self._naver_id)
@@ -72,9 +218,10 @@ class NaverCrawlerService:
                 # 로그인 결과 대기 및 확인
                 await self._page.wait_for_load_state("networkidle", timeout=10000)
                 
-                # 로그인 성공 여부 확인
-                if await self._verify_login_success():
-                    await self._save_cookies()
+                # 로그인 성공 여부는 세션 쿠키 발급으로 확인 (naver.com 재이동 없음)
+                if await self._has_fresh_session():
+                    self._session_ready = True
+                    await self._save_session_state()
                     self._logger.info("네이버 로그인 성공")
                     return True
                 else:
@@ -92,74 +239,428 @@ class NaverCrawlerService:
         self, 
         cafe_url: str, 
         board_id: str, 
-        pages: int = 3
+        pages: int = 3,
+        since: Optional[datetime] = None
     ) -> List[NaverPost]:
-        """지정된 카페 게시판에서 게시글 목록을 크롤링."""
-        if not self._page:
-            raise NaverCrawlerError("브라우저가 초기화되지 않았습니다")
+        """지정된 카페 게시판에서 게시글 목록을 크롤링 (스트리밍 수집 결과를 모아서 반환)."""
+        return [post async for post in self.stream_cafe_posts(cafe_url, board_id, pages, since)]
+    
+    async def stream_cafe_posts(
+        self,
+        cafe_url: str,
+        board_id: str,
+        pages: int = 3,
+        since: Optional[datetime] = None
+    ) -> AsyncIterator[NaverPost]:
+        """게시판을 목록 페이지 묶음 단위로 크롤링하며 준비된 게시글부터 하나씩 내보냄.
         
-        posts = []
+        본문이 필요 없는 게시글은 목록을 읽자마자, 본문이 필요한 게시글은 상세 수집이 끝나는 대로
+        내보낸다. 한 묶음의 상세 수집은 다음 목록 페이지 수집과 겹쳐 진행된다. 끝까지 소비된
+        경우에만 최고 수위와 선택자 프로필을 기록한다. 체크포인트가 있으면 이전 실행에서 완료한
+        목록 페이지와 본문은 다시 가져오지 않는다.
+        
+        since가 주어지면 게시판이 최신순이므로 작성일이 그보다 이른 행이 나온 페이지에서 목록
+        수집을 멈추고, 기간 밖의 게시글은 본문을 가져오지 않고 제외한다 (pages는 최대 페이지 수).
+        """
+        self._ensure_ready()
+        
+        self._run_stats = {}
+        self._failed_detail_ids = set()
+        self._failed_list_pages = set()
+        self._cache_stats = ContentCacheStats()
+        
+        self._profile_cafe_url = cafe_url
+        self._selector_stats = {}
+        if self._rate_limiter:
+            self._rate_limit_stats = self._rate_limiter.new_stats()
+            self._waiter.set_rate_limit_stats(self._rate_limit_stats)
+        self._page_recycle_stats = PageRecycleStats()
+        if self._memory_monitor:
+            self._memory_monitor.reset_stats()
+            self._memory_monitor.sample(force=True)
+        
+        high_water_mark = None
+        if self._crawl_state:
+            high_water_mark = self._crawl_state.get_high_water_mark(cafe_url, board_id)
+            if high_water_mark is not None:
+                self._logger.info(f"증분 크롤링: 게시글 ID {high_water_mark} 이후 게시글만 수집합니다")
+                self._run_stats['incremental'] = {
+                    'high_water_mark': high_water_mark,
+                    'new_posts': 0,
+                    'skipped_posts': 0
+                }
+        
+        if since is not None:
+            self._logger.info(f"수집 기간: {since:%Y-%m-%d %H:%M} 이후 게시글만 수집합니다")
+            self._run_stats['date_window'] = {
+                'since': since.isoformat(),
+                'out_of_window_posts': 0
+            }
+        
+        checkpoint = None
+        if self._checkpoints:
+            checkpoint = self._checkpoints.open(cafe_url, board_id, pages)
+            self._run_stats['checkpoint'] = checkpoint.to_dict()
+        self._checkpoint = checkpoint
+        
+        # 게시글 객체 대신 ID만 보관하여 메모리가 페이지 수에 비례해 늘지 않도록 함
+        seen_ids: Set[str] = set()
+        accepted_ids: List[str] = []
+        fetched_ids: Set[str] = checkpoint.fetched_ids if checkpoint else set()
+        listed_count = 0
+        challenge_count = 0
+        detail_task: Optional[asyncio.Task] = None
+        detail_posts: List[NaverPost] = []
         
         try:
-            # 1단계: 게시글 목록 수집
-            for page_num in range(1, pages + 1):
-                page_posts = await self._crawl_single_page(cafe_url, board_id, page_num)
-                posts.extend(page_posts)
+            # 1단계: 게시글 목록 수집 (이미 처리한 ID에 도달하면 페이지 이동 중단)
+            async for batch_posts in self._iter_post_batches(
+                cafe_url, board_id, pages, high_water_mark, since, checkpoint
+            ):
+                listed_count += len(batch_posts)
+                new_posts = self._accept_new_posts(batch_posts, seen_ids, high_water_mark, since)
+                accepted_ids.extend(post.post_id for post in new_posts)
+                
+                # 2단계: 본문이 필요 없거나 체크포인트에 본문이 있는 게시글은 바로 내보냄
+                targets = self._select_content_targets(
+                    [post for post in new_posts if post.post_id not in fetched_ids]
+                )
+                target_ids = {id(post) for post in targets}
+                for post in new_posts:
+                    if id(post) not in target_ids:
+                        challenge_count += post.is_challenge_post
+                        yield post
                 
-                self._logger.info(f"페이지 {page_num} 크롤링 완료: {len(page_posts)}개 게시글")
+                # 이전 묶음의 상세 수집이 끝나면 내보내고, 이번 묶음의 상세 수집을 시작
+                if detail_task:
+                    running_task, detail_task = detail_task, None
+                    await running_task
+                    for post in detail_posts:
+                        challenge_count += post.is_challenge_post
+                        yield post
+                
+                if targets:
+                    detail_posts = targets
+                    detail_task = asyncio.create_task(self._fetch_contents(targets))
             
-            # 2단계: 각 게시글의 상세 내용 가져오기
-            self._logger.info(f"총 {len(posts)}개 게시글의 상세 내용 크롤링 시작")
+            if detail_task:
+                running_task, detail_task = detail_task, None
+                await running_task
+                for post in detail_posts:
+                    challenge_count += post.is_challenge_post
+                    yield post
             
-            for i, post in enumerate(posts):
-                if post.post_url:
-                    content = await self._get_post_content(post.post_url)
-                    if content:
-                        post.content = content
-                        self._logger.debug(f"게시글 {i+1}/{len(posts)} 내용 수집 완료")
-                    else:
-                        self._logger.warning(f"게시글 {post.post_id} 내용 수집 실패")
-                
-                # 너무 빠른 요청 방지
-                if i < len(posts) - 1:
-                    await self._page.wait_for_timeout(500)
+            self._finish_content_cache()
             
-            # 중복 제거 (post_id 기준)
-            unique_posts = self._remove_duplicate_posts(posts)
+            if self._memory_monitor and self._memory_monitor.sample(force=True) is not None:
+                memory = self._memory_monitor.stats
+                self._logger.info(
+                    f"크롤링 메모리 최고치: 브라우저 {memory.peak_browser_bytes / 1024 / 1024:.0f}MB, "
+                    f"크롤러 프로세스 {memory.peak_process_bytes / 1024 / 1024:.0f}MB "
+                    f"(페이지 교체 {self._page_recycle_stats.recycled_pages}회)"
+                )
             
-            # 챌린지 게시글만 필터링
-            challenge_posts = [post for post in unique_posts if post.is_challenge_post]
-            self._logger.info(f"전체 크롤링 완료: 총 {len(posts)}개 → 중복 제거 후 {len(unique_posts)}개 → 챌린지 게시글 {len(challenge_posts)}개")
+            # 처리 완료 후 저장할 최고 수위 기록 (체크포인트는 시트 반영 후 삭제)
+            if self._failed_detail_ids:
+                self._run_stats['detail_failures'] = sorted(self._failed_detail_ids)
+            self._remember_high_water_mark(
+                cafe_url, board_id, accepted_ids, self._failed_detail_ids, self._failed_list_pages
+            )
+            if self._failed_list_pages:
+                self._run_stats['list_failures'] = sorted(self._failed_list_pages)
+                if checkpoint:
+                    self._logger.warning(
+                        f"목록 페이지 {sorted(self._failed_list_pages)}을(를) 가져오지 못해 체크포인트를 남겨 "
+                        f"다음 실행에서 이어서 수집합니다: {checkpoint.path}"
+                    )
+            elif checkpoint:
+                self._finished_checkpoints.append(checkpoint)
             
-            return unique_posts
+            # 이번 실행에서 매칭된 선택자를 다음 실행을 위해 저장
+            if self._selector_profile:
+                self._selector_profile.save()
+            
+            self._logger.info(
+                f"전체 크롤링 완료: 총 {listed_count}개 → 중복/처리완료 제거 후 {len(accepted_ids)}개 "
+                f"→ 챌린지 게시글 {challenge_count}개"
+            )
             
+        except PageStructureError:
+            raise
         except Exception as e:
+            if checkpoint:
+                self._logger.info(f"진행 상황이 체크포인트에 남아 있어 다음 실행에서 이어서 크롤링합니다: {checkpoint.path}")
             raise CrawlingError(f"게시글 크롤링 중 오류 발생: {str(e)}")
+        finally:
+            self._checkpoint = None
+            # 소비가 중간에 멈추거나 오류가 나면 진행 중인 상세 수집도 중단
+            if detail_task:
+                if not detail_task.done():
+                    detail_task.cancel()
+                elif not detail_task.cancelled() and detail_task.exception():
+                    self._logger.error(f"상세 수집 중 오류: {str(detail_task.exception())}")
+            await self._close_detail_pool()
+    
+    async def _iter_post_batches(
+        self,
+        cafe_url: str,
+        board_id: str,
+        pages: int,
+        high_water_mark: Optional[int],
+        since: Optional[datetime],
+        checkpoint: Optional[CrawlCheckpoint]
+    ) -> AsyncIterator[List[NaverPost]]:
+        """체크포인트에 남은 게시글을 먼저 내보내고, 완료하지 못한 목록 페이지만 이어서 수집."""
+        completed_pages: Set[int] = set()
+        
+        if checkpoint:
+            completed_pages = checkpoint.completed_pages
+            restored_posts, checkpoint.posts = checkpoint.posts, []
+            if restored_posts:
+                yield restored_posts
+            
+            # 이미 처리한 게시글이나 수집 기간 이전 게시글까지 수집했다면 목록 수집은 끝난 것
+            list_finished = checkpoint.list_finished or self._reached_known_posts(
+                restored_posts, high_water_mark, since
+            )
+            if list_finished:
+                self._logger.info("체크포인트에 목록 수집이 끝난 것으로 기록되어 목록 페이지를 열지 않습니다")
+                return
+        
+        async for page_numbers, batch_posts in self._iter_list_pages(
+            cafe_url, board_id, pages, high_water_mark, since, completed_pages
+        ):
+            if checkpoint:
+                self._checkpoints.record_pages(checkpoint, page_numbers, batch_posts)
+            yield batch_posts
+        
+        # 실패한 페이지가 있으면 목록 완료를 기록하지 않아 이어서 크롤링할 때 그 페이지를 다시 수집
+        if checkpoint and not self._failed_list_pages:
+            self._checkpoints.record_list_finished(checkpoint)
+    
+    def _accept_new_posts(
+        self,
+        posts: List[NaverPost],
+        seen_ids: Set[str],
+        high_water_mark: Optional[int],
+        since: Optional[datetime] = None
+    ) -> List[NaverPost]:
+        """이미 본 게시글(앞 페이지 우선), 수집 기간 이전 게시글, 이미 처리한 게시글을 제외한 새 게시글 반환."""
+        unique_posts = []
+        for post in posts:
+            if post.post_id in seen_ids:
+                self._logger.debug(f"중복 게시글 제거: ID={post.post_id}, 제목={post.title}")
+                continue
+            seen_ids.add(post.post_id)
+            unique_posts.append(post)
+        
+        if since is not None:
+            in_window = [post for post in unique_posts if not self._is_before_window(post, since)]
+            self._run_stats['date_window']['out_of_window_posts'] += len(unique_posts) - len(in_window)
+            unique_posts = in_window
+        
+        if high_water_mark is None:
+            return unique_posts
+        
+        new_posts = [post for post in unique_posts if not self._is_processed_post(post, high_water_mark)]
+        incremental = self._run_stats['incremental']
+        incremental['new_posts'] += len(new_posts)
+        incremental['skipped_posts'] += len(unique_posts) - len(new_posts)
+        return new_posts
+    
+    def _ensure_ready(self) -> None:
+        """크롤링을 시작할 수 있는 상태인지 확인."""
+        if not self._page:
+            raise NaverCrawlerError("브라우저가 초기화되지 않았습니다")
+    
+    async def _iter_list_pages(
+        self,
+        cafe_url: str,
+        board_id: str,
+        pages: int,
+        high_water_mark: Optional[int] = None,
+        since: Optional[datetime] = None,
+        completed_pages: Optional[Set[int]] = None
+    ) -> AsyncIterator[Tuple[List[int], List[NaverPost]]]:
+        """게시판 목록 페이지들을 묶음 단위로 동시에 크롤링하고 (성공한 페이지 번호, 페이지 순서대로 합친 게시글) 내보냄.
+        
+        가져오지 못한 페이지는 성공한 페이지 번호에서 빼고 _failed_list_pages에 기록한다.
+        """
+        remaining_pages = [
+            page_num for page_num in range(1, pages + 1)
+            if page_num not in (completed_pages or set())
+        ]
+        if not remaining_pages:
+            return
+        
+        worker_count = min(self._list_concurrency, len(remaining_pages))
+        
+        async with self._list_page_fetcher(cafe_url, board_id, worker_count) as fetch_page:
+            # 증분 모드나 수집 기간이 있으면 1페이지에서 끝날 수 있으므로 1페이지부터 확인
+            next_index = 0
+            batch_size = worker_count if high_water_mark is None and since is None else 1
+            
+            while next_index < len(remaining_pages):
+                page_numbers = remaining_pages[next_index:next_index + batch_size]
+                
+                # gather는 입력 순서대로 결과를 돌려주므로 중복 제거 시 앞 페이지가 우선됨
+                results = await asyncio.gather(
+                    *(fetch_page(page_num) for page_num in page_numbers),
+                    return_exceptions=True
+                )
+                
+                done_pages = []
+                batch_posts = []
+                reached_page = None
+                for page_num, page_posts in zip(page_numbers, results):
+                    if isinstance(page_posts, PageStructureError):
+                        raise page_posts
+                    if isinstance(page_posts, BaseException):
+                        self._logger.error(f"페이지 {page_num} 크롤링 중 오류: {str(page_posts)}")
+                        self._failed_list_pages.add(page_num)
+                        continue
+                    
+                    done_pages.append(page_num)
+                    batch_posts.extend(page_posts)
+                    self._logger.info(f"페이지 {page_num} 크롤링 완료: {len(page_posts)}개 게시글")
+                    
+                    if reached_page is None and self._reached_known_posts(page_posts, high_water_mark, since):
+                        reached_page = page_num
+                
+                yield done_pages, batch_posts
+                
+                if reached_page is not None:
+                    self._logger.info(
+                        f"이미 처리한 게시글이나 수집 기간 이전 게시글에 도달하여 "
+                        f"{reached_page}페이지에서 목록 수집 중단"
+                    )
+                    if since is not None:
+                        self._run_stats['date_window']['stopped_at_page'] = reached_page
+                    break
+                
+                next_index += len(page_numbers)
+                batch_size = worker_count
+    
+    @asynccontextmanager
+    async def _list_page_fetcher(
+        self,
+        cafe_url: str,
+        board_id: str,
+        worker_count: int
+    ) -> AsyncIterator[Callable[[int], Awaitable[List[NaverPost]]]]:
+        """목록 페이지 번호를 받아 게시글을 돌려주는 수집 함수를 제공 (브라우저 페이지 풀 사용)."""
+        async with self._new_page_pool(worker_count) as pool:
+            async def crawl_with_pool(page_num: int) -> List[NaverPost]:
+                async with pool.acquire() as page:
+                    return await self._crawl_single_page(cafe_url, board_id, page_num, page)
+            
+            yield crawl_with_pool
+    
+    def _new_page_pool(self, size: int) -> PagePool:
+        """사용 횟수/메모리 기준으로 페이지를 교체하는 페이지 풀 생성 (통계는 실행 동안 누적)."""
+        return PagePool(
+            self._context,
+            size,
+            max_uses=self._page_max_navigations,
+            memory_monitor=self._memory_monitor,
+            recycle_stats=self._page_recycle_stats
+        )
+    
+    def _is_processed_post(self, post: NaverPost, high_water_mark: int) -> bool:
+        """게시글 ID가 최고 수위 이하인지 확인 (숫자가 아닌 ID는 새 글로 취급)."""
+        return post.post_id.isdigit() and int(post.post_id) <= high_water_mark
+    
+    def _is_before_window(self, post: NaverPost, since: datetime) -> bool:
+        """게시글 작성일이 수집 기간 시작보다 이른지 확인."""
+        return post.created_at < since
+    
+    def _reached_known_posts(
+        self,
+        posts: List[NaverPost],
+        high_water_mark: Optional[int],
+        since: Optional[datetime]
+    ) -> bool:
+        """최신순 게시판에서 더 볼 필요가 없는 게시글(이미 처리함, 수집 기간 이전)에 도달했는지 확인."""
+        return any(
+            (high_water_mark is not None and self._is_processed_post(post, high_water_mark))
+            or (since is not None and self._is_before_window(post, since))
+            for post in posts
+        )
+    
+    def _remember_high_water_mark(
+        self,
+        cafe_url: str,
+        board_id: str,
+        post_ids: List[str],
+        failed_ids: Optional[Set[str]] = None,
+        failed_pages: Optional[Set[int]] = None
+    ) -> None:
+        """이번 실행에서 수집한 가장 큰 게시글 ID를 저장 대기 상태로 기록.
+        
+        본문 수집에 실패한 게시글이 있으면 최고 수위를 그중 가장 작은 ID 바로 아래로 제한하여
+        다음 증분 실행에서 다시 수집하도록 한다. 가져오지 못한 목록 페이지가 있으면 그 페이지의
+        게시글 ID를 알 수 없으므로 이번 실행에서는 최고 수위를 올리지 않는다.
+        """
+        if failed_pages:
+            self._logger.warning(
+                f"목록 페이지 {sorted(failed_pages)}을(를) 가져오지 못해 이번 실행에서는 최고 수위를 올리지 않습니다"
+            )
+            return
+        
+        numeric_ids = [int(post_id) for post_id in post_ids if post_id.isdigit()]
+        if not numeric_ids:
+            return
+        
+        high_water_mark = max(numeric_ids)
+        failed_numeric_ids = [int(post_id) for post_id in (failed_ids or ()) if post_id.isdigit()]
+        if failed_numeric_ids:
+            high_water_mark = min(high_water_mark, min(failed_numeric_ids) - 1)
+            self._logger.warning(
+                f"본문 수집에 실패한 게시글 {len(failed_numeric_ids)}개가 있어 "
+                f"최고 수위를 {high_water_mark}(으)로 제한합니다"
+            )
+        
+        previous = self._crawl_state.get_high_water_mark(cafe_url, board_id) if self._crawl_state else None
+        if previous is None or high_water_mark > previous:
+            self._pending_high_water_marks[(cafe_url, board_id)] = high_water_mark
+    
+    def save_crawl_state(self) -> None:
+        """처리가 끝난 게시판들의 최고 수위를 저장하고 체크포인트를 삭제 (시트 반영 성공 후 호출)."""
+        for checkpoint in self._finished_checkpoints:
+            self._checkpoints.discard(checkpoint)
+        self._finished_checkpoints = []
+        
+        if not self._crawl_state:
+            return
+        
+        for (cafe_url, board_id), post_id in self._pending_high_water_marks.items():
+            self._crawl_state.update_high_water_mark(cafe_url, board_id, post_id)
+        
+        self._pending_high_water_marks = {}
     
     async def _crawl_single_page(
         self, 
         cafe_url: str, 
         board_id: str, 
-        page_num: int
+        page_num: int,
+        page: Optional[Page] = None
     ) -> List[NaverPost]:
-        """단일 페이지의 게시글을 크롤링."""
-        from datetime import datetime
-        
+        """단일 페이지의 게시글을 크롤링 (이동/추출에 실패하면 CrawlingError, 빈 페이지와 구분)."""
+        page = page or self._page
         posts = []
         
         try:
             # 카페 게시판 페이지 URL 생성 (새로운 형태)
             board_url = f"{cafe_url}/{board_id}?page={page_num}"
             
-            # 페이지로 이동
-            await self._page.goto(board_url, wait_until="networkidle")
-            await self._page.wait_for_timeout(2000)  # 페이지 로드 대기
+            # 페이지로 이동 (게시글 목록이 나타나는 즉시 진행)
+            await self._waiter.navigate(page, board_url, "board")
             
             # 현재 페이지에서 직접 요소 찾기 (iframe 사용하지 않음)
-            frame = self._page
+            frame = page
             
             # iframe 구조가 있는지 먼저 확인
-            iframe_element = await self._page.query_selector("#cafe_main")
+            iframe_element = await page.query_selector("#cafe_main")
             if iframe_element:
                 inner_frame = await iframe_element.content_frame()
                 if inner_frame:
@@ -170,30 +671,17 @@ class NaverCrawlerService:
             else:
                 self._logger.info("iframe 구조가 없습니다. 직접 접근합니다.")
             
-            # 게시글 목록 수집 (다양한 선택자 시도)
-            post_elements = []
-            
-            # 최신 네이버 카페 구조 시도
-            selectors = [
-                ".article-board tbody tr",  # 기존 구조
-                ".ArticleItem",  # 새로운 구조 1
-                ".post-item",    # 새로운 구조 2
-                "[data-article-id]",  # data attribute 기반
-                "article",       # semantic HTML
-                ".list-item"     # 일반적인 목록
-            ]
-            
-            for selector in selectors:
-                post_elements = await frame.query_selector_all(selector)
-                if post_elements:
-                    self._logger.info(f"게시글 요소를 찾았습니다 (선택자: {selector}, 개수: {len(post_elements)})")
-                    break
+            # 모든 행을 한 번의 evaluate 호출로 추출 (행/필드별 왕복 제거)
+            chains = build_selector_chains()
+            extracted = await extract_board_rows(frame, chains)
+            self._record_board_selectors(extracted, chains)
+            rows = extracted.get('rows') or []
             
-            if not post_elements:
+            if not rows:
                 self._logger.warning("게시글 요소를 찾을 수 없습니다. 페이지 구조를 확인합니다.")
                 
                 # 페이지의 모든 텍스트 내용 확인 (디버깅용)
-                page_content = await frame.inner_text("body")
+                page_content = extracted.get('body_text') or ""
                 if "westudyssat" in page_content.lower():
                     self._logger.info("카페 페이지로 접근했지만 게시글 구조를 인식하지 못했습니다.")
                 else:
@@ -201,166 +689,16 @@ class NaverCrawlerService:
                 
                 return posts
             
-            for idx, post_element in enumerate(post_elements):  # 모든 게시글 처리
+            self._logger.info(
+                f"게시글 요소를 찾았습니다 (선택자: {extracted.get('list_selector')}, 개수: {len(rows)})"
+            )
+            
+            for idx, row in enumerate(rows):  # 모든 게시글 처리
                 try:
-                    # 공지사항 등 제외 (더 관대하게 처리)
-                    is_notice = await post_element.get_attribute("class")
-                    self._logger.info(f"게시글 {idx+1}: class = {is_notice}")
-                    
-                    # 공지사항 체크 활성화
-                    if is_notice and "notice" in is_notice.lower():
-                        self._logger.info(f"게시글 {idx+1}: 공지사항으로 건너뜀 (class: {is_notice})")
-                        continue
-                    
-                    # 기본 텍스트 확인
-                    element_text = await post_element.inner_text()
-                    self._logger.info(f"게시글 {idx+1} 텍스트: {element_text[:100]}...")
-                    
-                    # 게시글 ID 추출 (스크린샷 기반 정확한 구조)
-                    # 테이블의 첫 번째 열에서 게시글 번호 추출
-                    post_id_selectors = [
-                        "td:first-child",             # 첫 번째 td (가장 가능성 높음)
-                        ".td_num",                    # 번호 전용 클래스가 있을 경우
-                        ".board-number"               # 기존 선택자
-                    ]
-                    
-                    post_id = "unknown"
-                    for selector in post_id_selectors:
-                        post_id_elem = await post_element.query_selector(selector)
-                        if post_id_elem:
-                            post_id_text = await post_id_elem.inner_text()
-                            post_id = post_id_text.strip()
-                            if post_id and post_id.isdigit():
-                                break
-                    
-                    # href에서 게시글 ID 추출 (실제 구조 기반)
-                    if post_id == "unknown":
-                        link_elem = await post_element.query_selector("a.article")
-                        if link_elem:
-                            href = await link_elem.get_attribute("href")
-                            if href:
-                                import re
-                                # 실제 형태: articleid=1403 패턴에서 ID 추출
-                                if "articleid=" in href:
-                                    match = re.search(r'articleid=(\d+)', href)
-                                    if match:
-                                        post_id = match.group(1)
-                                # 백업으로 articles/2667 패턴도 체크
-                                elif "articles/" in href:
-                                    match = re.search(r'articles/(\d+)', href)
-                                    if match:
-                                        post_id = match.group(1)
-                    
-                    self._logger.info(f"게시글 {idx+1}: ID = {post_id}")
-                    
-                    # 제목 추출 (개발자 도구 기반 정확한 선택자)
-                    title_selectors = [
-                        "a.article",                 # a태그에 article 클래스 (정확한 선택자!)
-                        ".article",                  # article 클래스 직접
-                        "a[href*='articles']",       # articles가 포함된 링크
-                        "td:nth-child(2) a",         # 두 번째 td의 링크
-                        "a[href*='ArticleRead']"     # 기존 선택자
-                    ]
-                    
-                    title_elem = None
-                    for selector in title_selectors:
-                        title_elem = await post_element.query_selector(selector)
-                        if title_elem:
-                            break
-                    
-                    if not title_elem:
-                        self._logger.warning(f"게시글 {idx+1}에서 제목을 찾을 수 없습니다")
-                        continue
-                    title = await title_elem.inner_text()
-                    title = title.strip()
-                    self._logger.info(f"게시글 {idx+1} - ID: {post_id}, 제목: {title[:50]}...")
-                    
-                    # 작성자 추출 (스크린샷 기반 - 세 번째 열에 작성자가 있음)
-                    author_selectors = [
-                        "td:nth-child(3) a",         # 세 번째 td의 링크 (가장 가능성 높음)
-                        "td:nth-child(3)",           # 세 번째 td 자체
-                        ".td_name .p-nick a",        # 기존 선택자
-                        ".p-nick a",                 # 직접 선택자
-                        ".writer",                   # 일반적인 작성자
-                        ".author"                    # 작성자
-                    ]
-                    
-                    author_elem = None
-                    for selector in author_selectors:
-                        author_elem = await post_element.query_selector(selector)
-                        if author_elem:
-                            break
-                    
-                    if not author_elem:
-                        self._logger.warning(f"게시글 {idx+1}에서 작성자를 찾을 수 없습니다 - 제목에서 추출 시도")
-                        # 제목에서 이름 추출 시도
-                        from src.shared.utils import extract_name_from_title
-                        extracted_name = extract_name_from_title(title)
-                        author = extracted_name if extracted_name else "unknown_author"
-                        if extracted_name:
-                            self._logger.info(f"게시글 {idx+1}: 제목에서 이름 추출 성공 - {extracted_name}")
-                    else:
-                        author = await author_elem.inner_text()
-                    
-                    # 작성일 추출 (스크린샷 기준 네 번째 열)
-                    date_selectors = [
-                        "td:nth-child(4)",           # 네 번째 td (날짜 열)
-                        ".td_date"                   # 기존 선택자
-                    ]
-                    
-                    created_at = datetime.now()  # 기본값
-                    for selector in date_selectors:
-                        date_elem = await post_element.query_selector(selector)
-                        if date_elem:
-                            date_str = await date_elem.inner_text()
-                            try:
-                                created_at = self._parse_date(date_str)
-                                break
-                            except:
-                                continue
-                    
-                    # 게시글 URL 추출 (title_elem에서 href 가져오기)
-                    post_url = None
-                    if title_elem:
-                        href = await title_elem.get_attribute("href")
-                        if href:
-                            if href.startswith("http"):
-                                post_url = href
-                            elif href.startswith("/"):
-                                post_url = f"https://cafe.naver.com{href}"
-                            else:
-                                post_url = f"https://cafe.naver.com/{href}"
-                    
-                    # 조회수 추출 (스크린샷 기준 다섯 번째 열)
-                    view_selectors = [
-                        "td:nth-child(5)",           # 다섯 번째 td (조회수 열)
-                        ".td_view"                   # 기존 선택자
-                    ]
-                    
-                    view_count = None
-                    for selector in view_selectors:
-                        view_elem = await post_element.query_selector(selector)
-                        if view_elem:
-                            view_text = await view_elem.inner_text()
-                            try:
-                                view_count = int(view_text.strip())
-                                break
-                            except ValueError:
-                                continue
-                    
-                    # NaverPost 객체 생성 (content는 상세 페이지에서 가져와야 함)
-                    post = NaverPost(
-                        title=title,
-                        author=author,
-                        content="",  # 나중에 상세 페이지에서 채워야 함
-                        post_id=post_id,
-                        created_at=created_at,
-                        post_url=post_url,
-                        view_count=view_count
-                    )
-                    
-                    posts.append(post)
-                    self._logger.info(f"게시글 수집 성공: {post.post_id} - {post.title[:30]}... (작성자: {post.author})")
+                    post = self._build_post_from_row(row, idx)
+                    if post:
+                        posts.append(post)
+                        self._logger.info(f"게시글 수집 성공: {post.post_id} - {post.title[:30]}... (작성자: {post.author})")
                     
                 except Exception as e:
                     self._logger.error(f"게시글 {idx+1} 파싱 중 오류: {str(e)}")
@@ -371,10 +709,134 @@ class NaverCrawlerService:
             self._logger.info(f"페이지 {page_num}에서 {len(posts)}개 게시글 수집")
             
         except Exception as e:
-            self._logger.error(f"페이지 {page_num} 크롤링 중 오류: {str(e)}")
+            raise CrawlingError(f"페이지 {page_num} 크롤링 실패: {str(e)}") from e
         
         return posts
     
+    def _record_selector(self, field: str, selector: Optional[str], chain: List[str]) -> None:
+        """필드 조회 결과를 선택자 프로필에 기록 (체인 순서는 바꾸지 않고 통계로만 남김)."""
+        if self._selector_profile and self._profile_cafe_url:
+            self._selector_profile.record(self._profile_cafe_url, field, selector, chain, self._selector_stats)
+    
+    def _record_board_selectors(self, extracted: Dict[str, Any], chains: Dict[str, Any]) -> None:
+        """목록 추출 결과에서 필드별로 매칭된 선택자를 기록."""
+        if not self._selector_profile:
+            return
+        
+        self._record_selector('list', extracted.get('list_selector'), chains['list'])
+        for row in extracted.get('rows') or []:
+            matched = row.get('matched') or {}
+            for field in ('title', 'author', 'date'):
+                self._record_selector(field, matched.get(field), chains[field])
+            
+            # 번호/조회수는 숫자가 나온 첫 선택자가 사용됨
+            for field, texts in (('post_id', row.get('post_id_texts')), ('view', row.get('view_texts'))):
+                numeric_selector = None
+                for selector, text in zip(chains[field], texts or []):
+                    if text is not None and text.strip().isdigit():
+                        numeric_selector = selector
+                        break
+                self._record_selector(field, numeric_selector, chains[field])
+    
+    def _build_post_from_row(
+        self,
+        row: Dict[str, Any],
+        idx: int,
+        base_url: str = "https://cafe.naver.com"
+    ) -> Optional[NaverPost]:
+        """브라우저에서 추출한 행 데이터를 NaverPost 객체로 변환."""
+        import re
+        from datetime import datetime
+        
+        # 공지사항 등 제외
+        class_name = row.get('class_name')
+        self._logger.debug(f"게시글 {idx+1}: class = {class_name}")
+        
+        if class_name and "notice" in class_name.lower():
+            self._logger.info(f"게시글 {idx+1}: 공지사항으로 건너뜀 (class: {class_name})")
+            return None
+        
+        element_text = row.get('text') or ""
+        self._logger.debug(f"게시글 {idx+1} 텍스트: {element_text[:100]}...")
+        
+        # 게시글 ID 추출 (첫 번째 열의 번호 우선)
+        post_id = "unknown"
+        for post_id_text in row.get('post_id_texts') or []:
+            if post_id_text is None:
+                continue
+            post_id = post_id_text.strip()
+            if post_id and post_id.isdigit():
+                break
+        
+        # href에서 게시글 ID 추출 (articleid=1403 또는 articles/2667 패턴)
+        if post_id == "unknown":
+            href = row.get('article_href')
+            if href:
+                if "articleid=" in href:
+                    match = re.search(r'articleid=(\d+)', href)
+                    if match:
+                        post_id = match.group(1)
+                elif "articles/" in href:
+                    match = re.search(r'articles/(\d+)', href)
+                    if match:
+                        post_id = match.group(1)
+        
+        # 제목 추출
+        if not row.get('has_title'):
+            self._logger.warning(f"게시글 {idx+1}에서 제목을 찾을 수 없습니다")
+            return None
+        title = (row.get('title') or "").strip()
+        self._logger.debug(f"게시글 {idx+1} - ID: {post_id}, 제목: {title[:50]}...")
+        
+        # 작성자 추출 (찾지 못하면 제목에서 이름 추출)
+        author = row.get('author')
+        if author is None:
+            self._logger.warning(f"게시글 {idx+1}에서 작성자를 찾을 수 없습니다 - 제목에서 추출 시도")
+            from src.shared.utils import extract_name_from_title
+            extracted_name = extract_name_from_title(title)
+            author = extracted_name if extracted_name else "unknown_author"
+            if extracted_name:
+                self._logger.info(f"게시글 {idx+1}: 제목에서 이름 추출 성공 - {extracted_name}")
+        
+        # 작성일 추출
+        created_at = datetime.now()  # 기본값
+        date_text = row.get('date_text')
+        if date_text is not None:
+            created_at = self._parse_date(date_text)
+        
+        # 게시글 URL 추출 (제목 링크의 href)
+        post_url = None
+        href = row.get('title_href')
+        if href:
+            if href.startswith("http"):
+                post_url = href
+            elif href.startswith("/"):
+                post_url = f"{base_url}{href}"
+            else:
+                post_url = f"{base_url}/{href}"
+        
+        # 조회수 추출
+        view_count = None
+        for view_text in row.get('view_texts') or []:
+            if view_text is None:
+                continue
+            try:
+                view_count = int(view_text.strip())
+                break
+            except ValueError:
+                continue
+        
+        # NaverPost 객체 생성 (content는 상세 페이지에서 가져와야 함)
+        return NaverPost(
+            title=title,
+            author=author,
+            content="",  # 나중에 상세 페이지에서 채워야 함
+            post_id=post_id,
+            created_at=created_at,
+            post_url=post_url,
+            view_count=view_count
+        )
+    
     def _extract_cafe_id(self, cafe_url: str) -> str:
         """카페 URL에서 카페 ID 추출."""
         import re
@@ -417,15 +879,141 @@ class NaverCrawlerService:
         # 파싱 실패 시 현재 시간 반환
         return datetime.now()
     
-    async def _get_post_content(self, post_url: str) -> Optional[str]:
+    def _select_content_targets(self, posts: List[NaverPost]) -> List[NaverPost]:
+        """상세 페이지로 이동해 본문을 가져와야 하는 게시글만 반환 (통계는 실행 동안 누적)."""
+        targets = [post for post in posts if post.post_url]
+        
+        # 제목만으로 주차가 결정되는 게시글은 본문을 가져오지 않음
+        if self._lazy_content:
+            lazy_targets = [post for post in targets if post.requires_content]
+            lazy_stats = self._run_stats.setdefault(
+                'lazy_content', {'skipped_posts': 0, 'content_required_posts': 0}
+            )
+            lazy_stats['skipped_posts'] += len(targets) - len(lazy_targets)
+            lazy_stats['content_required_posts'] += len(lazy_targets)
+            targets = lazy_targets
+        
+        # 지문이 같은 본문은 캐시에서 채우고 나머지만 상세 페이지로 이동
+        if self._content_cache:
+            targets = [post for post in targets if not self._load_cached_content(post)]
+            self._run_stats['content_cache'] = self._content_cache.get_stats(self._cache_stats)
+        
+        return targets
+    
+    def _finish_content_cache(self) -> None:
+        """실행이 끝나면 본문 캐시를 정리하고 최종 통계 기록."""
+        if not self._content_cache:
+            return
+        
+        try:
+            self._content_cache.evict(self._cache_stats)
+        except Exception as e:
+            self._logger.warning(f"본문 캐시 정리 중 오류: {str(e)}")
+        self._run_stats['content_cache'] = self._content_cache.get_stats(self._cache_stats)
+    
+    async def _fetch_contents(self, targets: List[NaverPost]) -> None:
+        """브라우저 페이지 풀의 워커들이 큐를 나눠 받아 본문을 수집."""
+        queue: asyncio.Queue = asyncio.Queue()
+        for index, post in enumerate(targets):
+            queue.put_nowait((index, post))
+        
+        worker_count = min(self._detail_concurrency, len(targets))
+        self._logger.info(
+            f"총 {len(targets)}개 게시글의 상세 내용 크롤링 시작 (동시 페이지 {worker_count}개)"
+        )
+        
+        pool = await self._get_detail_pool()
+        workers = [
+            self._detail_worker(pool, queue, len(targets))
+            for _ in range(worker_count)
+        ]
+        await asyncio.gather(*workers)
+    
+    async def _get_detail_pool(self) -> PagePool:
+        """상세 수집용 페이지 풀 반환 (실행에서 처음 필요할 때 열고 이후 묶음에서 재사용)."""
+        if self._detail_pool is None:
+            pool = self._new_page_pool(self._detail_concurrency)
+            await pool.open()
+            self._detail_pool = pool
+        return self._detail_pool
+    
+    async def _close_detail_pool(self) -> None:
+        """상세 수집용 페이지 풀의 페이지를 닫기."""
+        if self._detail_pool:
+            pool, self._detail_pool = self._detail_pool, None
+            await pool.close()
+    
+    def _load_cached_content(self, post: NaverPost) -> bool:
+        """캐시된 본문이 유효하면 게시글에 채우고 True 반환."""
+        if not post.post_id.isdigit():
+            return False
+        
+        try:
+            content = self._content_cache.get(post.post_id, compute_post_fingerprint(post), self._cache_stats)
+        except Exception as e:
+            self._logger.warning(f"본문 캐시 조회 중 오류: {str(e)}")
+            return False
+        
+        if content is None:
+            return False
+        
+        post.content = content
+        return True
+    
+    def _store_fetched_content(self, post: NaverPost) -> None:
+        """상세 페이지에서 가져온 본문을 체크포인트와 캐시에 저장."""
+        if self._checkpoint:
+            self._checkpoints.record_content(self._checkpoint, post)
+        
+        if not self._content_cache or not post.post_id.isdigit():
+            return
+        
+        try:
+            self._content_cache.put(post.post_id, compute_post_fingerprint(post), post.content)
+        except Exception as e:
+            self._logger.warning(f"본문 캐시 저장 중 오류: {str(e)}")
+    
+    async def _detail_worker(self, pool: PagePool, queue: asyncio.Queue, total: int) -> None:
+        """큐가 빌 때까지 게시글을 꺼내 상세 내용을 수집하는 워커."""
+        while True:
+            try:
+                index, post = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            
+            # 한 게시글의 실패가 다른 게시글이나 워커에 영향을 주지 않도록 격리
+            try:
+                async with pool.acquire() as page:
+                    content = await self._get_post_content(post.post_url, page)
+                    
+                    if content:
+                        post.content = content
+                        self._store_fetched_content(post)
+                        self._logger.debug(f"게시글 {index+1}/{total} 내용 수집 완료")
+                    elif content is None:
+                        self._failed_detail_ids.add(post.post_id)
+                        self._logger.warning(f"게시글 {post.post_id} 내용 수집 실패")
+                    else:
+                        self._logger.warning(f"게시글 {post.post_id} 본문이 비어 있습니다")
+                    
+                    # 속도 제한기가 없을 때만 고정 대기로 너무 빠른 요청 방지 (재생 중에는 대기 불필요)
+                    if not self._rate_limiter and not self._replaying and not queue.empty() and not page.is_closed():
+                        await page.wait_for_timeout(500)
+                        
+            except Exception as e:
+                self._failed_detail_ids.add(post.post_id)
+                self._logger.error(f"게시글 {post.post_id} 상세 수집 중 오류: {str(e)}")
+    
+    async def _get_post_content(self, post_url: str, page: Optional[Page] = None) -> Optional[str]:
         """게시글 상세 페이지에서 본문 내용을 가져오기."""
+        page = page or self._page
+        
         try:
             # 게시글 상세 페이지로 이동
-            await self._page.goto(post_url, wait_until="networkidle")
-            await self._page.wait_for_timeout(1000)
+            await self._waiter.navigate(page, post_url, "detail")
             
             # iframe으로 전환
-            iframe_element = await self._page.query_selector("#cafe_main")
+            iframe_element = await page.query_selector("#cafe_main")
             if not iframe_element:
                 self._logger.error("상세 페이지 iframe을 찾을 수 없습니다")
                 return None
@@ -436,48 +1024,71 @@ class NaverCrawlerService:
                 return None
             
             # 본문 내용 추출
-            content_selectors = [
-                ".se-main-container",  # 스마트에디터 ONE
-                ".ContentRenderer",     # 새로운 에디터
-                "#postViewArea",       # 구 에디터
-                ".NHN_Writeform_Main", # 구 에디터2
-                ".content.CafeViewer"  # 모바일 에디터
-            ]
-            
             content = ""
-            for selector in content_selectors:
+            matched_selector = None
+            for selector in CONTENT_SELECTORS:
                 content_elem = await frame.query_selector(selector)
                 if content_elem:
                     content = await content_elem.inner_text()
                     if content.strip():
+                        matched_selector = selector
                         break
             
+            self._record_selector('content', matched_selector, CONTENT_SELECTORS)
             return content.strip()
             
         except Exception as e:
             self._logger.error(f"게시글 내용 가져오기 중 오류: {str(e)}")
             return None
     
-    def _remove_duplicate_posts(self, posts: List[NaverPost]) -> List[NaverPost]:
-        """중복 게시글 제거 (post_id 기준)."""
-        seen_ids = set()
-        unique_posts = []
+    def get_crawl_stats(self) -> Dict[str, Any]:
+        """이번 실행의 크롤링 통계 반환."""
+        stats: Dict[str, Any] = dict(self._run_stats)
+        stats['waits'] = self._waiter.get_stats()
         
-        for post in posts:
-            if post.post_id not in seen_ids:
-                seen_ids.add(post.post_id)
-                unique_posts.append(post)
-            else:
-                self._logger.debug(f"중복 게시글 제거: ID={post.post_id}, 제목={post.title}")
+        if self._resource_blocker:
+            stats['resource_blocking'] = self._resource_blocker.stats.to_dict()
+        
+        if self._selector_profile:
+            stats['selectors'] = self._selector_profile.get_stats(self._selector_stats)
+        
+        if self._rate_limiter:
+            stats['rate_limit'] = self._rate_limiter.get_stats(self._rate_limit_stats)
         
-        if len(posts) != len(unique_posts):
-            self._logger.info(f"중복 게시글 {len(posts) - len(unique_posts)}개 제거됨")
+        if self._memory_monitor:
+            stats['memory'] = dict(self._memory_monitor.get_stats(), **self._page_recycle_stats.to_dict())
         
-        return unique_posts
+        if self._snapshot:
+            stats['snapshot'] = dict(self._snapshot.stats.to_dict(), name=self._snapshot.name, mode=self._snapshot.mode)
+        
+        return stats
+    
+    def get_selector_profile(self) -> Dict[str, Any]:
+        """카페/필드별 가장 많이 맞은 선택자와 적중률 반환 (프로필을 쓰지 않으면 빈 딕셔너리)."""
+        return self._selector_profile.get_profile() if self._selector_profile else {}
     
     async def close(self) -> None:
         """브라우저 리소스 정리."""
+        if self._resource_blocker:
+            blocked = self._resource_blocker.stats
+            self._logger.info(
+                f"리소스 차단 결과: {blocked.blocked_requests}개 요청 차단 "
+                f"(추정 {blocked.estimated_blocked_bytes / 1024:.0f}KB), "
+                f"{blocked.allowed_requests}개 요청 허용"
+            )
+        
+        # 실행 중 갱신된 쿠키와 웹 스토리지를 다음 실행과 다른 워커를 위해 저장
+        if self._session_ready and self._context:
+            await self._save_session_state()
+            self._session_ready = False
+        
+        if self._snapshot:
+            self._snapshot.save()
+        
         try:
+            await self._close_detail_pool()
+            if self._lease:
+                await self._release_lease()
             if self._browser:
                 await self._browser.close()
             if hasattr(self, '_playwright'):
@@ -489,34 +1100,51 @@ class NaverCrawlerService:
             self._logger.error(f"브라우저 종료 중 오류 발생: {str(e)}")
     
     async def _try_login_with_cookies(self) -> bool:
-        """저장된 쿠키를 사용하여 로그인 시도."""
-        if not self._cookies_path.exists():
-            self._logger.info("저장된 쿠키가 없습니다")
-            return False
-        
+        """복원된 세션 쿠키로 로그인 시도 (만료는 로컬에서 확인하고, 검증 기록이 오래됐을 때만 이동하여 확인)."""
         try:
-            with open(self._cookies_path, 'r', encoding='utf-8') as f:
-                cookies = json.load(f)
+            # 다른 대상/워커가 그 사이 갱신한 세션 쿠키를 반영
+            await self._session_store.apply(self._page.context, include_storage=False)
             
-            await self._page.context.add_cookies(cookies)
-            await self._page.goto("https://www.naver.com", wait_until="networkidle")
+            cookies = await self._page.context.cookies()
+            if not has_valid_session_cookies(cookies):
+                self._logger.info("유효한 로그인 쿠키가 없습니다")
+                return False
+            
+            fingerprint = session_fingerprint(cookies)
+            if self._session_cache and self._session_cache.is_verified(fingerprint):
+                self._logger.info("최근 검증된 세션이므로 확인 이동 없이 자동 로그인합니다")
+                return True
             
             if await self._verify_login_success():
+                if self._session_cache:
+                    self._session_cache.record(fingerprint)
                 self._logger.info("쿠키를 사용한 자동 로그인 성공")
                 return True
-            else:
-                self._logger.info("저장된 쿠키가 만료되었습니다")
-                return False
+            
+            if self._session_cache:
+                self._session_cache.invalidate()
+            self._logger.info("저장된 쿠키가 만료되었습니다")
+            return False
                 
         except Exception as e:
             self._logger.warning(f"쿠키 로그인 시도 중 오류: {str(e)}")
             return False
     
+    async def _has_fresh_session(self) -> bool:
+        """로그인 직후 세션 쿠키가 발급되었는지 로컬에서 확인하고 검증 결과를 기록."""
+        cookies = await self._page.context.cookies()
+        if not has_valid_session_cookies(cookies):
+            return False
+        
+        if self._session_cache:
+            self._session_cache.record(session_fingerprint(cookies))
+        return True
+    
     async def _verify_login_success(self) -> bool:
         """로그인 성공 여부를 확인."""
         try:
             # 네이버 메인페이지로 이동하여 로그인 상태 확인
-            await self._page.goto("https://www.naver.com", wait_until="networkidle")
+            await self._waiter.navigate(self._page, "https://www.naver.com", "verify")
             
             # 로그인된 사용자의 프로필 영역 확인
             profile_selector = ".MyView-module__link_login___HpHMW, .area_links .link_login"
@@ -535,17 +1163,9 @@ class NaverCrawlerService:
             self._logger.error(f"로그인 확인 중 오류: {str(e)}")
             return False
     
-    async def _save_cookies(self) -> None:
-        """현재 세션의 쿠키를 저장."""
+    async def _save_session_state(self) -> None:
+        """현재 컨텍스트의 세션 저장 상태를 바뀐 경우에만 저장."""
         try:
-            # data 디렉토리가 없으면 생성
-            self._cookies_path.parent.mkdir(exist_ok=True)
-            
-            cookies = await self._page.context.cookies()
-            with open(self._cookies_path, 'w', encoding='utf-8') as f:
-                json.dump(cookies, f, ensure_ascii=False, indent=2)
-            
-            self._logger.info(f"쿠키를 {self._cookies_path}에 저장했습니다")
-            
+            await self._session_store.capture_and_save(self._context)
         except Exception as e:
-            self._logger.error(f"쿠키 저장 중 오류: {str(e)}")
\ No newline at end of file
+            self._logger.error(f"세션 저장 상태 저장 중 오류: {str(e)}")
@@ -0,0 +1,303 @@
+"""로그인 세션 모듈 - 브라우저 저장 상태 보관, 쿠키 만료의 로컬 확인, 검증 결과 캐시."""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+from playwright.async_api import BrowserContext
+
+from ..core.logger import get_logger
+
+
+# 네이버 로그인 세션을 나타내는 쿠키 (둘 다 있어야 로그인 상태)
+SESSION_COOKIE_NAMES = ("NID_AUT", "NID_SES")
+
+# 새 문서가 열릴 때 저장해 둔 localStorage/sessionStorage 항목을 같은 출처에 복원하는 스크립트.
+# 이미 값이 있는 키는 덮어쓰지 않는다.
+RESTORE_STORAGE_SCRIPT = """
+(() => {
+    const state = %s;
+    const restore = (storage, items) => {
+        for (const [key, value] of Object.entries(items || {})) {
+            if (storage.getItem(key) === null) {
+                storage.setItem(key, value);
+            }
+        }
+    };
+    try {
+        restore(window.localStorage, state.local[window.location.origin]);
+        restore(window.sessionStorage, state.session[window.location.origin]);
+    } catch (e) {}
+})();
+"""
+
+# 열린 페이지의 출처와 sessionStorage 항목을 읽는 스크립트 (storage_state에는 포함되지 않음)
+READ_SESSION_STORAGE_SCRIPT = """
+() => {
+    const items = {};
+    for (let i = 0; i < window.sessionStorage.length; i++) {
+        const key = window.sessionStorage.key(i);
+        items[key] = window.sessionStorage.getItem(key);
+    }
+    return {origin: window.location.origin, items: items};
+}
+"""
+
+
+def _find_session_cookies(cookies: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """쿠키 목록에서 세션 쿠키만 이름별로 추출."""
+    return {
+        cookie['name']: cookie
+        for cookie in cookies
+        if cookie.get('name') in SESSION_COOKIE_NAMES
+    }
+
+
+def has_valid_session_cookies(
+    cookies: List[Dict[str, Any]],
+    margin_seconds: int = 60,
+    now: Optional[float] = None
+) -> bool:
+    """세션 쿠키가 모두 있고 만료되지 않았는지 로컬에서 확인 (expires -1은 브라우저 세션 쿠키)."""
+    session_cookies = _find_session_cookies(cookies)
+    if len(session_cookies) != len(SESSION_COOKIE_NAMES):
+        return False
+
+    now = time.time() if now is None else now
+    for cookie in session_cookies.values():
+        if not cookie.get('value'):
+            return False
+        expires = cookie.get('expires', -1)
+        if expires is not None and expires >= 0 and expires <= now + margin_seconds:
+            return False
+
+    return True
+
+
+def session_fingerprint(cookies: List[Dict[str, Any]]) -> Optional[str]:
+    """세션 쿠키의 이름, 도메인, 값으로 만든 지문 반환 (세션 쿠키가 없으면 None).
+
+    만료 시각 등 갱신될 때마다 바뀌는 속성은 제외하여 같은 세션이면 같은 지문이 나오게 한다.
+    """
+    session_cookies = _find_session_cookies(cookies)
+    if len(session_cookies) != len(SESSION_COOKIE_NAMES):
+        return None
+
+    joined = "|".join(
+        f"{name}={session_cookies[name].get('domain', '')}:{session_cookies[name].get('value', '')}"
+        for name in SESSION_COOKIE_NAMES
+    )
+    return hashlib.sha1(joined.encode('utf-8')).hexdigest()
+
+
+class SessionVerdictCache:
+    """네트워크로 확인한 로그인 성공 결과를 세션 지문과 함께 TTL 동안 보관하는 캐시."""
+
+    def __init__(self, verdict_path: str = "data/session_verdict.json", ttl_minutes: float = 30) -> None:
+        """판정 파일 경로와 유효 시간으로 캐시 초기화."""
+        self._verdict_path = Path(verdict_path)
+        self._ttl_seconds = ttl_minutes * 60
+        self._logger = get_logger(__name__)
+
+    def is_verified(self, fingerprint: Optional[str]) -> bool:
+        """같은 세션이 TTL 안에 검증된 적이 있는지 확인."""
+        if not fingerprint or self._ttl_seconds <= 0:
+            return False
+
+        verdict = self._load_verdict()
+        if verdict.get('fingerprint') != fingerprint:
+            return False
+
+        return time.time() - verdict.get('verified_at', 0) < self._ttl_seconds
+
+    def record(self, fingerprint: Optional[str]) -> None:
+        """세션 검증 성공을 기록."""
+        if not fingerprint:
+            return
+
+        self._save_verdict({'fingerprint': fingerprint, 'verified_at': time.time()})
+
+    def invalidate(self) -> None:
+        """세션이 유효하지 않은 것으로 확인되면 기록 삭제."""
+        try:
+            self._verdict_path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self._logger.error(f"세션 검증 기록 삭제 중 오류: {str(e)}")
+
+    def _load_verdict(self) -> Dict[str, Any]:
+        """판정 파일에서 데이터 로드."""
+        try:
+            if not self._verdict_path.exists():
+                return {}
+
+            with open(self._verdict_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+
+        except Exception as e:
+            self._logger.error(f"세션 검증 기록 로드 중 오류: {str(e)}")
+            return {}
+
+    def _save_verdict(self, verdict: Dict[str, Any]) -> None:
+        """판정 데이터를 임시 파일에 쓴 뒤 교체하여 원자적으로 저장."""
+        try:
+            self._verdict_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self._verdict_path.with_suffix('.tmp')
+
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(verdict, f, ensure_ascii=False, indent=2)
+
+            os.replace(temp_path, self._verdict_path)
+
+        except Exception as e:
+            self._logger.error(f"세션 검증 기록 저장 중 오류: {str(e)}")
+
+
+class SessionStateStore:
+    """쿠키, localStorage, sessionStorage를 포함한 브라우저 저장 상태를 한 파일에 보관하는 저장소.
+
+    같은 프로세스의 모든 컨텍스트가 하나의 인스턴스를 공유하고, 다른 프로세스가 교체한 파일은
+    수정 시각으로 감지하여 다시 읽는다. 내용이 바뀐 경우에만 원자적으로 기록한다.
+    """
+
+    def __init__(self, state_path: str = "data/naver_cookies.json") -> None:
+        """저장 상태 파일 경로로 저장소 초기화."""
+        self._state_path = Path(state_path)
+        self._logger = get_logger(__name__)
+        self._state: Optional[Dict[str, Any]] = None
+        self._digest: Optional[str] = None
+        self._loaded_mtime: Optional[float] = None
+        self.writes = 0
+        self.skipped_writes = 0
+
+    @property
+    def state_path(self) -> Path:
+        """저장 상태 파일 경로."""
+        return self._state_path
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """저장 상태 반환 (파일이 바뀌었으면 다시 읽음, 없으면 None)."""
+        try:
+            mtime = self._state_path.stat().st_mtime
+        except FileNotFoundError:
+            return self._state
+
+        if self._state is not None and mtime == self._loaded_mtime:
+            return self._state
+
+        try:
+            with open(self._state_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            self._logger.warning(f"세션 저장 상태 로드 중 오류: {str(e)}")
+            return self._state
+
+        # 기존 형식(쿠키 목록만 저장)과 NAVER_COOKIES_JSON으로 받은 쿠키 목록도 그대로 사용
+        if isinstance(data, list):
+            data = {'cookies': data, 'origins': []}
+
+        self._state = self._normalize(data)
+        self._digest = self._compute_digest(self._state)
+        self._loaded_mtime = mtime
+        return self._state
+
+    def get_cookies(self) -> List[Dict[str, Any]]:
+        """저장된 쿠키 목록 반환."""
+        state = self.load()
+        return list(state['cookies']) if state else []
+
+    def save(self, state: Dict[str, Any]) -> bool:
+        """저장 상태가 바뀌었을 때만 임시 파일에 쓴 뒤 교체하여 저장 (기록했으면 True)."""
+        self.load()
+        state = self._normalize(state)
+        digest = self._compute_digest(state)
+
+        if digest == self._digest:
+            self.skipped_writes += 1
+            return False
+
+        try:
+            self._state_path.parent.mkdir(parents=True, exist_ok=True)
+            # 여러 워커가 동시에 저장해도 임시 파일이 겹치지 않도록 pid를 붙임
+            temp_path = self._state_path.with_suffix(f'.{os.getpid()}.tmp')
+
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f, ensure_ascii=False, indent=2)
+
+            os.replace(temp_path, self._state_path)
+
+        except Exception as e:
+            self._logger.error(f"세션 저장 상태 기록 중 오류: {str(e)}")
+            return False
+
+        self._state = state
+        self._digest = digest
+        self._loaded_mtime = self._state_path.stat().st_mtime
+        self.writes += 1
+        self._logger.info(f"세션 저장 상태를 {self._state_path}에 저장했습니다")
+        return True
+
+    async def capture(self, context: BrowserContext) -> Dict[str, Any]:
+        """컨텍스트의 쿠키/localStorage와 열린 페이지의 sessionStorage를 수집."""
+        state = await context.storage_state()
+        session_storage: Dict[str, Dict[str, str]] = {}
+
+        for page in context.pages:
+            try:
+                snapshot = await page.evaluate(READ_SESSION_STORAGE_SCRIPT)
+            except Exception:
+                continue
+            if snapshot['items'] and snapshot['origin'] not in ("null", ""):
+                session_storage.setdefault(snapshot['origin'], {}).update(snapshot['items'])
+
+        # 이번에 열린 페이지가 없던 출처의 sessionStorage는 이전 값을 유지
+        previous = self.load()
+        merged = dict(previous['session_storage']) if previous else {}
+        merged.update(session_storage)
+        state['session_storage'] = merged
+        return state
+
+    async def capture_and_save(self, context: BrowserContext) -> bool:
+        """컨텍스트 상태를 수집하여 바뀐 경우에만 저장."""
+        return self.save(await self.capture(context))
+
+    async def apply(self, context: BrowserContext, include_storage: bool = True) -> None:
+        """저장 상태를 컨텍스트에 복원 (쿠키는 즉시, 웹 스토리지는 이후 열리는 문서마다)."""
+        state = self.load()
+        if not state:
+            return
+
+        if state['cookies']:
+            await context.add_cookies(state['cookies'])
+
+        if include_storage and (state['origins'] or state['session_storage']):
+            await context.add_init_script(script=self._build_restore_script(state))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """저장 횟수 통계 반환."""
+        return {'writes': self.writes, 'skipped_writes': self.skipped_writes}
+
+    def _build_restore_script(self, state: Dict[str, Any]) -> str:
+        """저장 상태를 출처별 항목으로 묶어 복원 스크립트 생성."""
+        local = {
+            origin['origin']: {item['name']: item['value'] for item in origin.get('localStorage', [])}
+            for origin in state['origins']
+        }
+        payload = {'local': local, 'session': state['session_storage']}
+        return RESTORE_STORAGE_SCRIPT % json.dumps(payload, ensure_ascii=False)
+
+    def _normalize(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """누락된 키를 채운 저장 상태 반환."""
+        return {
+            'cookies': state.get('cookies') or [],
+            'origins': state.get('origins') or [],
+            'session_storage': state.get('session_storage') or {}
+        }
+
+    def _compute_digest(self, state: Dict[str, Any]) -> str:
+        """저장 상태의 변경 여부를 판단할 해시 계산."""
+        serialized = json.dumps(state, ensure_ascii=False, sort_keys=True)
+        return hashlib.sha1(serialized.encode('utf-8')).hexdigest()
@@ -0,0 +1,191 @@
+"""페이지 스냅샷 모듈 - 방문한 게시판/게시글 문서를 기록하고 요청 가로채기로 오프라인 재생."""
+
+import asyncio
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Any, Tuple
+from playwright.async_api import BrowserContext, Route
+
+from ..core.logger import get_logger
+from ..core.exceptions import NaverCrawlerError
+
+
+SNAPSHOT_MODES: Tuple[str, ...] = ("record", "replay")
+
+# 재생 시 그대로 돌려줄 응답 헤더 (쿠키 등 세션 정보는 저장하지 않음)
+REPLAYED_HEADERS: Tuple[str, ...] = ("content-type",)
+
+MANIFEST_FILE = "manifest.json"
+
+
+@dataclass
+class SnapshotStats:
+    """실행 중 기록/재생된 요청 통계."""
+
+    recorded: int = 0
+    served: int = 0
+    missed: int = 0
+    recorded_bytes: int = 0
+    served_bytes: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리 형태로 변환."""
+        return {
+            'recorded': self.recorded,
+            'served': self.served,
+            'missed': self.missed,
+            'recorded_bytes': self.recorded_bytes,
+            'served_bytes': self.served_bytes
+        }
+
+
+class PageSnapshot:
+    """이름 붙은 스냅샷 디렉터리에 응답을 기록하거나, 기록된 응답으로 요청을 대신 처리.
+
+    record 모드는 차단되지 않은 GET 응답(문서, 스크립트, 스타일, API 응답 등)을 네트워크에서 받아
+    그대로 페이지에 넘기면서 저장하고, replay 모드는 저장된 응답을 (선택적으로 지연을 넣어) 돌려주며
+    나머지 요청은 중단한다. 차단 규칙은 리소스 차단 핸들러가 이 핸들러보다 먼저 적용한다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        mode: str,
+        root_dir: str = "data/snapshots",
+        latency_ms: int = 0
+    ) -> None:
+        """스냅샷 이름과 모드(record/replay), 재생 지연으로 초기화."""
+        if mode not in SNAPSHOT_MODES:
+            raise NaverCrawlerError(f"지원하지 않는 스냅샷 모드입니다: {mode}")
+
+        self.name = name
+        self.mode = mode
+        self._snapshot_dir = Path(root_dir) / name
+        self._latency_seconds = max(0, latency_ms) / 1000
+        self._logger = get_logger(__name__)
+        self._manifest: Dict[str, Dict[str, Any]] = self._load_manifest()
+        self._dirty = False
+        self.stats = SnapshotStats()
+
+        if self.replaying and not self._manifest:
+            raise NaverCrawlerError(f"재생할 스냅샷이 없습니다: {self._snapshot_dir}")
+
+    @property
+    def replaying(self) -> bool:
+        """재생 모드 여부."""
+        return self.mode == "replay"
+
+    async def install(self, context: BrowserContext) -> None:
+        """컨텍스트의 모든 요청에 기록/재생 핸들러 등록."""
+        await context.route("**/*", self._handle_route)
+        self._logger.info(
+            f"스냅샷 '{self.name}' {self.mode} 모드 적용 "
+            f"(저장 응답 {len(self._manifest)}개, 지연 {self._latency_seconds * 1000:.0f}ms)"
+        )
+
+    async def uninstall(self, context: BrowserContext) -> None:
+        """컨텍스트에서 기록/재생 핸들러 제거."""
+        await context.unroute("**/*", self._handle_route)
+
+    async def _handle_route(self, route: Route) -> None:
+        """모드에 따라 요청을 기록하거나 저장된 응답으로 처리."""
+        if self.replaying:
+            await self._replay(route)
+        else:
+            await self._record(route)
+
+    async def _record(self, route: Route) -> None:
+        """GET 요청은 직접 받아 저장한 뒤 페이지에 전달하고, 나머지는 다음 핸들러로 넘김."""
+        request = route.request
+        if request.method != "GET":
+            await route.fallback()
+            return
+
+        response = await route.fetch()
+        body = await response.body()
+        self._store(request.method, request.url, response.status, response.headers, body)
+        await route.fulfill(response=response, body=body)
+
+    async def _replay(self, route: Route) -> None:
+        """저장된 응답이 있으면 지연 후 돌려주고, 없으면 네트워크로 나가지 않도록 중단."""
+        request = route.request
+        entry = self._manifest.get(self._make_key(request.method, request.url))
+
+        if entry is None:
+            if request.method == "GET":
+                self.stats.missed += 1
+                self._logger.debug(f"스냅샷에 없는 요청 ({request.resource_type}): {request.url}")
+            await route.abort("blockedbyclient")
+            return
+
+        body = (self._snapshot_dir / entry['body_file']).read_bytes()
+        if self._latency_seconds:
+            await asyncio.sleep(self._latency_seconds)
+
+        self.stats.served += 1
+        self.stats.served_bytes += len(body)
+        await route.fulfill(status=entry['status'], headers=entry['headers'], body=body)
+
+    def _store(self, method: str, url: str, status: int, headers: Dict[str, str], body: bytes) -> None:
+        """응답 본문을 파일로 저장하고 매니페스트에 등록 (같은 URL은 마지막 응답으로 교체)."""
+        key = self._make_key(method, url)
+        body_file = f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.bin"
+
+        try:
+            self._snapshot_dir.mkdir(parents=True, exist_ok=True)
+            (self._snapshot_dir / body_file).write_bytes(body)
+        except OSError as e:
+            self._logger.error(f"스냅샷 응답 저장 중 오류: {str(e)}")
+            return
+
+        self._manifest[key] = {
+            'method': method,
+            'url': url,
+            'status': status,
+            'headers': {name: value for name, value in headers.items() if name.lower() in REPLAYED_HEADERS},
+            'body_file': body_file
+        }
+        self._dirty = True
+        self.stats.recorded += 1
+        self.stats.recorded_bytes += len(body)
+
+    def save(self) -> None:
+        """기록한 내용이 있으면 매니페스트를 저장."""
+        if not self._dirty:
+            return
+
+        try:
+            self._snapshot_dir.mkdir(parents=True, exist_ok=True)
+            manifest_path = self._snapshot_dir / MANIFEST_FILE
+            temp_path = manifest_path.with_suffix('.tmp')
+
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._manifest, f, ensure_ascii=False, indent=2)
+
+            os.replace(temp_path, manifest_path)
+            self._dirty = False
+            self._logger.info(f"스냅샷 '{self.name}' 저장 완료: 응답 {len(self._manifest)}개")
+
+        except Exception as e:
+            self._logger.error(f"스냅샷 매니페스트 저장 중 오류: {str(e)}")
+
+    def _make_key(self, method: str, url: str) -> str:
+        """요청 메서드와 URL로 매니페스트 키 생성."""
+        return f"{method} {url}"
+
+    def _load_manifest(self) -> Dict[str, Dict[str, Any]]:
+        """저장된 매니페스트 로드 (기록을 이어 붙일 때도 사용)."""
+        manifest_path = self._snapshot_dir / MANIFEST_FILE
+        try:
+            if not manifest_path.exists():
+                return {}
+
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+
+        except Exception as e:
+            self._logger.error(f"스냅샷 매니페스트 로드 중 오류: {str(e)}")
+            return {}
@@ -0,0 +1,183 @@
+"""페이지 준비 대기 모듈 - 고정 대기 대신 필요한 요소가 나타나는 즉시 진행."""
+
+import time
+from dataclasses import dataclass
+from typing import Dict, Any, Optional
+from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
+
+from ..core.logger import get_logger
+from .extraction import LIST_SELECTORS, CONTENT_SELECTORS
+from .rate_limiter import AdaptiveRateLimiter, RateLimitStats, is_blocked_url
+
+
+# 카페 본문은 구형 구조에서 이 iframe 안에 렌더링됨
+CAFE_IFRAME_SELECTOR = "#cafe_main"
+
+# 로그인 화면으로 이동하는 것이 정상인 단계 (차단 화면 판정에서 제외)
+LOGIN_STAGES = ("login",)
+
+
+@dataclass
+class WaitStage:
+    """이동 단계별 준비 완료 선택자와 제한 시간."""
+
+    ready_selector: str
+    timeout_ms: int = 10000
+    fallback_sleep_ms: int = 0  # 선택자를 찾지 못했을 때 적용하던 기존 고정 대기
+    in_cafe_frame: bool = False  # 준비 선택자를 #cafe_main iframe 안에서도 찾을지 여부
+
+
+DEFAULT_WAIT_STAGES: Dict[str, WaitStage] = {
+    'login': WaitStage(ready_selector="#id"),
+    'verify': WaitStage(ready_selector=".link_login, [class*='MyView-module']"),
+    'board': WaitStage(
+        ready_selector=", ".join(LIST_SELECTORS),
+        fallback_sleep_ms=2000,
+        in_cafe_frame=True
+    ),
+    'detail': WaitStage(
+        ready_selector=", ".join(CONTENT_SELECTORS),
+        fallback_sleep_ms=1000,
+        in_cafe_frame=True
+    )
+}
+
+
+@dataclass
+class StageWaitStats:
+    """단계별 이동 대기 시간 통계."""
+
+    navigations: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    fallbacks: int = 0
+
+    def record(self, elapsed_ms: float, fell_back: bool) -> None:
+        """이동 한 건의 대기 시간을 반영."""
+        self.navigations += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        if fell_back:
+            self.fallbacks += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리 형태로 변환."""
+        return {
+            'navigations': self.navigations,
+            'total_ms': round(self.total_ms),
+            'avg_ms': round(self.total_ms / self.navigations) if self.navigations else 0,
+            'max_ms': round(self.max_ms),
+            'fallbacks': self.fallbacks
+        }
+
+
+class ReadinessWaiter:
+    """페이지 이동 후 단계별 준비 선택자가 나타날 때까지만 기다리는 대기 전략."""
+
+    def __init__(
+        self,
+        stages: Optional[Dict[str, WaitStage]] = None,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None
+    ) -> None:
+        """단계별 대기 설정과 (모든 이동이 공유할) 속도 제한기로 초기화."""
+        self._stages = dict(DEFAULT_WAIT_STAGES)
+        if stages:
+            self._stages.update(stages)
+        self._rate_limiter = rate_limiter
+        self._rate_limit_stats: Optional[RateLimitStats] = None
+        self._logger = get_logger(__name__)
+        self._stats: Dict[str, StageWaitStats] = {}
+
+    async def navigate(self, page: Page, url: str, stage: str) -> None:
+        """URL로 이동한 뒤 단계의 준비 선택자를 기다리고, 실패하면 기존 방식으로 대기."""
+        wait_stage = self._stages[stage]
+        started = time.perf_counter()
+
+        await self._goto(page, url, stage)
+
+        fell_back = False
+        if not await self._wait_until_ready(page, wait_stage):
+            fell_back = True
+            self._logger.debug(f"'{stage}' 준비 선택자를 찾지 못해 기존 대기 방식 사용: {url}")
+            await self._fallback_wait(page, wait_stage)
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self._stats.setdefault(stage, StageWaitStats()).record(elapsed_ms, fell_back)
+        self._logger.debug(f"'{stage}' 이동 대기 {elapsed_ms:.0f}ms: {url}")
+
+    async def _goto(self, page: Page, url: str, stage: str) -> None:
+        """속도 제한기의 허용을 받아 이동하고, 응답 시간/상태/차단 화면 여부를 속도 제한기에 알림."""
+        if not self._rate_limiter:
+            await page.goto(url, wait_until="domcontentloaded")
+            return
+
+        async with self._rate_limiter.slot(self._rate_limit_stats):
+            started = time.perf_counter()
+            response = None
+            try:
+                response = await page.goto(url, wait_until="domcontentloaded")
+            finally:
+                self._rate_limiter.record(
+                    (time.perf_counter() - started) * 1000,
+                    status=response.status if response else None,
+                    blocked=stage not in LOGIN_STAGES and is_blocked_url(page.url),
+                    stats=self._rate_limit_stats
+                )
+
+    async def _wait_until_ready(self, page: Page, wait_stage: WaitStage) -> bool:
+        """준비 선택자(또는 카페 iframe 안의 준비 선택자)가 나타났는지 확인."""
+        deadline = time.perf_counter() + wait_stage.timeout_ms / 1000
+        selector = wait_stage.ready_selector
+        if wait_stage.in_cafe_frame:
+            selector = f"{CAFE_IFRAME_SELECTOR}, {selector}"
+
+        try:
+            element = await page.wait_for_selector(selector, timeout=wait_stage.timeout_ms)
+        except PlaywrightTimeoutError:
+            return False
+
+        if not wait_stage.in_cafe_frame or element is None:
+            return element is not None
+
+        # iframe이 먼저 나타난 경우 남은 시간 동안 iframe 안의 준비 선택자를 기다림
+        iframe_element = await page.query_selector(CAFE_IFRAME_SELECTOR)
+        if not iframe_element:
+            return True
+
+        frame = await iframe_element.content_frame()
+        if not frame:
+            return False
+
+        # timeout=0은 무제한 대기이므로 최소 1ms로 제한
+        remaining_ms = max(1, (deadline - time.perf_counter()) * 1000)
+        try:
+            await frame.wait_for_selector(wait_stage.ready_selector, timeout=remaining_ms)
+            return True
+        except PlaywrightTimeoutError:
+            return False
+
+    async def _fallback_wait(self, page: Page, wait_stage: WaitStage) -> None:
+        """기존 동작처럼 networkidle과 고정 대기를 적용."""
+        try:
+            await page.wait_for_load_state("networkidle", timeout=wait_stage.timeout_ms)
+        except PlaywrightTimeoutError:
+            self._logger.debug("networkidle 대기 시간 초과")
+
+        if wait_stage.fallback_sleep_ms:
+            await page.wait_for_timeout(wait_stage.fallback_sleep_ms)
+
+    def reset_stats(self) -> None:
+        """실행별 대기 통계 초기화."""
+        self._stats = {}
+
+    def set_rate_limit_stats(self, stats: Optional[RateLimitStats]) -> None:
+        """공유 속도 제한기에서 이 크롤러의 이동만 집계할 통계 지정."""
+        self._rate_limit_stats = stats
+
+    def total_navigations(self) -> int:
+        """이번 실행에서 수행한 전체 이동 횟수."""
+        return sum(stats.navigations for stats in self._stats.values())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """단계별 대기 통계 반환."""
+        return {stage: stats.to_dict() for stage, stats in self._stats.items()}
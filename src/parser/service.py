@@ -1,14 +1,14 @@
 """데이터 파싱 서비스 모듈."""
 
 import re
-from typing import List, Dict, Set, Optional, Tuple
+from typing import List, Dict, Set, Optional, Tuple, AsyncIterable
 from datetime import datetime, timedelta
 from bs4 import BeautifulSoup
 
 from ..core.logger import get_logger, log_execution_time
 from ..core.exceptions import ParsingError
 from ..naver_crawler.models import NaverPost
-from ..shared.utils import extract_week_number, get_kst_now
+from ..shared.utils import extract_week_number, get_kst_now, normalize_participant_name
 
 
 class DataParsingService:
@@ -30,32 +30,66 @@ class DataParsingService:
         
         try:
             for post in posts:
-                week_number = self._extract_week_from_post(post)
-                if week_number:
-                    author = self._normalize_author_name(post.author)
-                    
-                    if week_number not in weekly_submissions:
-                        weekly_submissions[week_number] = set()
-                    
-                    weekly_submissions[week_number].add(author)
-                    
-                    self._logger.debug(f"주차별 제출 추가: {author} -> {week_number}주차")
-            
-            total_submissions = sum(len(authors) for authors in weekly_submissions.values())
-            self._logger.info(
-                f"주차별 제출 정보 추출 완료: "
-                f"{len(weekly_submissions)}개 주차, 총 {total_submissions}건"
-            )
-            
-            # 디버깅을 위해 실제 데이터 출력
-            for week, authors in weekly_submissions.items():
-                self._logger.info(f"  {week}주차 제출자: {list(authors)}")
+                self._add_submission(weekly_submissions, post)
             
+            self._log_submission_summary(weekly_submissions)
             return weekly_submissions
             
         except Exception as e:
             raise ParsingError(f"주차별 제출 정보 추출 중 오류 발생: {str(e)}")
     
+    async def extract_weekly_submissions_from_stream(
+        self,
+        posts: AsyncIterable[NaverPost]
+    ) -> Tuple[Dict[int, Set[str]], int]:
+        """게시글 스트림을 소비하며 챌린지 게시글의 주차별 제출자를 누적하고 (제출 정보, 게시글 수) 반환.
+        
+        게시글 객체는 처리 직후 버리므로 메모리는 페이지 수가 아니라 제출자 수에 비례한다.
+        크롤링 오류는 그대로 전달한다.
+        """
+        weekly_submissions: Dict[int, Set[str]] = {}
+        total_posts = 0
+        challenge_posts = 0
+        
+        async for post in posts:
+            total_posts += 1
+            try:
+                if not self._is_challenge_post(post):
+                    continue
+                challenge_posts += 1
+                self._add_submission(weekly_submissions, post)
+            except Exception as e:
+                raise ParsingError(f"주차별 제출 정보 추출 중 오류 발생: {str(e)}")
+        
+        self._logger.info(
+            f"챌린지 게시글 필터링 완료: "
+            f"전체 {total_posts}개 중 {challenge_posts}개 추출"
+        )
+        self._log_submission_summary(weekly_submissions)
+        return weekly_submissions, total_posts
+    
+    def _add_submission(self, weekly_submissions: Dict[int, Set[str]], post: NaverPost) -> None:
+        """게시글의 주차와 작성자를 주차별 제출 정보에 추가 (주차가 없으면 무시)."""
+        week_number = self._extract_week_from_post(post)
+        if not week_number:
+            return
+        
+        author = self._normalize_author_name(post.author)
+        weekly_submissions.setdefault(week_number, set()).add(author)
+        self._logger.debug(f"주차별 제출 추가: {author} -> {week_number}주차")
+    
+    def _log_submission_summary(self, weekly_submissions: Dict[int, Set[str]]) -> None:
+        """주차별 제출 정보 추출 결과 로깅."""
+        total_submissions = sum(len(authors) for authors in weekly_submissions.values())
+        self._logger.info(
+            f"주차별 제출 정보 추출 완료: "
+            f"{len(weekly_submissions)}개 주차, 총 {total_submissions}건"
+        )
+        
+        # 디버깅을 위해 실제 데이터 출력
+        for week, authors in weekly_submissions.items():
+            self._logger.info(f"  {week}주차 제출자: {list(authors)}")
+    
     @log_execution_time
     def filter_challenge_posts(self, posts: List[NaverPost]) -> List[NaverPost]:
         """챌린지 관련 게시글만 필터링."""
@@ -101,11 +135,8 @@ class DataParsingService:
     
     def _normalize_author_name(self, author: str) -> str:
         """작성자 이름을 정규화 (공백 제거, 특수문자 처리 등)."""
-        # 기본적인 정규화: 공백 제거, 소괄호 내용 제거
-        normalized = author.strip()
-        normalized = re.sub(r'\([^)]*\)', '', normalized).strip()
-        
-        return normalized
+        # 기본적인 정규화: 공백 제거, 소괄호 내용 제거 (시트 인덱스와 같은 규칙)
+        return normalize_participant_name(author)
     
     @log_execution_time
     def generate_attendance_report(
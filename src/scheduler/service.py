@@ -247,6 +247,13 @@ QOK6 자동화 시스템
             if 'updated_cells' in results:
                 summary_parts.append(f"업데이트한 셀: {results['updated_cells']}개")
             
+            if 'sheet_writes' in results:
+                writes = results['sheet_writes']
+                summary_parts.append(
+                    f"시트 쓰기: 계획 {writes['planned']}개, 변경 없음 {writes['unchanged']}개, "
+                    f"쓰기 {writes['written']}개"
+                )
+            
             if 'participants' in results:
                 summary_parts.append(f"참여자 수: {len(results['participants'])}명")
             
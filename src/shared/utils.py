@@ -113,4 +113,10 @@ def extract_name_from_title(title: str) -> Optional[str]:
     if match:
         return match.group(1).strip()
         
-    return None
\ No newline at end of file
+    return None
+
+
+def normalize_participant_name(name: str) -> str:
+    """참여자/작성자 이름 정규화 (앞뒤 공백과 소괄호 내용 제거)."""
+    normalized = name.strip()
+    return re.sub(r'\([^)]*\)', '', normalized).strip()
@@ -12,6 +12,7 @@ from pathlib import Path
 
 from ..core.logger import get_logger, LoggerSetup
 from ..main import QOK6AutomationSystem
+from ..naver_crawler.browser_pool import BrowserPool
 from .services import ExecutionLogService
 from ..scheduler.cron_service import CronService
 
@@ -59,13 +60,14 @@ templates = Jinja2Templates(directory=str(current_dir / "templates"))
 automation_system: Optional[QOK6AutomationSystem] = None
 log_service: Optional[ExecutionLogService] = None
 cron_service: Optional[CronService] = None
+browser_pool: Optional[BrowserPool] = None
 logger = get_logger(__name__)
 
 
 @app.on_event("startup")
 async def startup_event():
     """애플리케이션 시작 시 초기화."""
-    global automation_system, log_service, cron_service
+    global automation_system, log_service, cron_service, browser_pool
     
     try:
         # 로깅 설정
@@ -80,6 +82,22 @@ async def startup_event():
         # Cron 서비스 초기화
         cron_service = CronService()
         
+        # 실행마다 브라우저를 새로 띄우지 않도록 브라우저 풀 준비 (실패해도 실행마다 브라우저를 띄워 동작)
+        config = automation_system.config
+        if config.browser_pool and config.crawler_backend != "http":
+            try:
+                browser_pool = BrowserPool(
+                    size=config.browser_pool_size,
+                    session_store=automation_system.session_store,
+                    max_navigations=config.browser_pool_max_navigations,
+                    memory_limit_mb=config.browser_pool_memory_mb
+                )
+                await browser_pool.start()
+                automation_system.set_browser_pool(browser_pool)
+            except Exception as e:
+                browser_pool = None
+                logger.warning(f"브라우저 풀 시작 실패, 실행마다 브라우저를 새로 띄웁니다: {str(e)}")
+        
         logger.info("QOK6 웹 애플리케이션 시작됨")
         
     except Exception as e:
@@ -90,6 +108,18 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     """애플리케이션 종료 시 정리."""
+    global browser_pool
+    
+    if browser_pool:
+        if automation_system:
+            automation_system.set_browser_pool(None)
+        await browser_pool.close()
+        browser_pool = None
+    
+    if automation_system:
+        # 실행 사이에 유지한 시트 API 연결 풀 정리
+        await automation_system.google_sheets.aclose()
+    
     logger.info("QOK6 웹 애플리케이션 종료됨")
 
 
@@ -131,6 +161,7 @@ async def api_root():
             "manual_run": "/run",
             "logs": "/logs",
             "status": "/status",
+            "selectors": "/selectors",
             "dashboard": "/"
         }
     }
@@ -262,7 +293,8 @@ async def get_status():
             "system_initialized": True,
             "recent_executions": len(recent_logs),
             "success_rate": f"{success_rate:.1f}%",
-            "last_execution": recent_logs[0] if recent_logs else None
+            "last_execution": recent_logs[0] if recent_logs else None,
+            "browser_pool": browser_pool.get_stats() if browser_pool else None
         }
         
     except Exception as e:
@@ -270,6 +302,15 @@ async def get_status():
         return {"status": "error", "message": f"상태 조회 실패: {str(e)}"}
 
 
+@app.get("/selectors")
+async def get_selector_profile():
+    """카페/필드별 선택자 프로필과 적중률 조회."""
+    if not automation_system:
+        raise HTTPException(status_code=500, detail="시스템이 초기화되지 않았습니다")
+    
+    return {"profile": automation_system.naver_crawler.get_selector_profile()}
+
+
 @app.get("/schedule")
 async def get_schedule_status():
     """Cron 스케줄 상태 조회."""
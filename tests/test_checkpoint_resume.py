@@ -0,0 +1,125 @@
+"""체크포인트 이어받기 테스트 - 가져오지 못한 목록 페이지가 완료로 기록되지 않고 다음 실행에서 다시 수집되는지 확인."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Set
+
+import pytest
+
+pytest.importorskip("playwright")
+
+from src.core.exceptions import CrawlingError
+from src.naver_crawler.checkpoint import CrawlCheckpointStore
+from src.naver_crawler.crawl_state import CrawlStateStore
+from src.naver_crawler.models import NaverPost
+from src.naver_crawler.service import NaverCrawlerService
+
+
+CAFE_URL = "https://cafe.naver.com/testcafe"
+BOARD_ID = "180"
+PAGES = 4
+POSTS_PER_PAGE = 3
+
+
+def _page_posts(page_num: int) -> List[NaverPost]:
+    """최신순 게시판의 page_num페이지 게시글 (본문 수집이 필요 없도록 링크 없이 생성)."""
+    first_id = 1000 - (page_num - 1) * POSTS_PER_PAGE
+    return [
+        NaverPost(
+            title=f"[{page_num}주차] 챌린지 인증",
+            author=f"참여자{post_id}",
+            content="",
+            post_id=str(post_id),
+            created_at=datetime(2024, 1, 20) - timedelta(days=page_num)
+        )
+        for post_id in range(first_id, first_id - POSTS_PER_PAGE, -1)
+    ]
+
+
+def _make_crawler(
+    store: Optional[CrawlCheckpointStore],
+    requested: List[int],
+    failing: Set[int],
+    crawl_state: Optional[CrawlStateStore] = None
+) -> NaverCrawlerService:
+    """목록 페이지 수집을 가짜 함수로 바꾼 크롤러 생성 (failing의 페이지는 이동 시간 초과로 실패)."""
+    crawler = NaverCrawlerService(
+        "user", "password", list_concurrency=2, checkpoints=store, crawl_state=crawl_state
+    )
+    crawler._page = object()
+
+    @asynccontextmanager
+    async def list_page_fetcher(
+        cafe_url: str, board_id: str, worker_count: int
+    ) -> AsyncIterator[Callable[[int], Awaitable[List[NaverPost]]]]:
+        async def fetch_page(page_num: int) -> List[NaverPost]:
+            requested.append(page_num)
+            if page_num in failing:
+                raise TimeoutError(f"페이지 {page_num} 이동 시간 초과")
+            return _page_posts(page_num)
+
+        yield fetch_page
+
+    crawler._list_page_fetcher = list_page_fetcher
+    return crawler
+
+
+async def _crawl(crawler: NaverCrawlerService) -> Dict[str, NaverPost]:
+    """게시판을 끝까지 스트리밍 크롤링하고 게시글을 ID별로 반환."""
+    return {post.post_id: post async for post in crawler.stream_cafe_posts(CAFE_URL, BOARD_ID, pages=PAGES)}
+
+
+def test_failed_list_page_is_retried_on_resume(tmp_path) -> None:
+    """3페이지 수집이 실패하면 체크포인트가 남고, 이어받은 실행은 3페이지만 다시 가져옴."""
+    store = CrawlCheckpointStore(checkpoint_dir=str(tmp_path))
+
+    first_requests: List[int] = []
+    first = _make_crawler(store, first_requests, failing={3})
+    first_posts = asyncio.run(_crawl(first))
+    # 시트 반영이 끝난 것처럼 상태를 저장해도 실패한 페이지가 있는 체크포인트는 지우지 않음
+    first.save_crawl_state()
+
+    assert sorted(first_requests) == [1, 2, 3, 4]
+    assert not set(first_posts) & {post.post_id for post in _page_posts(3)}
+    assert first.get_crawl_stats()['list_failures'] == [3]
+    assert list(tmp_path.glob("*.jsonl"))
+
+    second_requests: List[int] = []
+    second = _make_crawler(store, second_requests, failing=set())
+    second_posts = asyncio.run(_crawl(second))
+    second.save_crawl_state()
+
+    assert second_requests == [3]
+    expected_ids = {post.post_id for page_num in range(1, PAGES + 1) for post in _page_posts(page_num)}
+    assert set(second_posts) == expected_ids
+    assert 'list_failures' not in second.get_crawl_stats()
+    assert not list(tmp_path.glob("*.jsonl"))
+
+
+def test_failed_list_page_keeps_high_water_mark(tmp_path) -> None:
+    """목록 페이지가 실패한 실행은 최고 수위를 올리지 않아 그 페이지의 게시글이 증분 실행에서 빠지지 않음."""
+    crawl_state = CrawlStateStore(str(tmp_path / "crawl_state.json"))
+    crawler = _make_crawler(None, [], failing={3}, crawl_state=crawl_state)
+    asyncio.run(_crawl(crawler))
+    crawler.save_crawl_state()
+
+    assert crawl_state.get_high_water_mark(CAFE_URL, BOARD_ID) is None
+
+    crawler = _make_crawler(None, [], failing=set(), crawl_state=crawl_state)
+    asyncio.run(_crawl(crawler))
+    crawler.save_crawl_state()
+
+    assert crawl_state.get_high_water_mark(CAFE_URL, BOARD_ID) == 1000
+
+
+def test_board_page_navigation_error_is_not_an_empty_page() -> None:
+    """목록 페이지 이동이 실패하면 빈 목록 대신 CrawlingError를 올려 실패한 페이지로 처리되게 함."""
+    crawler = NaverCrawlerService("user", "password")
+
+    async def navigate(page: object, url: str, stage: str) -> None:
+        raise TimeoutError("이동 시간 초과")
+
+    crawler._waiter.navigate = navigate
+    with pytest.raises(CrawlingError):
+        asyncio.run(crawler._crawl_single_page(CAFE_URL, BOARD_ID, 3, page=object()))
@@ -0,0 +1,176 @@
+"""게시판/게시글 추출 테스트 - 저장된 HTML을 스텁 서버로 제공하고 HTML 파서 경로와 브라우저 스크립트 경로를 비교."""
+
+import asyncio
+import re
+import threading
+import urllib.request
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Iterator
+
+import pytest
+
+pytest.importorskip("bs4")
+pytest.importorskip("lxml")
+pytest.importorskip("playwright")
+
+from src.naver_crawler.extraction import (
+    AUTHOR_SELECTORS,
+    CONTENT_SELECTORS,
+    build_selector_chains,
+    extract_board_rows,
+    extract_board_rows_from_html,
+    extract_content_from_html,
+    parse_html
+)
+
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    """요청 로그를 출력하지 않는 정적 파일 핸들러."""
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture(scope="module")
+def stub_server() -> Iterator[str]:
+    """fixtures 디렉터리를 제공하는 로컬 HTTP 서버를 띄우고 기본 주소 반환."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), partial(_QuietHandler, directory=str(FIXTURES_DIR)))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _fetch(url: str) -> bytes:
+    """스텁 서버에서 HTML 원문을 가져옴 (HTTP 백엔드처럼 bytes 그대로 파싱)."""
+    with urllib.request.urlopen(url, timeout=5) as response:
+        return response.read()
+
+
+def _normalize(value: Any) -> Any:
+    """innerText와 get_text의 공백 차이를 없애도록 문자열의 연속 공백을 하나로 정리."""
+    if isinstance(value, str):
+        return re.sub(r'\s+', ' ', value).strip()
+    if isinstance(value, list):
+        return [_normalize(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _normalize(item) for key, item in value.items()}
+    return value
+
+
+async def _extract_with_browser(base_url: str) -> Any:
+    """Playwright로 게시판과 게시글을 열어 브라우저 추출 결과 반환 (행 목록, 본문, 매칭 선택자)."""
+    from playwright.async_api import async_playwright
+
+    async with async_playwright() as playwright:
+        try:
+            browser = await playwright.chromium.launch(headless=True)
+        except Exception as e:
+            pytest.skip(f"Chromium을 실행할 수 없습니다: {e}")
+
+        try:
+            page = await browser.new_page()
+            await page.goto(f"{base_url}/board.html")
+            board = await extract_board_rows(page, build_selector_chains())
+
+            await page.goto(f"{base_url}/article.html")
+            content, matched_selector = "", None
+            for selector in CONTENT_SELECTORS:
+                element = await page.query_selector(selector)
+                if element:
+                    content = await element.inner_text()
+                    if content.strip():
+                        matched_selector = selector
+                        break
+        finally:
+            await browser.close()
+
+    return board, content.strip(), matched_selector
+
+
+def test_html_extractor_reads_board_rows(stub_server: str) -> None:
+    """HTML 파서 경로가 게시판 행의 번호, 제목, 작성자, 작성일, 링크를 추출하는지 확인."""
+    board = extract_board_rows_from_html(parse_html(_fetch(f"{stub_server}/board.html")))
+
+    assert board['has_board']
+    assert board['list_selector'] == ".article-board tbody tr"
+    assert len(board['rows']) == 4
+
+    row = board['rows'][1]
+    assert row['post_id_texts'][0] == "10342"
+    assert row['title'] == "[3주차] 챌린지 인증합니다"
+    assert row['author'] == "김하늘"
+    assert row['date_text'] == "14:32"
+    assert row['article_href'].endswith("articleid=10342")
+    assert row['matched'] == {'title': "a.article", 'author': "td:nth-child(3) a", 'date': "td:nth-child(4)"}
+
+    # 작성자 링크가 없는 행은 체인의 다음 선택자로 매칭
+    assert board['rows'][3]['matched']['author'] == "td:nth-child(3)"
+    assert board['rows'][3]['author'] == "이산"
+
+
+def test_html_extractor_reads_article_content(stub_server: str) -> None:
+    """HTML 파서 경로가 스마트에디터 본문을 추출하는지 확인."""
+    content, selector = extract_content_from_html(parse_html(_fetch(f"{stub_server}/article.html")))
+
+    assert selector == ".se-main-container"
+    assert "3주차 챌린지 인증합니다." in content
+    assert _normalize(content).endswith("다음 주에도 꾸준히 하겠습니다!")
+
+
+def test_browser_and_html_extractors_agree(stub_server: str) -> None:
+    """같은 HTML에서 브라우저 스크립트와 HTML 파서가 같은 행과 본문을 추출하는지 비교."""
+    board_html = extract_board_rows_from_html(parse_html(_fetch(f"{stub_server}/board.html")))
+    content_html, selector_html = extract_content_from_html(parse_html(_fetch(f"{stub_server}/article.html")))
+
+    board_browser, content_browser, selector_browser = asyncio.run(_extract_with_browser(stub_server))
+
+    assert board_browser['list_selector'] == board_html['list_selector']
+    assert _normalize(board_browser['rows']) == _normalize(board_html['rows'])
+    assert selector_browser == selector_html
+    assert _normalize(content_browser) == _normalize(content_html)
+
+
+def test_selector_profile_keeps_chain_order(stub_server: str, tmp_path: Path) -> None:
+    """더 일반적인 선택자가 가장 많이 맞았어도 체인 순서를 유지해 링크가 있는 행은 여전히 링크 선택자로 추출."""
+    pytest.importorskip("httpx")
+    from src.naver_crawler.http_backend import NaverHttpCrawlerService
+    from src.naver_crawler.selector_profile import SelectorProfileStore
+    from src.naver_crawler.session import SessionStateStore
+
+    profile = SelectorProfileStore(str(tmp_path / "selector_profile.json"))
+    for _ in range(10):
+        profile.record(stub_server, 'author', "td:nth-child(3)", AUTHOR_SELECTORS)
+
+    crawler = NaverHttpCrawlerService(
+        "user", "password",
+        selector_profile=profile,
+        session_store=SessionStateStore(str(tmp_path / "naver_cookies.json"))
+    )
+
+    async def fetch_board() -> Any:
+        await crawler.initialize_browser()
+        try:
+            crawler._profile_cafe_url = stub_server
+            return await crawler._fetch_board_page(stub_server, "board.html", 1, stub_server)
+        finally:
+            await crawler.close()
+
+    posts = asyncio.run(fetch_board())
+
+    assert [post.author for post in posts] == ["김하늘", "박 바다", "이산"]
+    author = profile.get_profile()[stub_server]['author']
+    assert author['winner'] == "td:nth-child(3)"
+    # 공지 포함 링크가 있는 세 행은 체인 첫 선택자, 링크가 없는 행만 다음 선택자로 매칭
+    assert author['hits'] == {"td:nth-child(3)": 11, "td:nth-child(3) a": 3}
+    assert crawler.get_crawl_stats()['selectors']['author'] == {
+        'lookups': 4, 'first_try_hits': 3, 'misses': 0, 'first_try_hit_rate': 0.75
+    }
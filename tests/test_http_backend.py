@@ -0,0 +1,243 @@
+"""HTTP 크롤러 테스트 - 스텁 서버의 게시판을 수집하며 페이지 이동, 서버 오류, Playwright 전환을 확인."""
+
+import asyncio
+import threading
+import urllib.request
+from contextlib import asynccontextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, List, Set
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+pytest.importorskip("httpx")
+pytest.importorskip("bs4")
+pytest.importorskip("lxml")
+pytest.importorskip("playwright")
+
+from src.naver_crawler.extraction import extract_board_rows_from_html, extract_content_from_html, parse_html
+from src.naver_crawler.http_backend import NaverHttpCrawlerService
+from src.naver_crawler.models import NaverPost
+from src.naver_crawler.session import SessionStateStore
+
+
+BOARD_ID = "180"
+PAGES = 3
+POSTS_PER_PAGE = 3
+
+
+def _page_post_ids(page_num: int) -> List[int]:
+    """최신순 게시판의 page_num페이지에 있는 게시글 ID."""
+    first_id = 1000 - (page_num - 1) * POSTS_PER_PAGE
+    return list(range(first_id, first_id - POSTS_PER_PAGE, -1))
+
+
+def _post_title(post_id: int) -> str:
+    """게시글 제목 (1000번 글은 제목에 주차가 없어 본문을 가져와야 함)."""
+    return "챌린지 인증합니다" if post_id == 1000 else f"[{1001 - post_id}주차] 챌린지 인증"
+
+
+def _board_html(page_num: int) -> str:
+    """카페 게시판 목록 페이지 HTML."""
+    rows = "".join(
+        f"""
+      <tr>
+        <td class="td_num">{post_id}</td>
+        <td class="td_article"><a class="article" href="/ArticleRead.nhn?clubid=123&amp;articleid={post_id}">{_post_title(post_id)}</a></td>
+        <td class="td_name"><span class="p-nick"><a href="#">참여자{post_id}</a></span></td>
+        <td class="td_date">2024.01.15.</td>
+        <td class="td_view">7</td>
+      </tr>"""
+        for post_id in _page_post_ids(page_num)
+    )
+    return f"""<!DOCTYPE html>
+<html lang="ko"><head><meta charset="utf-8"></head>
+<body><div class="article-board"><table><tbody>{rows}
+</tbody></table></div></body></html>"""
+
+
+def _article_html(post_id: str) -> str:
+    """게시글 상세 페이지 HTML."""
+    return f"""<!DOCTYPE html>
+<html lang="ko"><head><meta charset="utf-8"></head>
+<body><div class="se-main-container"><p>3주차 인증합니다. 게시글 {post_id}</p></div></body></html>"""
+
+
+# 스크립트로 목록을 그리는 페이지처럼 HTML에는 게시판 구조가 없는 응답
+UNRENDERED_HTML = '<!DOCTYPE html><html><body><div id="app"></div></body></html>'
+
+
+class _BoardHandler(BaseHTTPRequestHandler):
+    """게시판 목록과 게시글을 제공하는 스텁 카페 핸들러 (서버 설정에 따라 5xx나 구조 없는 페이지 응답)."""
+
+    def do_GET(self) -> None:
+        parsed = urlparse(self.path)
+        query = parse_qs(parsed.query)
+        status, body = 404, "not found"
+
+        if parsed.path == f"/testcafe/{BOARD_ID}":
+            page_num = int(query['page'][0])
+            if 'rendered' not in query:
+                self.server.board_requests.append(page_num)
+            if page_num in self.server.failing_pages:
+                status, body = 503, "temporarily unavailable"
+            elif page_num in self.server.unrendered_pages and 'rendered' not in query:
+                status, body = 200, UNRENDERED_HTML
+            else:
+                status, body = 200, _board_html(page_num)
+        elif parsed.path == "/ArticleRead.nhn":
+            status, body = 200, _article_html(query['articleid'][0])
+
+        payload = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def stub_cafe() -> Iterator[ThreadingHTTPServer]:
+    """스텁 카페 서버를 띄우고 서버 객체 반환 (failing_pages, unrendered_pages로 응답 조정)."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _BoardHandler)
+    server.board_requests = []
+    server.failing_pages = set()
+    server.unrendered_pages = set()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _cafe_url(server: ThreadingHTTPServer) -> str:
+    """스텁 서버의 카페 주소."""
+    return f"http://127.0.0.1:{server.server_address[1]}/testcafe"
+
+
+def _fetch(url: str) -> bytes:
+    """스텁 서버에서 HTML 원문을 가져옴."""
+    with urllib.request.urlopen(url, timeout=5) as response:
+        return response.read()
+
+
+class _FakeBrowserCrawler(NaverHttpCrawlerService):
+    """Playwright 폴백만 스크립트가 그린 목록을 읽는 가짜 브라우저로 바꾼 HTTP 크롤러."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.browser_pages: List[int] = []
+
+    async def _ensure_browser(self, max_retries: int = 3) -> None:
+        self._page = object()
+        self._browser_ready = True
+
+    @asynccontextmanager
+    async def _list_page_fetcher(
+        self,
+        cafe_url: str,
+        board_id: str,
+        worker_count: int
+    ) -> AsyncIterator[Callable[[int], Awaitable[List[NaverPost]]]]:
+        if not self._use_browser:
+            async with super()._list_page_fetcher(cafe_url, board_id, worker_count) as fetch_page:
+                yield fetch_page
+            return
+
+        async def fetch_page(page_num: int) -> List[NaverPost]:
+            self.browser_pages.append(page_num)
+            html = await asyncio.to_thread(_fetch, f"{cafe_url}/{board_id}?page={page_num}&rendered=1")
+            extracted = extract_board_rows_from_html(parse_html(html))
+            posts = [self._build_post_from_row(row, idx, self._origin_of(cafe_url)) for idx, row in enumerate(extracted['rows'])]
+            return [post for post in posts if post]
+
+        yield fetch_page
+
+    async def _fetch_contents(self, targets: List[NaverPost]) -> None:
+        if not self._use_browser:
+            await super()._fetch_contents(targets)
+            return
+
+        for post in targets:
+            html = await asyncio.to_thread(_fetch, post.post_url)
+            post.content, _ = extract_content_from_html(parse_html(html))
+
+
+async def _crawl(crawler: NaverHttpCrawlerService, cafe_url: str) -> List[NaverPost]:
+    """HTTP 클라이언트를 준비하고 게시판을 끝까지 크롤링한 뒤 정리."""
+    await crawler.initialize_browser()
+    try:
+        return await crawler.crawl_cafe_posts(cafe_url, BOARD_ID, pages=PAGES)
+    finally:
+        await crawler.close()
+
+
+def _make_crawler(tmp_path: Any, list_concurrency: int = 2) -> _FakeBrowserCrawler:
+    """임시 세션 저장소를 쓰는 HTTP 크롤러 생성."""
+    return _FakeBrowserCrawler(
+        "user", "password",
+        list_concurrency=list_concurrency,
+        session_store=SessionStateStore(str(tmp_path / "naver_cookies.json"))
+    )
+
+
+def _expected_ids(pages: Set[int]) -> List[str]:
+    """지정한 페이지들의 게시글 ID."""
+    return sorted(str(post_id) for page_num in pages for post_id in _page_post_ids(page_num))
+
+
+def test_http_crawl_reads_every_page(stub_cafe: ThreadingHTTPServer, tmp_path: Any) -> None:
+    """모든 목록 페이지를 한 번씩 가져오고, 제목에 주차가 없는 게시글은 HTTP로 본문을 채움."""
+    crawler = _make_crawler(tmp_path)
+    posts = asyncio.run(_crawl(crawler, _cafe_url(stub_cafe)))
+
+    assert sorted(post.post_id for post in posts) == _expected_ids({1, 2, 3})
+    assert sorted(stub_cafe.board_requests) == [1, 2, 3]
+    assert crawler.browser_pages == []
+
+    contents = {post.post_id: post.content for post in posts}
+    assert "게시글 1000" in contents['1000']
+    assert contents['999'] == ""
+    assert 'list_failures' not in crawler.get_crawl_stats()
+
+
+def test_http_crawl_skips_page_with_server_error(stub_cafe: ThreadingHTTPServer, tmp_path: Any) -> None:
+    """한 페이지가 5xx로 실패하면 그 페이지만 실패로 기록하고 나머지 페이지의 게시글은 수집."""
+    stub_cafe.failing_pages = {2}
+    crawler = _make_crawler(tmp_path)
+    posts = asyncio.run(_crawl(crawler, _cafe_url(stub_cafe)))
+
+    assert sorted(post.post_id for post in posts) == _expected_ids({1, 3})
+    assert crawler.get_crawl_stats()['list_failures'] == [2]
+    assert crawler.browser_pages == []
+
+
+def test_structure_error_falls_back_without_duplicates(stub_cafe: ThreadingHTTPServer, tmp_path: Any) -> None:
+    """2페이지에서 게시판 구조를 찾지 못하면 Playwright로 전환하고, 이미 내보낸 게시글은 다시 내보내지 않음."""
+    stub_cafe.unrendered_pages = {2}
+    # 1페이지 게시글이 전환 전에 먼저 나가도록 한 페이지씩 수집
+    crawler = _make_crawler(tmp_path, list_concurrency=1)
+
+    yielded: List[str] = []
+
+    async def stream() -> None:
+        await crawler.initialize_browser()
+        try:
+            async for post in crawler.stream_cafe_posts(_cafe_url(stub_cafe), BOARD_ID, pages=PAGES):
+                yielded.append(post.post_id)
+        finally:
+            await crawler.close()
+
+    asyncio.run(stream())
+
+    assert stub_cafe.board_requests == [1, 2]
+    assert crawler.browser_pages == [1, 2, 3]
+    assert len(yielded) == len(set(yielded))
+    assert sorted(yielded) == _expected_ids({1, 2, 3})
+    # 본문이 필요 없는 1페이지 게시글은 HTTP 단계에서 이미 나감
+    assert yielded[:2] == ["999", "998"]
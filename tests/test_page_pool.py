@@ -0,0 +1,115 @@
+"""페이지 풀 테스트 - 메모리 기준 교체가 반환된 페이지 자신의 힙으로 판단되고 반복되지 않는지 확인."""
+
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+
+pytest.importorskip("playwright")
+
+from src.naver_crawler.memory import MemoryMonitor
+from src.naver_crawler.page_pool import PagePool, PageRecycleStats
+
+
+MB = 1024 * 1024
+
+
+class _FakeSession:
+    """Runtime.getHeapUsage에 페이지의 힙 크기를 돌려주는 CDP 세션."""
+
+    def __init__(self, page: "_FakePage") -> None:
+        self._page = page
+
+    async def send(self, method: str) -> Dict[str, Any]:
+        assert method == "Runtime.getHeapUsage"
+        self._page.context.heap_reads.append(self._page.number)
+        return {'usedSize': self._page.heap_bytes, 'totalSize': self._page.heap_bytes}
+
+    async def detach(self) -> None:
+        pass
+
+
+class _FakePage:
+    """힙 크기를 정할 수 있는 페이지."""
+
+    def __init__(self, context: "_FakeContext", number: int) -> None:
+        self.context = context
+        self.number = number
+        self.heap_bytes = 10 * MB
+        self._closed = False
+
+    def is_closed(self) -> bool:
+        return self._closed
+
+    async def close(self) -> None:
+        self._closed = True
+
+
+class _FakeContext:
+    """새 페이지에 번호를 붙여 주는 브라우저 컨텍스트."""
+
+    def __init__(self) -> None:
+        self.pages: List[_FakePage] = []
+        self.heap_reads: List[int] = []
+
+    async def new_page(self) -> _FakePage:
+        page = _FakePage(self, len(self.pages) + 1)
+        self.pages.append(page)
+        return page
+
+    async def new_cdp_session(self, page: _FakePage) -> _FakeSession:
+        return _FakeSession(page)
+
+
+async def _use_pool(pool: PagePool, times: int, heavy_page: int, heavy_bytes: int) -> List[int]:
+    """풀에서 페이지를 times번 빌렸다 반환하고 빌린 페이지 번호 목록 반환 (heavy_page번 페이지는 힙이 큼)."""
+    borrowed = []
+    for _ in range(times):
+        async with pool.acquire() as page:
+            borrowed.append(page.number)
+            if page.number == heavy_page:
+                page.heap_bytes = heavy_bytes
+    return borrowed
+
+
+def test_only_the_heavy_page_is_recycled_once() -> None:
+    """기준을 넘은 페이지만 한 번 교체되고, 교체된 새 페이지와 다른 페이지는 그대로 재사용."""
+    context = _FakeContext()
+    stats = PageRecycleStats()
+    monitor = MemoryMonitor(limit_mb=100, page_check_interval_seconds=0)
+    pool = PagePool(context, 2, memory_monitor=monitor, recycle_stats=stats)
+
+    async def run() -> List[int]:
+        await pool.open()
+        try:
+            return await _use_pool(pool, 8, heavy_page=1, heavy_bytes=300 * MB)
+        finally:
+            await pool.close()
+
+    borrowed = asyncio.run(run())
+
+    assert stats.recycled_pages == 1
+    assert stats.recycled_for_memory == 1
+    assert len(context.pages) == 3 and context.pages[0].is_closed()
+    assert set(borrowed) == {1, 2, 3}
+    assert monitor.stats.over_limit_samples == 1
+    assert monitor.stats.peak_page_bytes == 300 * MB
+
+
+def test_page_memory_is_checked_at_most_once_per_interval() -> None:
+    """측정 간격 안에서는 같은 페이지의 힙을 다시 읽지 않음."""
+    context = _FakeContext()
+    monitor = MemoryMonitor(limit_mb=100, page_check_interval_seconds=60)
+    pool = PagePool(context, 1, memory_monitor=monitor)
+
+    async def run() -> None:
+        await pool.open()
+        try:
+            await _use_pool(pool, 5, heavy_page=0, heavy_bytes=0)
+        finally:
+            await pool.close()
+
+    asyncio.run(run())
+
+    assert context.heap_reads == [1]
+    assert monitor.stats.page_samples == 1
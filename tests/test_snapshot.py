@@ -0,0 +1,113 @@
+"""페이지 스냅샷 테스트 - 스크립트로 목록을 그리는 로컬 페이지를 기록한 뒤 서버 없이 재생되는지 확인."""
+
+import asyncio
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+
+pytest.importorskip("playwright")
+
+from src.naver_crawler.resource_blocker import ResourceBlocker, ResourceBlockProfile
+from src.naver_crawler.snapshot import PageSnapshot
+
+
+PAGE_HTML = """<!DOCTYPE html>
+<html lang="ko">
+<head><meta charset="utf-8"><link rel="icon" href="data:,"><title>챌린지 인증 게시판</title></head>
+<body>
+<table class="article-board"><tbody></tbody></table>
+<img src="banner.png">
+<script src="board.js"></script>
+</body>
+</html>
+"""
+
+BOARD_JS = """
+fetch("rows.json")
+  .then(response => response.json())
+  .then(rows => {
+    const body = document.querySelector(".article-board tbody");
+    for (const row of rows) {
+      const tr = document.createElement("tr");
+      tr.innerHTML = `<td class="td_num">${row.id}</td><td class="td_article">${row.title}</td>`;
+      body.appendChild(tr);
+    }
+    document.body.dataset.rendered = "true";
+  });
+"""
+
+ROWS_JSON = '[{"id": 10342, "title": "[3주차] 챌린지 인증합니다"}, {"id": 10341, "title": "3주차 인증"}]'
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    """요청 로그를 출력하지 않는 정적 파일 핸들러."""
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+def _write_site(site_dir: Path) -> None:
+    """스크립트가 JSON을 받아 게시판 행을 그리는 정적 페이지 작성."""
+    site_dir.mkdir()
+    (site_dir / "board.html").write_text(PAGE_HTML, encoding="utf-8")
+    (site_dir / "board.js").write_text(BOARD_JS, encoding="utf-8")
+    (site_dir / "rows.json").write_text(ROWS_JSON, encoding="utf-8")
+    (site_dir / "banner.png").write_bytes(b"\x89PNG\r\n\x1a\n")
+
+
+async def _render_rows(url: str, snapshot: PageSnapshot) -> List[str]:
+    """스냅샷과 이미지 차단을 설치한 컨텍스트로 페이지를 열고 스크립트가 그린 행 반환."""
+    from playwright.async_api import async_playwright
+
+    async with async_playwright() as playwright:
+        try:
+            browser = await playwright.chromium.launch(headless=True)
+        except Exception as e:
+            pytest.skip(f"Chromium을 실행할 수 없습니다: {e}")
+
+        try:
+            context = await browser.new_context()
+            # 크롤러와 같은 순서로 등록 (나중에 등록한 차단 핸들러가 먼저 실행)
+            await snapshot.install(context)
+            await ResourceBlocker(ResourceBlockProfile(blocked_resource_types=("image",))).install(context)
+
+            page = await context.new_page()
+            await page.goto(url)
+            await page.wait_for_selector("body[data-rendered='true']", timeout=5000)
+            return await page.eval_on_selector_all(".article-board tbody tr", "rows => rows.map(row => row.innerText)")
+        finally:
+            await browser.close()
+
+
+def test_recorded_scripts_render_page_on_replay(tmp_path: Path) -> None:
+    """기록한 문서, 스크립트, API 응답만으로 서버가 내려간 뒤에도 같은 행이 그려지는지 확인."""
+    site_dir = tmp_path / "site"
+    _write_site(site_dir)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), partial(_QuietHandler, directory=str(site_dir)))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/board.html"
+
+    try:
+        recorder = PageSnapshot("board", "record", root_dir=str(tmp_path / "snapshots"))
+        recorded_rows = asyncio.run(_render_rows(url, recorder))
+        recorder.save()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    # 문서, 스크립트, JSON 세 개만 기록되고 차단된 이미지는 기록되지 않음
+    assert recorder.stats.recorded == 3
+    assert len(recorded_rows) == 2
+
+    replayer = PageSnapshot("board", "replay", root_dir=str(tmp_path / "snapshots"))
+    replayed_rows = asyncio.run(_render_rows(url, replayer))
+
+    assert replayed_rows == recorded_rows
+    assert replayer.stats.served == 3
+    assert replayer.stats.missed == 0